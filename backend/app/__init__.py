@@ -12,6 +12,8 @@ def create_app():
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     default_upload_dir = os.path.join(base_dir, "instance", "uploads")
     default_database_path = os.path.join(base_dir, "instance", "app.db")
+    default_llm_cache_path = os.path.join(base_dir, "instance", "llm_cache.db")
+    default_job_details_cache_path = os.path.join(base_dir, "instance", "job_details_cache.db")
 
     # Fail loudly if a real secret has not been set in production
     _jwt_secret = os.environ.get("JWT_SECRET_KEY") or os.environ.get("SECRET_KEY")
@@ -39,6 +41,59 @@ def create_app():
         # JWT expiry config
         JWT_ACCESS_TOKEN_EXPIRES=timedelta(minutes=30),
         JWT_REFRESH_TOKEN_EXPIRES=timedelta(days=7),
+        # Gemini model discovery is cached process-wide (see services/ai_client.py)
+        AI_MODEL_DISCOVERY_TTL_SECONDS=int(os.environ.get("AI_MODEL_DISCOVERY_TTL_SECONDS", 60 * 60)),
+        AI_MODEL_DISCOVERY_RETRY_SECONDS=int(os.environ.get("AI_MODEL_DISCOVERY_RETRY_SECONDS", 60)),
+        AI_WARM_ON_START=os.environ.get("AI_WARM_ON_START", "true").lower() == "true",
+        # /health/metrics exposes pool, cache and model internals, so it is off unless enabled
+        HEALTH_METRICS_ENABLED=os.environ.get("HEALTH_METRICS_ENABLED", "false").lower() == "true",
+        # Per-worker SQLite connection pool and the PRAGMAs applied to each pooled connection (see db.py)
+        DB_POOL_ENABLED=os.environ.get("DB_POOL_ENABLED", "true").lower() == "true",
+        DB_POOL_MAX_IDLE=int(os.environ.get("DB_POOL_MAX_IDLE", 8)),
+        DB_BUSY_TIMEOUT_MS=int(os.environ.get("DB_BUSY_TIMEOUT_MS", 5000)),
+        DB_MMAP_SIZE=int(os.environ.get("DB_MMAP_SIZE", 64 * 1024 * 1024)),
+        DB_CACHED_STATEMENTS=int(os.environ.get("DB_CACHED_STATEMENTS", 256)),
+        # Foreign keys stay off by default: legacy databases may hold orphan rows that would start failing
+        DB_FOREIGN_KEYS=os.environ.get("DB_FOREIGN_KEYS", "false").lower() == "true",
+        # Content-addressed cache for Gemini responses (see services/llm_cache.py)
+        LLM_CACHE_ENABLED=os.environ.get("LLM_CACHE_ENABLED", "true").lower() == "true",
+        LLM_CACHE_PATH=os.environ.get("LLM_CACHE_PATH", default_llm_cache_path),
+        LLM_CACHE_MAX_ENTRIES=int(os.environ.get("LLM_CACHE_MAX_ENTRIES", 5000)),
+        LLM_CACHE_MAX_AGE_SECONDS=int(os.environ.get("LLM_CACHE_MAX_AGE_SECONDS", 60 * 60 * 24 * 7)),
+        # PDF text extraction budget (see AIHelper._extract_pdf)
+        PDF_MAX_PAGES=int(os.environ.get("PDF_MAX_PAGES", 40)),
+        PDF_MAX_CHARS=int(os.environ.get("PDF_MAX_CHARS", 200_000)),
+        PDF_PARALLEL_PAGE_THRESHOLD=int(os.environ.get("PDF_PARALLEL_PAGE_THRESHOLD", 32)),
+        PDF_PARALLEL_WORKERS=int(os.environ.get("PDF_PARALLEL_WORKERS", min(4, os.cpu_count() or 1))),
+        # Async resume uploads (POST /api/resume/upload?async=true opts in per request)
+        RESUME_UPLOAD_ASYNC=os.environ.get("RESUME_UPLOAD_ASYNC", "false").lower() == "true",
+        RESUME_JOB_WORKERS=int(os.environ.get("RESUME_JOB_WORKERS", 2)),
+        # Queued/running jobs with no progress for this long were lost to a worker restart and are failed
+        RESUME_JOB_STALE_SECONDS=int(os.environ.get("RESUME_JOB_STALE_SECONDS", 10 * 60)),
+        # Mock interview grading: "serial", "concurrent" (bounded worker pool) or "batch" (one LLM call)
+        INTERVIEW_GRADING_MODE=os.environ.get("INTERVIEW_GRADING_MODE", "concurrent"),
+        INTERVIEW_GRADING_MAX_WORKERS=int(os.environ.get("INTERVIEW_GRADING_MAX_WORKERS", 4)),
+        INTERVIEW_GRADING_TIMEOUT_SECONDS=float(os.environ.get("INTERVIEW_GRADING_TIMEOUT_SECONDS", 20)),
+        # /api/keywords/match scorer: "lightweight" (keywords only) or "hybrid" (sentence-transformers)
+        KEYWORD_MATCH_METHOD=os.environ.get("KEYWORD_MATCH_METHOD", "lightweight"),
+        KEYWORD_MATCH_BATCH_WORKERS=int(os.environ.get("KEYWORD_MATCH_BATCH_WORKERS", 4)),
+        # Sentence-embedding runtime (see services/embeddings.py): torch, torch-int8, onnx or onnx-int8;
+        # 0 threads means os.cpu_count() // WEB_CONCURRENCY so workers do not oversubscribe the CPUs
+        EMBEDDING_BACKEND=os.environ.get("EMBEDDING_BACKEND", "torch"),
+        EMBEDDING_MODEL=os.environ.get("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2"),
+        EMBEDDING_THREADS=int(os.environ.get("EMBEDDING_THREADS", 0)),
+        EMBEDDING_WARM_ON_START=os.environ.get("EMBEDDING_WARM_ON_START", "true").lower() == "true",
+        # New-grad job catalog (see features/keywords/catalog.py); the fixture is a saved README for offline use;
+        # after a failed refresh no worker retries for JOBS_CATALOG_RETRY_SECONDS
+        JOBS_CATALOG_TTL_SECONDS=int(os.environ.get("JOBS_CATALOG_TTL_SECONDS", 60 * 30)),
+        JOBS_CATALOG_RETRY_SECONDS=int(os.environ.get("JOBS_CATALOG_RETRY_SECONDS", 60)),
+        JOBS_CATALOG_FIXTURE=os.environ.get("JOBS_CATALOG_FIXTURE") or None,
+        # Simplify job-details cache and fetch pool (see features/keywords/details.py)
+        JOB_DETAILS_CACHE_PATH=os.environ.get("JOB_DETAILS_CACHE_PATH", default_job_details_cache_path),
+        JOB_DETAILS_CACHE_MAX_ENTRIES=int(os.environ.get("JOB_DETAILS_CACHE_MAX_ENTRIES", 2000)),
+        JOB_DETAILS_CACHE_MAX_AGE_SECONDS=int(os.environ.get("JOB_DETAILS_CACHE_MAX_AGE_SECONDS", 60 * 60 * 6)),
+        JOB_DETAILS_FETCH_WORKERS=int(os.environ.get("JOB_DETAILS_FETCH_WORKERS", 8)),
+        JOB_DETAILS_PER_HOST_LIMIT=int(os.environ.get("JOB_DETAILS_PER_HOST_LIMIT", 4)),
     )
 
     os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
@@ -61,10 +116,60 @@ def create_app():
     jwt.init_app(app)
     limiter.init_app(app)
 
+    from .services.ai_client import model_registry
+    from .services.llm_cache import llm_cache
+    from .services.embeddings import embedding_backend
+    from .features.keywords.service import embedding_cache_stats, job_catalog_index
+    from .features.keywords.api import catalog_store
+    from .features.keywords.details import job_details
+    from .db import pool as db_pool
+    db_pool.configure(max_idle=app.config["DB_POOL_MAX_IDLE"])
+    model_registry.configure(
+        ttl_seconds=app.config["AI_MODEL_DISCOVERY_TTL_SECONDS"],
+        retry_seconds=app.config["AI_MODEL_DISCOVERY_RETRY_SECONDS"],
+    )
+    llm_cache.configure(
+        path=app.config["LLM_CACHE_PATH"],
+        max_entries=app.config["LLM_CACHE_MAX_ENTRIES"],
+        max_age_seconds=app.config["LLM_CACHE_MAX_AGE_SECONDS"],
+        enabled=app.config["LLM_CACHE_ENABLED"],
+    )
+    job_details.configure(
+        path=app.config["JOB_DETAILS_CACHE_PATH"],
+        max_entries=app.config["JOB_DETAILS_CACHE_MAX_ENTRIES"],
+        max_age_seconds=app.config["JOB_DETAILS_CACHE_MAX_AGE_SECONDS"],
+        workers=app.config["JOB_DETAILS_FETCH_WORKERS"],
+        per_host=app.config["JOB_DETAILS_PER_HOST_LIMIT"],
+    )
+    embedding_backend.configure(
+        backend=app.config["EMBEDDING_BACKEND"],
+        model_name=app.config["EMBEDDING_MODEL"],
+        threads=app.config["EMBEDDING_THREADS"],
+    )
+    if app.config["AI_WARM_ON_START"]:
+        model_registry.warm()
+    if app.config["EMBEDDING_WARM_ON_START"]:
+        embedding_backend.warm()
+
     @app.get("/health")
     def health():
         return jsonify({"status": "ok"}), 200
 
+    @app.get("/health/metrics")
+    def health_metrics():
+        if not app.config["HEALTH_METRICS_ENABLED"]:
+            return jsonify({"error": "Not found"}), 404
+        return jsonify({
+            "db_pool": db_pool.stats(),
+            "ai_client": model_registry.stats(),
+            "llm_cache": llm_cache.stats(),
+            "embeddings": embedding_backend.stats(),
+            "resume_embeddings": embedding_cache_stats(),
+            "job_catalog_index": job_catalog_index.stats(),
+            "job_catalog": catalog_store.stats(),
+            "job_details": job_details.stats(),
+        }), 200
+
     # JWT Error Handlers
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
@@ -108,42 +213,21 @@ def create_app():
 
     from .db import init_app as init_db, ensure_db_initialized, get_db
     init_db(app)
+    from .commands import init_app as init_commands
+    init_commands(app)
+    from .migrations import is_current, upgrade as upgrade_schema
+    from .features.resume_jobs.service import fail_interrupted_resume_jobs
     with app.app_context():
-        ensure_db_initialized()
-        # Migration: ensure job_applications table exists for existing databases
-        _db = get_db()
-        _db.execute("""
-            CREATE TABLE IF NOT EXISTS job_applications (
-                id           INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id      INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-                company_name TEXT    NOT NULL,
-                applied_date TEXT    NOT NULL,
-                stage        TEXT    NOT NULL DEFAULT 'applied',
-                field        TEXT    NOT NULL DEFAULT '',
-                created_at   TEXT    NOT NULL DEFAULT (datetime('now'))
-            )
-        """)
-        _interview_cols = {
-            row[1] for row in _db.execute("PRAGMA table_info(interviews)").fetchall()
-        }
-        if "user_id" not in _interview_cols:
-            _db.execute(
-                "ALTER TABLE interviews ADD COLUMN user_id INTEGER REFERENCES users(id)"
-            )
-        if "submitted_at" not in _interview_cols:
-            _db.execute("ALTER TABLE interviews ADD COLUMN submitted_at TEXT")
-        if "average_score" not in _interview_cols:
-            _db.execute("ALTER TABLE interviews ADD COLUMN average_score REAL")
-        if "total_score" not in _interview_cols:
-            _db.execute("ALTER TABLE interviews ADD COLUMN total_score REAL")
-        if "questions_json" not in _interview_cols:
-            _db.execute("ALTER TABLE interviews ADD COLUMN questions_json TEXT")
-        _db.commit()
-        # Migration: add user_id to interviews table if missing
-        interviews_cols = {row[1] for row in _db.execute("PRAGMA table_info(interviews)").fetchall()}
-        if "user_id" not in interviews_cols:
-            _db.execute("ALTER TABLE interviews ADD COLUMN user_id INTEGER")
-            _db.commit()
+        # Up-to-date databases cost one read of schema_version; see migrations/ for the upgrades
+        if not is_current(get_db()):
+            ensure_db_initialized()
+            upgrade_schema(get_db())
+        # Async upload jobs live in this process's executor; any left open by a previous run are lost
+        fail_interrupted_resume_jobs(get_db(), app.config["RESUME_JOB_STALE_SECONDS"])
+
+    # Async resume job status (/api/resume/jobs/<id>)
+    from .features.resume_jobs.api import bp as resume_jobs_bp
+    app.register_blueprint(resume_jobs_bp)
 
     # Dashboard summary routes (/api/v1/dashboard/summary)
     from .features.dashboard_summary.api import bp as dashboard_summary_bp
@@ -0,0 +1,142 @@
+# backend/app/commands.py
+import json
+import os
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .db import get_db
+from .features.resume_jobs.service import evaluation_is_stale, hash_file, store_refreshed_evaluation
+from .services.ai_helper import AIHelper
+
+
+@click.command("backfill-resume-hashes")
+@with_appcontext
+@click.option("--batch-size", default=200, show_default=True, help="Rows hashed per commit.")
+def backfill_resume_hashes_command(batch_size: int):
+    """Compute content_hash for resumes uploaded before deduplication existed."""
+    db = get_db()
+    hashed = missing = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            """
+            SELECT id, file_path FROM resumes
+            WHERE content_hash IS NULL AND id > ?
+            ORDER BY id
+            LIMIT ?
+            """,
+            (last_id, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for row in rows:
+            last_id = row["id"]
+            if row["file_path"] and os.path.exists(row["file_path"]):
+                updates.append((hash_file(row["file_path"]), row["id"]))
+            else:
+                missing += 1
+        db.executemany("UPDATE resumes SET content_hash = ? WHERE id = ?", updates)
+        db.commit()
+        hashed += len(updates)
+
+    click.echo(f"Hashed {hashed} resumes ({missing} skipped, file missing).")
+
+
+@click.command("rescore-resumes")
+@with_appcontext
+@click.option("--batch-size", default=100, show_default=True, help="Resumes checked per commit.")
+@click.option("--start-after", default=0, show_default=True, help="Resume the run after this resume id.")
+def rescore_resumes_command(batch_size: int, start_after: int):
+    """Store current rubric evaluations for resumes whose latest feedback is stale."""
+    db = get_db()
+    ai_helper = AIHelper()
+    rescored = unparsed = 0
+    last_id = start_after
+    while True:
+        rows = db.execute(
+            """
+            SELECT r.id, r.parsed_json, fr.details_json
+            FROM resumes r
+            LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
+            WHERE r.id > ?
+            ORDER BY r.id
+            LIMIT ?
+            """,
+            (last_id, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+
+        for row in rows:
+            last_id = row["id"]
+            details = _load_json(row["details_json"])
+            if not evaluation_is_stale(details):
+                continue
+            parsed = _load_json(row["parsed_json"])
+            if not parsed:
+                unparsed += 1
+                continue
+            store_refreshed_evaluation(db, row["id"], parsed, ai_helper)
+            rescored += 1
+        db.commit()
+        click.echo(f"... checked up to resume id {last_id} ({rescored} rescored)")
+
+    click.echo(f"Rescored {rescored} resumes ({unparsed} skipped, no parsed text).")
+
+
+def _load_json(raw):
+    try:
+        return json.loads(raw or "{}")
+    except json.JSONDecodeError:
+        return {}
+
+
+@click.command("refresh-jobs-catalog")
+@with_appcontext
+@click.option(
+    "--fixture",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Load a saved SimplifyJobs README instead of downloading it.",
+)
+def refresh_jobs_catalog_command(fixture):
+    """Revalidate the stored new-grad job catalog now (or load it from a fixture offline)."""
+    from .features.keywords.api import catalog_store
+
+    result = catalog_store.refresh(
+        get_db(), fixture_path=fixture or current_app.config.get("JOBS_CATALOG_FIXTURE")
+    )
+    if result["status"] == "updated":
+        diff = result["diff"]
+        click.echo(
+            f"Stored job catalog version {result['version']} ({result['jobs']} jobs: "
+            f"{diff['added']} added, {diff['removed']} removed, {diff['changed']} changed)."
+        )
+    else:
+        click.echo(f"Job catalog version {result['version']} is current ({result['status'].replace('_', ' ')}).")
+
+
+@click.command("db-upgrade")
+@with_appcontext
+def db_upgrade_command():
+    """Apply pending schema migrations (workers also apply them at start-up)."""
+    from .db import ensure_db_initialized
+    from .migrations import current_version, upgrade
+
+    db = get_db()
+    ensure_db_initialized()
+    applied = upgrade(db)
+    for migration in applied:
+        click.echo(f"Applied {migration.version:04d}_{migration.name}.")
+    click.echo(f"Database schema is at version {current_version(db)}.")
+
+
+def init_app(app):
+    app.cli.add_command(backfill_resume_hashes_command)
+    app.cli.add_command(rescore_resumes_command)
+    app.cli.add_command(refresh_jobs_catalog_command)
+    app.cli.add_command(db_upgrade_command)
@@ -1,26 +1,197 @@
 import sqlite3
 import os
+import threading
+from collections import deque
+from contextlib import contextmanager
 import click
 from flask import current_app, g
 
+DEFAULT_POOL_MAX_IDLE = 8
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_MMAP_SIZE = 64 * 1024 * 1024
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+class PooledConnection(sqlite3.Connection):
+    pool_key = None
+
+
+def _connect(path, profile=None):
+    """Open a connection; with a `profile` the tuning PRAGMAs are applied once, here."""
+    if profile is None:
+        conn = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES)
+    else:
+        conn = sqlite3.connect(
+            path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            timeout=profile["busy_timeout_ms"] / 1000,
+            cached_statements=profile["cached_statements"],
+            check_same_thread=False,  # handed between request threads, never shared at once
+            factory=PooledConnection,
+        )
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout_ms'])}")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if profile['foreign_keys'] else 'OFF'}")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+class ConnectionPool:
+    """
+    Per-worker pool of tuned SQLite connections.
+
+    `get_db` checks a connection out for the app context and `close_db` checks
+    it back in. Idle connections are reused most-recently-returned first and
+    the oldest are closed beyond `max_idle`. A connection returned with an
+    open transaction is rolled back, exactly as closing it used to discard
+    the uncommitted work.
+    """
+
+    def __init__(self, max_idle=DEFAULT_POOL_MAX_IDLE):
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle = deque()  # (path, profile key, connection), oldest on the left
+        self._in_use = 0
+        self._stats = {"created": 0, "reused": 0, "checkins": 0, "discarded": 0, "max_in_use": 0}
+
+    def configure(self, max_idle=None):
+        with self._lock:
+            if max_idle is not None:
+                self.max_idle = int(max_idle)
+            overflow = self._trim()
+        for conn in overflow:
+            conn.close()
+
+    def checkout(self, path, profile):
+        key = tuple(sorted(profile.items()))
+        conn = None
+        with self._lock:
+            for position in range(len(self._idle) - 1, -1, -1):
+                if self._idle[position][:2] == (path, key):
+                    conn = self._idle[position][2]
+                    del self._idle[position]
+                    self._stats["reused"] += 1
+                    break
+            self._in_use += 1
+            self._stats["max_in_use"] = max(self._stats["max_in_use"], self._in_use)
+        if conn is not None:
+            return conn
+        try:
+            conn = _connect(path, profile)
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+            raise
+        conn.pool_key = (path, key)
+        with self._lock:
+            self._stats["created"] += 1
+        return conn
+
+    def checkin(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            reusable = True
+        except sqlite3.ProgrammingError:  # closed by the caller
+            reusable = False
+        with self._lock:
+            self._in_use -= 1
+            self._stats["checkins"] += 1
+            if reusable:
+                self._idle.append((*conn.pool_key, conn))
+                overflow = self._trim()
+            else:
+                self._stats["discarded"] += 1
+                overflow = []
+        for stale in overflow:
+            stale.close()
+
+    def _trim(self):
+        overflow = []
+        while len(self._idle) > max(0, self.max_idle):
+            overflow.append(self._idle.popleft()[2])
+            self._stats["discarded"] += 1
+        return overflow
+
+    def clear(self):
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for _, _, conn in idle:
+            conn.close()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({"idle": len(self._idle), "in_use": self._in_use, "max_idle": self.max_idle})
+        checkouts = stats["created"] + stats["reused"]
+        stats["reuse_rate"] = round(stats["reused"] / checkouts, 4) if checkouts else 0.0
+        return stats
+
+
+pool = ConnectionPool()
+
+
+def _pragma_profile(config):
+    return {
+        "busy_timeout_ms": config.get("DB_BUSY_TIMEOUT_MS", DEFAULT_BUSY_TIMEOUT_MS),
+        "mmap_size": config.get("DB_MMAP_SIZE", DEFAULT_MMAP_SIZE),
+        "cached_statements": config.get("DB_CACHED_STATEMENTS", DEFAULT_CACHED_STATEMENTS),
+        "foreign_keys": config.get("DB_FOREIGN_KEYS", False),
+    }
+
+
 def get_db():
     if 'db' not in g:
-        g.db = sqlite3.connect(
-            current_app.config['DATABASE'],
-            detect_types=sqlite3.PARSE_DECLTYPES
-        )
-        g.db.row_factory = sqlite3.Row
+        config = current_app.config
+        if config.get("DB_POOL_ENABLED", True):
+            g.db = pool.checkout(config['DATABASE'], _pragma_profile(config))
+            g.db_pooled = True
+        else:
+            g.db = _connect(config['DATABASE'])
     return g.db
 
 def close_db(e=None):
     db = g.pop('db', None)
     if db is not None:
-        db.close()
+        if g.pop('db_pooled', False):
+            pool.checkin(db)
+        else:
+            db.close()
+
+@contextmanager
+def unit_of_work():
+    """
+    Run a group of writes on the request's connection as one transaction.
+
+    The outermost block commits on success and rolls back on error; nested
+    blocks join the enclosing transaction, so a service that opens its own
+    unit of work can be called from a route that already holds one. Code
+    inside must not call commit() itself.
+    """
+    db = get_db()
+    depth = g.get('uow_depth', 0)
+    g.uow_depth = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            db.commit()
+    except BaseException:
+        if depth == 0:
+            db.rollback()
+        raise
+    finally:
+        g.uow_depth = depth
 
 def init_db():
+    from .migrations import stamp
+
     db = get_db()
     with current_app.open_resource('../database/schema.sql') as f:
         db.executescript(f.read().decode('utf8'))
+    # schema.sql is the complete current schema, so none of the migrations apply
+    stamp(db)
 
 def ensure_db_initialized():
     db = get_db()
@@ -18,7 +18,6 @@ def _current_user_id() -> int:
 @bp.get("/summary")
 @jwt_required()
 def summary():
-    conn = None
     try:
         conn = get_db_conn()
         dao = DashboardDAO(conn)
@@ -34,9 +33,3 @@ def summary():
     except Exception as e:
         current_app.logger.error(f"Unexpected error in dashboard summary: {e}", exc_info=True)
         return jsonify({"error": "Internal server error", "message": "An error occurred while fetching dashboard data"}), 500
-    finally:
-        if conn:
-            try:
-                conn.close()
-            except Exception:
-                pass
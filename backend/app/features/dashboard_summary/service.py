@@ -23,10 +23,10 @@ class DashboardDAO:
             row = self.conn.execute(
                 """
                 SELECT fr.score
-                FROM feedback_reports fr
-                JOIN resumes r ON r.id = fr.resume_id
+                FROM resumes r
+                JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
                 WHERE r.user_id = ?
-                ORDER BY fr.created_at DESC
+                ORDER BY r.created_at DESC, r.id DESC
                 LIMIT 1
                 """,
                 (user_id,),
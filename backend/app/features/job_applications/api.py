@@ -22,7 +22,6 @@ def _current_user_id() -> int:
 @bp.get("/")
 @jwt_required()
 def list_applications():
-    conn = None
     try:
         conn = get_db_conn()
         user_id = _current_user_id()
@@ -33,18 +32,11 @@ def list_applications():
     except Exception as e:
         current_app.logger.error(f"Error listing applications: {e}", exc_info=True)
         return jsonify({"error": "Internal server error"}), 500
-    finally:
-        if conn:
-            try:
-                conn.close()
-            except Exception:
-                pass
 
 
 @bp.post("/")
 @jwt_required()
 def create_application():
-    conn = None
     try:
         conn = get_db_conn()
         user_id = _current_user_id()
@@ -69,18 +61,11 @@ def create_application():
     except Exception as e:
         current_app.logger.error(f"Error creating application: {e}", exc_info=True)
         return jsonify({"error": "Internal server error"}), 500
-    finally:
-        if conn:
-            try:
-                conn.close()
-            except Exception:
-                pass
 
 
 @bp.put("/<int:app_id>")
 @jwt_required()
 def update_application(app_id):
-    conn = None
     try:
         conn = get_db_conn()
         user_id = _current_user_id()
@@ -105,18 +90,11 @@ def update_application(app_id):
     except Exception as e:
         current_app.logger.error(f"Error updating application: {e}", exc_info=True)
         return jsonify({"error": "Internal server error"}), 500
-    finally:
-        if conn:
-            try:
-                conn.close()
-            except Exception:
-                pass
 
 
 @bp.delete("/<int:app_id>")
 @jwt_required()
 def delete_application(app_id):
-    conn = None
     try:
         conn = get_db_conn()
         user_id = _current_user_id()
@@ -127,9 +105,3 @@ def delete_application(app_id):
     except Exception as e:
         current_app.logger.error(f"Error deleting application: {e}", exc_info=True)
         return jsonify({"error": "Internal server error"}), 500
-    finally:
-        if conn:
-            try:
-                conn.close()
-            except Exception:
-                pass
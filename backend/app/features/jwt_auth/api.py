@@ -1,5 +1,4 @@
 # backend/app/features/jwt_auth/api.py
-import os
 import re
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import (
@@ -14,6 +13,8 @@ from .service import (
     verify_pw,
 )
 from ... import db
+from ..keywords.service import ChunkEmbeddingDAO
+from ..resume_jobs.service import remove_resume_file_if_unused
 from ...extensions import limiter
 
 bp = Blueprint("auth", __name__, url_prefix="/api/v1/auth")
@@ -181,9 +182,12 @@ def delete_account():
         resume_id = resume["id"]
         conn.execute("DELETE FROM feedback_reports WHERE resume_id = ?", (resume_id,))
         conn.execute("DELETE FROM keyword_analyses WHERE resume_id = ?", (resume_id,))
-        if resume["file_path"] and os.path.exists(resume["file_path"]):
-            os.remove(resume["file_path"])
+    ChunkEmbeddingDAO(conn).delete_for_user(user_id)
     conn.execute("DELETE FROM resumes WHERE user_id = ?", (user_id,))
+    # Older deduplicated uploads may share a stored file with other users
+    for resume in resumes:
+        remove_resume_file_if_unused(conn, resume["file_path"])
+    conn.execute("DELETE FROM resume_jobs WHERE user_id = ?", (user_id,))
 
     # Delete interview data
     sessions = conn.execute(
@@ -192,6 +196,12 @@ def delete_account():
     for session in sessions:
         conn.execute("DELETE FROM interview_answers WHERE session_id = ?", (session["id"],))
     conn.execute("DELETE FROM interview_sessions WHERE user_id = ?", (user_id,))
+    conn.execute(
+        "DELETE FROM answers WHERE interview_id IN (SELECT id FROM interviews WHERE user_id = ?)",
+        (user_id,),
+    )
+    conn.execute("DELETE FROM interviews WHERE user_id = ?", (user_id,))
+    conn.execute("DELETE FROM job_applications WHERE user_id = ?", (user_id,))
 
     # Delete progress and badges
     conn.execute("DELETE FROM user_badges WHERE user_id = ?", (user_id,))
@@ -216,9 +226,9 @@ def export_account():
 
     resumes = conn.execute(
         """
-        SELECT r.id, r.file_path, r.created_at, fr.score, fr.summary
+        SELECT r.id, r.file_path, r.original_name, r.created_at, fr.score, fr.summary
         FROM resumes r
-        LEFT JOIN feedback_reports fr ON fr.resume_id = r.id
+        LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
         WHERE r.user_id = ?
         ORDER BY r.created_at DESC
         """,
@@ -259,7 +269,7 @@ def export_account():
         "resumes": [
             {
                 "id": r["id"],
-                "filename": r["file_path"],
+                "filename": r["original_name"] or r["file_path"],
                 "uploaded_at": r["created_at"],
                 "score": r["score"],
                 "summary": r["summary"],
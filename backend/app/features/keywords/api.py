@@ -1,23 +1,41 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 import json
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen, Request
 from urllib.error import URLError
+from urllib.parse import urlsplit
 from html import unescape
 from functools import lru_cache
+from typing import NamedTuple
 
 from ... import db  # Import the db module from the app's root
+from ...services.embeddings import embedding_backend
 from ..progress.service import award_resume_score  # ✅ add progress award
+from .catalog import CatalogWarming, JobCatalogStore, stable_job_id
+from .details import job_details
+from .search_index import JobSearchIndex
+from .service import (
+    encode_resume_chunks,
+    filter_job_indices,
+    job_catalog_index,
+    rank_jobs_lexical,
+    rank_jobs_semantic,
+    top_k_indices,
+)
 
 # This blueprint is already registered in your __init__.py
 bp = Blueprint("keywords", __name__, url_prefix="/api/keywords")
 
 SIMPLIFY_README_URL = "https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/README.md"
-JOBS_CACHE_TTL_SECONDS = 60 * 30
-_jobs_cache = {"jobs": [], "fetched_at": 0}
-SEMANTIC_MATCH_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_search_index_cache = {"index": None}
+HYBRID_MATCH_MAX_CHUNKS = 18
+MATCH_BATCH_MAX = 50
+JOB_DETAILS_BATCH_MAX = 50
+# Job details are fetched server-side and cached for every user, so only Simplify pages are accepted
+SIMPLIFY_HOSTS = {"simplify.jobs", "www.simplify.jobs"}
 ENGLISH_STOP_WORDS = {
     "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has",
     "he", "in", "is", "it", "its", "of", "on", "that", "the", "to", "was",
@@ -41,6 +59,7 @@ def _extract_first_link(html: str) -> str | None:
 
 def _parse_jobs_from_readme(markdown: str) -> list[dict]:
     jobs = []
+    id_counts = {}
     section_pattern = re.compile(
         r"##\s+(?P<title>.+?)\n.*?<tbody>(?P<body>.*?)</tbody>",
         re.DOTALL,
@@ -55,6 +74,7 @@ def _parse_jobs_from_readme(markdown: str) -> list[dict]:
 
         category = section_title.replace("New Grad Roles", "").strip(" -")
         body = section.group("body")
+        previous_company = ""
         for row in row_pattern.finditer(body):
             cells = cell_pattern.findall(row.group(1))
             if len(cells) < 5:
@@ -74,8 +94,18 @@ def _parse_jobs_from_readme(markdown: str) -> list[dict]:
             simplify_url = apply_links[1] if len(apply_links) > 1 else None
             company_url = _extract_first_link(company_html)
 
+            # "↳" rows continue the company above; resolve it so the id names the real company.
+            company_name = company_text.replace("🔥", "").strip()
+            if company_name == "↳":
+                company_name = previous_company
+            previous_company = company_name
+            job_id = stable_job_id(company_name, role_text.replace("🎓", ""), apply_url)
+            id_counts[job_id] = id_counts.get(job_id, 0) + 1
+            if id_counts[job_id] > 1:
+                job_id = f"{job_id}-{id_counts[job_id]}"
+
             jobs.append({
-                "id": f"{category.lower().replace(' ', '-')}-{len(jobs) + 1}",
+                "id": job_id,
                 "category": category,
                 "company": company_text.replace("🔥", "").strip(),
                 "role": role_text.replace("🎓", "").strip(),
@@ -92,6 +122,9 @@ def _parse_jobs_from_readme(markdown: str) -> list[dict]:
     return jobs
 
 
+catalog_store = JobCatalogStore("simplify-new-grad", SIMPLIFY_README_URL, _parse_jobs_from_readme)
+
+
 def _fetch_text(url: str) -> str:
     req = Request(url, headers={"User-Agent": "Career-Coach/1.0"})
     with urlopen(req, timeout=15) as response:
@@ -193,44 +226,74 @@ def _split_text_chunks(text: str, max_chunks: int = 18) -> list[str]:
     return chunks
 
 
-@lru_cache(maxsize=1)
 def _load_sentence_transformer():
-    from sentence_transformers import SentenceTransformer
+    """The shared embedding backend, loaded on first use unless warmed at start-up."""
+    return embedding_backend.get()
+
+
+def _summarize_similarity(job_embeddings, resume_embeddings, top_k: int = 3) -> dict:
+    """
+    Score normalized job chunk embeddings against resume chunk embeddings.
+
+    Both inputs are float32 arrays of shape (chunks, dim). Returns per-job-chunk
+    best scores, the semantic score, chunk coverage and the `top_k` job chunks
+    with the resume chunk that matched each best.
+    """
+    import numpy as np
 
-    return SentenceTransformer(SEMANTIC_MATCH_MODEL, local_files_only=True)
+    job_matrix = np.asarray(job_embeddings, dtype=np.float32)
+    resume_matrix = np.asarray(resume_embeddings, dtype=np.float32)
+    similarity = job_matrix @ resume_matrix.T
 
+    best_resume = similarity.argmax(axis=1)
+    best_scores = similarity[np.arange(len(similarity)), best_resume]
+    top_jobs = top_k_indices(best_scores, top_k)
 
-def _compute_hybrid_match(resume_text: str, job_description: str) -> dict:
+    return {
+        "semantic_score": float(best_scores.mean(dtype=np.float64)),
+        "coverage_score": float(np.count_nonzero(best_scores >= 0.35)) / len(best_scores),
+        "top_pairs": [
+            (int(job_idx), int(best_resume[job_idx]), float(best_scores[job_idx]))
+            for job_idx in top_jobs
+        ],
+    }
+
+
+def _compute_hybrid_match(
+    resume_text: str,
+    job_description: str,
+    max_chunks: int = HYBRID_MATCH_MAX_CHUNKS,
+    resume_id: int | None = None,
+    resume_embeddings=None,
+) -> dict:
+    """
+    Semantic + lexical match. With `resume_id`, resume chunk embeddings come
+    from the persistent store and only the job description is encoded;
+    precomputed `resume_embeddings` skip the resume side entirely.
+    """
     model = _load_sentence_transformer()
 
-    resume_keywords = _tokenize_keywords(resume_text)
+    resume_keywords = _resume_keyword_profile(resume_text).keywords
     jd_keywords = _tokenize_keywords(job_description)
     shared_keywords = sorted(resume_keywords.intersection(jd_keywords))
     missing_keywords = sorted(jd_keywords.difference(resume_keywords))
 
-    resume_chunks = _split_text_chunks(resume_text)
-    job_chunks = _split_text_chunks(job_description)
+    resume_chunks = _split_text_chunks(resume_text, max_chunks=max_chunks)
+    job_chunks = _split_text_chunks(job_description, max_chunks=max_chunks)
 
     # Fall back to whole-document comparison if chunking produced little signal.
     resume_inputs = resume_chunks or [resume_text]
     job_inputs = job_chunks or [job_description]
 
-    resume_embeddings = model.encode(resume_inputs, normalize_embeddings=True).tolist()
-    job_embeddings = model.encode(job_inputs, normalize_embeddings=True).tolist()
-
-    similarity_matrix = []
-    for job_vector in job_embeddings:
-        row = []
-        for resume_vector in resume_embeddings:
-            row.append(sum(a * b for a, b in zip(job_vector, resume_vector)))
-        similarity_matrix.append(row)
-
-    best_scores = [max(row) for row in similarity_matrix] if similarity_matrix else [0.0]
-    chunk_coverage = (
-        sum(1 for score in best_scores if score >= 0.35) / len(best_scores)
-        if best_scores else 0.0
-    )
-    semantic_score = sum(best_scores) / len(best_scores) if best_scores else 0.0
+    if resume_embeddings is None and resume_id is not None:
+        resume_embeddings = encode_resume_chunks(
+            db.get_db(), model, embedding_backend.model_key, resume_id, resume_inputs
+        )
+    elif resume_embeddings is None:
+        resume_embeddings = model.encode(resume_inputs, normalize_embeddings=True)
+    job_embeddings = model.encode(job_inputs, normalize_embeddings=True)
+    similarity = _summarize_similarity(job_embeddings, resume_embeddings)
+    semantic_score = similarity["semantic_score"]
 
     # Keep some lexical grounding so users still get actionable keyword feedback.
     lexical_overlap = (
@@ -241,61 +304,79 @@ def _compute_hybrid_match(resume_text: str, job_description: str) -> dict:
 
     final_score = max(0.0, min(1.0, semantic_score * 0.7 + lexical_overlap * 0.3))
 
-    top_matches = []
-    if similarity_matrix:
-        ranked_job_indices = sorted(
-            range(len(best_scores)),
-            key=lambda idx: best_scores[idx],
-            reverse=True,
-        )[:3]
-        for job_idx in ranked_job_indices:
-            resume_idx = max(
-                range(len(similarity_matrix[job_idx])),
-                key=lambda idx: similarity_matrix[job_idx][idx],
-            )
-            top_matches.append({
-                "job_excerpt": job_inputs[job_idx],
-                "resume_excerpt": resume_inputs[resume_idx],
-                "score": float(best_scores[job_idx]),
-            })
+    top_matches = [
+        {
+            "job_excerpt": job_inputs[job_idx],
+            "resume_excerpt": resume_inputs[resume_idx],
+            "score": score,
+        }
+        for job_idx, resume_idx, score in similarity["top_pairs"]
+    ]
 
     return {
         "score": final_score,
         "semantic_score": semantic_score,
         "lexical_overlap": lexical_overlap,
-        "coverage_score": chunk_coverage,
+        "coverage_score": similarity["coverage_score"],
         "matched_keywords": shared_keywords[:30],
         "missing_keywords": missing_keywords[:30],
         "top_matches": top_matches,
         "method": "sentence-transformers-hybrid",
-        "model": SEMANTIC_MATCH_MODEL,
+        "model": embedding_backend.model_key,
     }
 
 
 def _load_new_grad_jobs(force_refresh: bool = False) -> list[dict]:
-    now = time.time()
-    if (
-        not force_refresh and
-        _jobs_cache["jobs"] and
-        now - _jobs_cache["fetched_at"] < JOBS_CACHE_TTL_SECONDS
-    ):
-        return _jobs_cache["jobs"]
-
-    req = Request(
-        SIMPLIFY_README_URL,
-        headers={"User-Agent": "Career-Coach/1.0"},
+    """Stored catalog (possibly stale); raises CatalogWarming while the first download runs."""
+    return catalog_store.get_jobs(
+        db.get_db(), current_app._get_current_object(), force_refresh=force_refresh
     )
-    with urlopen(req, timeout=15) as response:
-        markdown = response.read().decode("utf-8")
 
-    jobs = _parse_jobs_from_readme(markdown)
-    _jobs_cache["jobs"] = jobs
-    _jobs_cache["fetched_at"] = now
-    return jobs
+
+def _job_search_index(jobs: list[dict]) -> JobSearchIndex:
+    """Index for the current catalog list; a refreshed catalog updates only the rows that changed."""
+    index = _search_index_cache["index"]
+    if index is None:
+        index = JobSearchIndex(jobs)
+    elif index.jobs is not jobs:
+        index = index.updated(jobs)
+    _search_index_cache["index"] = index
+    return index
+
+
+def _catalog_warming_response():
+    response = jsonify({
+        "message": "Live job listings are still loading. Please try again shortly.",
+        "status": "warming",
+    })
+    response.headers["Retry-After"] = "5"
+    return response, 503
+
+
+class ResumeKeywordProfile(NamedTuple):
+    """Resume side of a lightweight match: chunk token sets as bitsets over the resume's own vocabulary."""
+    keywords: frozenset
+    chunks: list
+    vocabulary: dict
+    chunk_bits: list
+
+
+@lru_cache(maxsize=256)
+def _resume_keyword_profile(resume_text: str) -> ResumeKeywordProfile:
+    chunks = _split_text_chunks(resume_text, max_chunks=12) or [resume_text]
+    vocabulary = {}
+    chunk_bits = []
+    for chunk in chunks:
+        bits = 0
+        for token in _tokenize_keywords(chunk):
+            bits |= 1 << vocabulary.setdefault(token, len(vocabulary))
+        chunk_bits.append(bits)
+    return ResumeKeywordProfile(frozenset(_tokenize_keywords(resume_text)), chunks, vocabulary, chunk_bits)
 
 
 def _compute_lightweight_match(resume_text: str, job_description: str) -> dict:
-    resume_keywords = _tokenize_keywords(resume_text)
+    resume = _resume_keyword_profile(resume_text)
+    resume_keywords = resume.keywords
     jd_keywords = _tokenize_keywords(job_description)
     shared_keywords = sorted(resume_keywords.intersection(jd_keywords))
     missing_keywords = sorted(jd_keywords.difference(resume_keywords))
@@ -305,8 +386,9 @@ def _compute_lightweight_match(resume_text: str, job_description: str) -> dict:
         if jd_keywords else 0.0
     )
 
-    resume_chunks = _split_text_chunks(resume_text, max_chunks=12) or [resume_text]
+    resume_chunks = resume.chunks
     job_chunks = _split_text_chunks(job_description, max_chunks=12) or [job_description]
+    vocabulary = resume.vocabulary
 
     chunk_scores = []
     top_matches = []
@@ -315,16 +397,18 @@ def _compute_lightweight_match(resume_text: str, job_description: str) -> dict:
         best_score = 0.0
         best_resume_chunk = resume_chunks[0] if resume_chunks else ""
 
-        for resume_chunk in resume_chunks:
-            resume_chunk_tokens = _tokenize_keywords(resume_chunk)
-            if not job_chunk_tokens:
-                score = 0.0
-            else:
-                score = len(job_chunk_tokens.intersection(resume_chunk_tokens)) / len(job_chunk_tokens)
-
-            if score > best_score:
-                best_score = score
-                best_resume_chunk = resume_chunk
+        if job_chunk_tokens:
+            # Tokens the resume never uses cannot overlap, but still count in the denominator.
+            job_bits = 0
+            for token in job_chunk_tokens:
+                bit = vocabulary.get(token)
+                if bit is not None:
+                    job_bits |= 1 << bit
+            for resume_chunk, resume_bits in zip(resume_chunks, resume.chunk_bits):
+                score = (job_bits & resume_bits).bit_count() / len(job_chunk_tokens)
+                if score > best_score:
+                    best_score = score
+                    best_resume_chunk = resume_chunk
 
         chunk_scores.append(best_score)
         top_matches.append({
@@ -363,29 +447,21 @@ def get_new_grad_jobs():
         category = (request.args.get("category") or "").strip().lower()
         search = (request.args.get("search") or "").strip().lower()
         force_refresh = (request.args.get("refresh") or "").strip().lower() == "true"
+        offset = max(int(request.args.get("offset", 0)), 0)
 
-        jobs = _load_new_grad_jobs(force_refresh=force_refresh)
-
-        if category and category != "all":
-            jobs = [job for job in jobs if job["category"].lower() == category]
-
-        if search:
-            jobs = [
-                job for job in jobs
-                if search in job["company"].lower()
-                or search in job["role"].lower()
-                or search in job["location"].lower()
-                or search in job["category"].lower()
-            ]
-
-        categories = sorted({job["category"] for job in _jobs_cache["jobs"]})
+        index = _job_search_index(_load_new_grad_jobs(force_refresh=force_refresh))
+        total, jobs = index.search(search, category, offset=offset, limit=limit)
 
         return jsonify({
-            "jobs": jobs[:limit],
-            "total": len(jobs),
-            "categories": categories,
+            "jobs": jobs,
+            "total": total,
+            "offset": offset,
+            "categories": index.categories,
+            "category_counts": index.category_counts,
             "source": "SimplifyJobs/New-Grad-Positions",
         }), 200
+    except CatalogWarming:
+        return _catalog_warming_response()
     except URLError as exc:
         return jsonify({
             "message": "Could not load live job listings right now.",
@@ -398,15 +474,111 @@ def get_new_grad_jobs():
         }), 500
 
 
+def _latest_resume(conn, user_id: int):
+    """Return (resume_id, full text) of the user's newest resume, or (None, None)."""
+    row = conn.execute(
+        """
+        SELECT id, parsed_json
+        FROM resumes
+        WHERE user_id = ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+        """,
+        (user_id,),
+    ).fetchone()
+    if row is None:
+        return None, None
+    try:
+        parsed = json.loads(row["parsed_json"] or "{}")
+    except json.JSONDecodeError:
+        parsed = {}
+    for section in parsed.get("sections") or []:
+        if section.get("name") == "full_content":
+            return int(row["id"]), section.get("content") or ""
+    return int(row["id"]), ""
+
+
+def _recommend_jobs(resume_id: int, resume_text: str, jobs: list[dict], category: str, location: str, limit: int) -> dict:
+    candidates = filter_job_indices(jobs, category, location)
+    try:
+        model = _load_sentence_transformer()
+        resume_inputs = _split_text_chunks(resume_text, max_chunks=HYBRID_MATCH_MAX_CHUNKS) or [resume_text]
+        resume_embeddings = encode_resume_chunks(
+            db.get_db(), model, embedding_backend.model_key, resume_id, resume_inputs
+        )
+        indexed_jobs, matrix = job_catalog_index.sync(jobs, model, embedding_backend.model_key)
+        ranked = rank_jobs_semantic(indexed_jobs, matrix, resume_embeddings, candidates, limit)
+        method, model_name = "sentence-transformers-catalog", embedding_backend.model_key
+    except (ImportError, OSError) as exc:
+        current_app.logger.warning(f"Semantic recommendations unavailable, using keyword ranking: {exc}")
+        ranked = rank_jobs_lexical(
+            jobs,
+            _tokenize_keywords(resume_text),
+            lambda job: _tokenize_keywords(job["description_seed"]),
+            candidates,
+            limit,
+        )
+        method, model_name = "keyword-overlap", None
+
+    return {
+        "jobs": [{**jobs[index], "match_score": round(score, 4)} for index, score in ranked],
+        "total_candidates": len(candidates),
+        "method": method,
+        "model": model_name,
+    }
+
+
+@bp.get("/jobs/recommendations")
+@jwt_required()
+def recommend_jobs():
+    try:
+        current_user_id = int(get_jwt_identity())
+        limit = min(max(int(request.args.get("limit", 10)), 1), 100)
+        category = request.args.get("category") or ""
+        location = request.args.get("location") or ""
+
+        resume_id, resume_text = _latest_resume(db.get_db(), current_user_id)
+        if resume_id is None:
+            return jsonify({"message": "No resume found. Please upload one first."}), 404
+        if not resume_text:
+            return jsonify({"message": "Resume parsed, but no text was found to match against."}), 400
+
+        started = time.perf_counter()
+        jobs = _load_new_grad_jobs()
+        result = _recommend_jobs(resume_id, resume_text, jobs, category, location, limit)
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        result["source"] = "SimplifyJobs/New-Grad-Positions"
+        return jsonify(result), 200
+    except CatalogWarming:
+        return _catalog_warming_response()
+    except URLError as exc:
+        return jsonify({
+            "message": "Could not load live job listings right now.",
+            "error": str(exc),
+        }), 502
+    except Exception as exc:
+        return jsonify({
+            "message": "Unexpected error while ranking job recommendations.",
+            "error": str(exc),
+        }), 500
+
+
+def _is_simplify_url(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.scheme in {"http", "https"} and (parts.hostname or "") in SIMPLIFY_HOSTS
+
+
 @bp.get("/jobs/details")
 @jwt_required()
 def get_job_details():
     simplify_url = (request.args.get("simplify_url") or "").strip()
     if not simplify_url:
         return jsonify({"message": "simplify_url is required"}), 400
+    if not _is_simplify_url(simplify_url):
+        return jsonify({"message": "simplify_url must be an http(s) simplify.jobs URL"}), 400
 
     try:
-        details = _fetch_job_details(simplify_url)
+        details = job_details.get(simplify_url, _fetch_job_details)
         return jsonify(details), 200
     except URLError as exc:
         return jsonify({
@@ -420,6 +592,37 @@ def get_job_details():
         }), 500
 
 
+@bp.post("/jobs/details/batch")
+@jwt_required()
+def get_job_details_batch():
+    data = request.get_json(silent=True) or {}
+    urls = data.get("simplify_urls")
+    if not isinstance(urls, list) or not urls:
+        return jsonify({"message": "simplify_urls must be a non-empty list"}), 400
+    urls = [str(url or "").strip() for url in urls]
+    if len(set(urls)) > JOB_DETAILS_BATCH_MAX:
+        return jsonify({"message": f"At most {JOB_DETAILS_BATCH_MAX} URLs per batch."}), 400
+    invalid = [url for url in urls if not _is_simplify_url(url)]
+    if invalid:
+        return jsonify({"message": "Every simplify_url must be an http(s) simplify.jobs URL.", "invalid": invalid}), 400
+
+    results, errors, cache_hits = job_details.get_many(urls, _fetch_job_details)
+    return jsonify({
+        "jobs": results,
+        "errors": {
+            url: ("Could not load detailed job information right now." if isinstance(exc, URLError)
+                  else "Could not parse detailed job information from the source page.")
+            for url, exc in errors.items()
+        },
+        "stats": {
+            "requested": len(results) + len(errors),
+            "cached": cache_hits,
+            "fetched": len(results) - cache_hits,
+            "failed": len(errors),
+        },
+    }), 200
+
+
 @bp.post("/match")
 @jwt_required()
 def match_keywords():
@@ -484,7 +687,16 @@ def match_keywords():
         except Exception as e:
             return jsonify({"message": f"Error parsing resume JSON: {str(e)}"}), 500
 
-        match_result = _compute_lightweight_match(resume_text, job_description)
+        match_result = None
+        if current_app.config.get("KEYWORD_MATCH_METHOD") == "hybrid":
+            try:
+                match_result = _compute_hybrid_match(
+                    resume_text, job_description, resume_id=int(resume_row["id"])
+                )
+            except (ImportError, OSError) as exc:
+                current_app.logger.warning(f"Hybrid match unavailable, using keyword match: {exc}")
+        if match_result is None:
+            match_result = _compute_lightweight_match(resume_text, job_description)
         score = float(match_result["score"])
         semantic_score = float(match_result["semantic_score"])
         lexical_overlap = float(match_result["lexical_overlap"])
@@ -495,22 +707,22 @@ def match_keywords():
         method = match_result["method"]
         model_name = match_result["model"]
 
-        # ✅ Award progress points based on improved "resume score" (0..100)
-        award_resume_score(current_user_id, int(score * 100))
-
-        cursor.execute(
-            """
-            INSERT INTO keyword_analyses (resume_id, job_text, match_score, missing_keywords_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                int(resume_row["id"]),
-                job_description,
-                float(score),
-                json.dumps(missing_keywords),
-            ),
-        )
-        db_conn.commit()
+        with db.unit_of_work():
+            # ✅ Award progress points based on improved "resume score" (0..100)
+            award_resume_score(current_user_id, int(score * 100))
+
+            cursor.execute(
+                """
+                INSERT INTO keyword_analyses (resume_id, job_text, match_score, missing_keywords_json)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    int(resume_row["id"]),
+                    job_description,
+                    float(score),
+                    json.dumps(missing_keywords),
+                ),
+            )
 
         # 7. Return the results
         return jsonify(
@@ -529,3 +741,115 @@ def match_keywords():
 
     except Exception as e:
         return jsonify({"message": "An unexpected error occurred.", "error": str(e)}), 500
+
+
+def _match_descriptions(resume_id: int, resume_text: str, descriptions: list[str]) -> list[dict]:
+    """
+    Score one resume against many job descriptions. The resume is analysed once:
+    its keyword profile is cached and, for the hybrid scorer, its chunk
+    embeddings are loaded once and shared by a bounded pool of match threads
+    (encoding releases the GIL). Keyword-only scoring is CPU-bound Python and
+    runs inline.
+    """
+    if current_app.config.get("KEYWORD_MATCH_METHOD") == "hybrid":
+        try:
+            model = _load_sentence_transformer()
+            resume_inputs = _split_text_chunks(resume_text, max_chunks=HYBRID_MATCH_MAX_CHUNKS) or [resume_text]
+            resume_embeddings = encode_resume_chunks(
+                db.get_db(), model, embedding_backend.model_key, resume_id, resume_inputs
+            )
+            workers = max(1, min(int(current_app.config.get("KEYWORD_MATCH_BATCH_WORKERS", 4)), len(descriptions)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="keyword-match") as executor:
+                return list(executor.map(
+                    lambda description: _compute_hybrid_match(
+                        resume_text, description, resume_embeddings=resume_embeddings
+                    ),
+                    descriptions,
+                ))
+        except (ImportError, OSError) as exc:
+            current_app.logger.warning(f"Hybrid match unavailable, using keyword match: {exc}")
+    return [_compute_lightweight_match(resume_text, description) for description in descriptions]
+
+
+def _catalog_descriptions(job_ids: list[str]):
+    """Return ({job_id: (job, description)}, unknown ids); descriptions come from cached details when present."""
+    catalog = {job["id"]: job for job in _load_new_grad_jobs()}
+    found, unknown = {}, []
+    for job_id in job_ids:
+        job = catalog.get(job_id)
+        if job is None:
+            unknown.append(job_id)
+            continue
+        details = job_details.cache.get(job["simplify_url"]) if job.get("simplify_url") else None
+        found[job_id] = (job, (details or {}).get("description") or job["description_seed"])
+    return found, unknown
+
+
+@bp.post("/match/batch")
+@jwt_required()
+def match_keywords_batch():
+    try:
+        current_user_id = int(get_jwt_identity())
+        data = request.get_json(silent=True) or {}
+        descriptions = data.get("job_descriptions")
+        job_ids = data.get("job_ids")
+        if bool(descriptions) == bool(job_ids):
+            return jsonify({"message": "Send either job_descriptions or job_ids (a non-empty list)."}), 400
+        items = descriptions or job_ids
+        if not isinstance(items, list) or not all(isinstance(item, str) and item.strip() for item in items):
+            return jsonify({"message": "Each entry must be a non-empty string."}), 400
+        if len(items) > MATCH_BATCH_MAX:
+            return jsonify({"message": f"At most {MATCH_BATCH_MAX} job descriptions per batch."}), 400
+
+        conn = db.get_db()
+        resume_id, resume_text = _latest_resume(conn, current_user_id)
+        if resume_id is None:
+            return jsonify({"message": "No resume found. Please upload one first."}), 404
+        if not resume_text:
+            return jsonify({"message": "Resume parsed, but no text was found to match against."}), 400
+
+        if job_ids:
+            found, unknown = _catalog_descriptions(job_ids)
+            if unknown:
+                return jsonify({"message": "Unknown job ids.", "unknown_job_ids": unknown}), 404
+            entries = [{"job_id": job_id, "job": found[job_id][0]} for job_id in job_ids]
+            texts = [found[job_id][1] for job_id in job_ids]
+        else:
+            entries = [{} for _ in descriptions]
+            texts = descriptions
+
+        started = time.perf_counter()
+        matches = _match_descriptions(resume_id, resume_text, texts)
+
+        with db.unit_of_work():
+            award_resume_score(current_user_id, int(max(match["score"] for match in matches) * 100))
+            conn.executemany(
+                """
+                INSERT INTO keyword_analyses (resume_id, job_text, match_score, missing_keywords_json)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (resume_id, text, float(match["score"]), json.dumps(match["missing_keywords"]))
+                    for text, match in zip(texts, matches)
+                ],
+            )
+
+        ranked = sorted(range(len(matches)), key=lambda index: matches[index]["score"], reverse=True)
+        return jsonify({
+            "results": [
+                {"rank": rank, "index": index, **entries[index], **matches[index]}
+                for rank, index in enumerate(ranked, start=1)
+            ],
+            "resume_id": resume_id,
+            "count": len(matches),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }), 200
+    except CatalogWarming:
+        return _catalog_warming_response()
+    except URLError as exc:
+        return jsonify({
+            "message": "Could not load live job listings right now.",
+            "error": str(exc),
+        }), 502
+    except Exception as e:
+        return jsonify({"message": "An unexpected error occurred.", "error": str(e)}), 500
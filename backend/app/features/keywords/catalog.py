@@ -0,0 +1,340 @@
+# backend/app/features/keywords/catalog.py
+
+import hashlib
+import json
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from ...db import get_db
+
+# A worker that claims a refresh holds it this long; a crashed refresh frees up after it.
+REFRESH_LEASE_SECONDS = 120
+
+
+class CatalogWarming(Exception):
+    """No catalog has been stored yet; a background refresh was started instead of blocking."""
+
+
+def stable_job_id(company: str, role: str, apply_url) -> str:
+    """Id that survives rows being added or reordered upstream."""
+    key = "\x1f".join((company.strip().lower(), role.strip().lower(), (apply_url or "").strip()))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def diff_catalogs(old_jobs: list[dict], new_jobs: list[dict]) -> dict:
+    """Ids added, removed and changed (same id, different fields) between two catalogs."""
+    old_by_id = {job["id"]: job for job in old_jobs}
+    new_ids = set()
+    added, changed = [], []
+    for job in new_jobs:
+        new_ids.add(job["id"])
+        previous = old_by_id.get(job["id"])
+        if previous is None:
+            added.append(job["id"])
+        elif previous != job:
+            changed.append(job["id"])
+    removed = [job_id for job_id in old_by_id if job_id not in new_ids]
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "unchanged": len(new_jobs) - len(added) - len(changed),
+    }
+
+
+def diff_stats(diff: dict) -> dict:
+    return {
+        "added": len(diff["added"]),
+        "removed": len(diff["removed"]),
+        "changed": len(diff["changed"]),
+        "unchanged": diff["unchanged"],
+    }
+
+
+class JobCatalogDAO:
+    """The parsed job catalog, one row per source, shared by every worker through SQLite."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get_meta(self, source: str):
+        return self.conn.execute(
+            """
+            SELECT source, version, job_count, content_hash, etag, last_modified,
+                   fetched_at, checked_at, refresh_lease_until, last_diff_json, failed_at
+            FROM job_catalog
+            WHERE source = ?
+            """,
+            (source,),
+        ).fetchone()
+
+    def load_jobs(self, source: str):
+        """Return (version, jobs) of the stored catalog, or (0, []) when there is none."""
+        row = self.conn.execute(
+            "SELECT version, jobs_json FROM job_catalog WHERE source = ?", (source,)
+        ).fetchone()
+        if row is None or not row["jobs_json"]:
+            return 0, []
+        return int(row["version"]), json.loads(row["jobs_json"])
+
+    def claim_refresh(self, source: str, now: float, lease_seconds: int = REFRESH_LEASE_SECONDS) -> bool:
+        """Take the refresh lease for `source`; False if another worker holds it."""
+        self.conn.execute("INSERT OR IGNORE INTO job_catalog (source) VALUES (?)", (source,))
+        claimed = self.conn.execute(
+            """
+            UPDATE job_catalog SET refresh_lease_until = ?
+            WHERE source = ? AND (refresh_lease_until IS NULL OR refresh_lease_until < ?)
+            """,
+            (now + lease_seconds, source, now),
+        ).rowcount
+        self.conn.commit()
+        return claimed == 1
+
+    def release(self, source: str) -> None:
+        self.conn.execute("UPDATE job_catalog SET refresh_lease_until = NULL WHERE source = ?", (source,))
+        self.conn.commit()
+
+    def fail(self, source: str, now: float) -> None:
+        """Record a failed refresh and free the lease."""
+        self.conn.execute("INSERT OR IGNORE INTO job_catalog (source) VALUES (?)", (source,))
+        self.conn.execute(
+            "UPDATE job_catalog SET failed_at = ?, refresh_lease_until = NULL WHERE source = ?",
+            (now, source),
+        )
+        self.conn.commit()
+
+    def touch(self, source: str, etag, last_modified, now: float) -> None:
+        """Record a check that found no new content."""
+        self.conn.execute(
+            """
+            UPDATE job_catalog
+            SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified),
+                checked_at = ?, refresh_lease_until = NULL, failed_at = NULL
+            WHERE source = ?
+            """,
+            (etag, last_modified, now, source),
+        )
+        self.conn.commit()
+
+    def store(
+        self, source: str, jobs: list[dict], content_hash: str, etag, last_modified, now: float, stats: dict
+    ) -> int:
+        """Replace the catalog and bump its version; returns the new version."""
+        self.conn.execute("INSERT OR IGNORE INTO job_catalog (source) VALUES (?)", (source,))
+        self.conn.execute(
+            """
+            UPDATE job_catalog
+            SET version = version + 1, jobs_json = ?, job_count = ?, content_hash = ?,
+                etag = ?, last_modified = ?, fetched_at = ?, checked_at = ?,
+                refresh_lease_until = NULL, last_diff_json = ?, failed_at = NULL
+            WHERE source = ?
+            """,
+            (json.dumps(jobs), len(jobs), content_hash, etag, last_modified, now, now,
+             json.dumps(stats), source),
+        )
+        version = self.conn.execute(
+            "SELECT version FROM job_catalog WHERE source = ?", (source,)
+        ).fetchone()["version"]
+        self.conn.commit()
+        return int(version)
+
+
+def fetch_conditional(url: str, etag=None, last_modified=None, timeout: int = 15):
+    """
+    GET `url` with If-None-Match / If-Modified-Since.
+
+    Returns None on 304, else (text, etag, last_modified).
+    """
+    headers = {"User-Agent": "Career-Coach/1.0"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+            return (
+                response.read().decode("utf-8"),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+    except HTTPError as exc:
+        if exc.code == 304:
+            return None
+        raise
+
+
+class JobCatalogStore:
+    """
+    Serves the parsed catalog from SQLite and keeps it fresh without blocking requests.
+
+    Each worker keeps the decoded jobs of the latest stored version in memory
+    and only re-reads the row when another worker has stored a newer version.
+    Once `ttl_seconds` have passed since the last check, the stale catalog is
+    still served while one background thread per worker, holding a lease in the
+    row so only one worker downloads at a time, revalidates it with
+    ETag / If-Modified-Since. A cold store raises CatalogWarming immediately.
+    After a failed refresh no worker tries again for `retry_seconds`.
+    """
+
+    def __init__(self, source: str, url: str, parse):
+        self.source = source
+        self.url = url
+        self.parse = parse
+        self._lock = threading.Lock()
+        self._version = None
+        self._jobs = []
+        self._thread = None
+        self._last_diff = None
+        self._stats = {
+            "memory_hits": 0, "db_loads": 0, "stale_served": 0, "cold_misses": 0,
+            "refreshes": 0, "updated": 0, "not_modified": 0, "unchanged": 0, "errors": 0,
+            "retries_deferred": 0,
+        }
+
+    def get_jobs(self, conn, app, force_refresh: bool = False) -> list[dict]:
+        if force_refresh:
+            self.refresh(conn, fixture_path=app.config.get("JOBS_CATALOG_FIXTURE"))
+
+        meta = JobCatalogDAO(conn).get_meta(self.source)
+        if meta is None or not meta["version"]:
+            self._bump("cold_misses")
+            self._schedule_unless_failed(app, meta)
+            raise CatalogWarming()
+
+        if time.time() - (meta["checked_at"] or 0) >= app.config["JOBS_CATALOG_TTL_SECONDS"]:
+            self._bump("stale_served")
+            self._schedule_unless_failed(app, meta)
+        return self._jobs_for_version(conn, int(meta["version"]))
+
+    def _jobs_for_version(self, conn, version: int) -> list[dict]:
+        with self._lock:
+            if version == self._version:
+                self._stats["memory_hits"] += 1
+                return self._jobs
+        stored_version, jobs = JobCatalogDAO(conn).load_jobs(self.source)
+        with self._lock:
+            self._stats["db_loads"] += 1
+            if self._version is None or stored_version > self._version:
+                self._version, self._jobs = stored_version, jobs
+            return self._jobs
+
+    def refresh(self, conn, fixture_path=None, timeout: int = 15) -> dict:
+        """
+        Revalidate the stored catalog now, from `fixture_path` (a saved README)
+        if given, else from the network. The caller's lease, if any, is released.
+        """
+        dao = JobCatalogDAO(conn)
+        meta = dao.get_meta(self.source)
+        now = time.time()
+        self._bump("refreshes")
+        try:
+            if fixture_path:
+                with open(fixture_path, encoding="utf-8") as f:
+                    fetched = (f.read(), None, None)
+            else:
+                fetched = fetch_conditional(
+                    self.url,
+                    etag=meta["etag"] if meta else None,
+                    last_modified=meta["last_modified"] if meta else None,
+                    timeout=timeout,
+                )
+            if fetched is None:
+                dao.touch(self.source, None, None, now)
+                self._bump("not_modified")
+                return {"status": "not_modified", "version": int(meta["version"])}
+
+            markdown, etag, last_modified = fetched
+            content_hash = hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+            if meta is not None and meta["version"] and meta["content_hash"] == content_hash:
+                dao.touch(self.source, etag, last_modified, now)
+                self._bump("unchanged")
+                return {"status": "unchanged", "version": int(meta["version"])}
+
+            jobs = self.parse(markdown)
+            stats = diff_stats(diff_catalogs(self._stored_jobs(conn, meta), jobs))
+            version = dao.store(self.source, jobs, content_hash, etag, last_modified, now, stats)
+        except Exception:
+            self._bump("errors")
+            conn.rollback()
+            dao.fail(self.source, time.time())
+            raise
+
+        self._bump("updated")
+        with self._lock:
+            self._version, self._jobs = version, jobs
+            self._last_diff = stats
+        return {"status": "updated", "version": version, "jobs": len(jobs), "diff": stats}
+
+    def _stored_jobs(self, conn, meta) -> list[dict]:
+        """The catalog the refresh replaces, from memory when this worker holds that version."""
+        if meta is None or not meta["version"]:
+            return []
+        with self._lock:
+            if self._version == meta["version"]:
+                return self._jobs
+        return JobCatalogDAO(conn).load_jobs(self.source)[1]
+
+    def _retry_pending(self, app, meta, now: float) -> bool:
+        """True while the last refresh failed less than JOBS_CATALOG_RETRY_SECONDS ago."""
+        failed_at = meta["failed_at"] if meta is not None else None
+        return failed_at is not None and now - failed_at < app.config["JOBS_CATALOG_RETRY_SECONDS"]
+
+    def _schedule_unless_failed(self, app, meta) -> None:
+        if self._retry_pending(app, meta, time.time()):
+            self._bump("retries_deferred")
+            return
+        self.schedule_refresh(app)
+
+    def schedule_refresh(self, app) -> bool:
+        """Start a background refresh unless this worker already has one running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._thread = threading.Thread(
+                target=self._background_refresh,
+                args=(app,),
+                name="job-catalog-refresh",
+                daemon=True,
+            )
+            self._thread.start()
+            return True
+
+    def wait(self, timeout=None) -> None:
+        """Block until the background refresh, if any, finishes (CLI and tests)."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _background_refresh(self, app) -> None:
+        with app.app_context():
+            conn = get_db()
+            dao = JobCatalogDAO(conn)
+            now = time.time()
+            if not dao.claim_refresh(self.source, now):
+                return
+            meta = dao.get_meta(self.source)
+            if meta["version"] and now - (meta["checked_at"] or 0) < app.config["JOBS_CATALOG_TTL_SECONDS"]:
+                dao.release(self.source)  # another worker refreshed it meanwhile
+                return
+            if self._retry_pending(app, meta, now):
+                dao.release(self.source)  # another worker's refresh just failed
+                return
+            try:
+                self.refresh(conn, fixture_path=app.config.get("JOBS_CATALOG_FIXTURE"))
+            except Exception as exc:
+                app.logger.error(f"Job catalog refresh failed: {exc}")
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "version": self._version,
+                "jobs": len(self._jobs),
+                "last_diff": self._last_diff,
+            }
@@ -0,0 +1,189 @@
+# backend/app/features/keywords/details.py
+
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from ...services.sqlite_cache import SQLiteTTLCache
+
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MAX_AGE_SECONDS = 60 * 60 * 6
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+DEFAULT_WAIT_SECONDS = 30
+
+
+class JobDetailsCache(SQLiteTTLCache):
+    """
+    SQLite-backed cache of parsed Simplify job pages, keyed by URL.
+
+    Expiry, LRU eviction and error handling come from SQLiteTTLCache.
+    """
+
+    table = "job_details_cache"
+    key_column = "url"
+    created_column = "fetched_at"
+    label = "Job details cache"
+    schema = """
+        CREATE TABLE IF NOT EXISTS job_details_cache (
+          url TEXT PRIMARY KEY,
+          details_json TEXT NOT NULL,
+          fetched_at REAL NOT NULL,
+          last_accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_details_last_accessed
+          ON job_details_cache (last_accessed_at);
+    """
+
+    def __init__(self, path: str | None = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS):
+        super().__init__(path, max_entries, max_age_seconds)
+
+    def get(self, url: str) -> dict | None:
+        row = self._read(url, "details_json")
+        return json.loads(row[0]) if row else None
+
+    def put(self, url: str, details: dict) -> int:
+        """Store `details`; returns how many entries were evicted."""
+        now = time.time()
+        return self._write(
+            """
+            INSERT OR REPLACE INTO job_details_cache (url, details_json, fetched_at, last_accessed_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (url, json.dumps(details), now, now),
+        )
+
+
+class JobDetailsService:
+    """
+    Cached, coalesced and concurrency-limited job-details fetching.
+
+    A URL that is already being fetched is not fetched again: later callers
+    wait for the first one's result. Batches fetch their cache misses on a
+    bounded thread pool, and at most `per_host` requests run against any one
+    host at a time.
+    """
+
+    def __init__(self, cache: JobDetailsCache | None = None, workers: int = DEFAULT_WORKERS,
+                 per_host: int = DEFAULT_PER_HOST, wait_seconds: float = DEFAULT_WAIT_SECONDS):
+        self.cache = cache or JobDetailsCache()
+        self.workers = workers
+        self.per_host = per_host
+        self.wait_seconds = wait_seconds
+        self._lock = threading.Lock()
+        self._executor = None
+        self._inflight = {}
+        self._host_limits = {}
+        self._stats = {"hits": 0, "misses": 0, "fetches": 0, "coalesced": 0, "errors": 0, "evictions": 0}
+
+    def configure(self, path=None, max_entries=None, max_age_seconds=None, workers=None, per_host=None) -> None:
+        with self._lock:
+            if path is not None:
+                self.cache.path = path
+            if max_entries is not None:
+                self.cache.max_entries = int(max_entries)
+            if max_age_seconds is not None:
+                self.cache.max_age_seconds = int(max_age_seconds)
+            if workers is not None and int(workers) != self.workers:
+                self.workers = int(workers)
+                self._executor = None
+            if per_host is not None and int(per_host) != self.per_host:
+                self.per_host = int(per_host)
+                self._host_limits = {}
+
+    def get(self, url: str, fetch) -> dict:
+        """Details for one URL, from the cache or a (coalesced) fetch; fetch errors propagate."""
+        cached = self.cache.get(url)
+        if cached is not None:
+            self._bump("hits")
+            return cached
+        self._bump("misses")
+        return self._fetch_once(url, fetch)
+
+    def get_many(self, urls: list[str], fetch):
+        """Return ({url: details}, {url: exception}, cache hits) for the unique `urls`."""
+        results, errors, missing = {}, {}, []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url)
+            if cached is None:
+                missing.append(url)
+            else:
+                results[url] = cached
+        cache_hits = len(results)
+        self._bump("hits", cache_hits)
+        self._bump("misses", len(missing))
+
+        futures = {url: self._get_executor().submit(self._fetch_once, url, fetch) for url in missing}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception as exc:
+                errors[url] = exc
+        return results, errors, cache_hits
+
+    def _fetch_once(self, url: str, fetch) -> dict:
+        with self._lock:
+            pending = self._inflight.get(url)
+            if pending is None:
+                pending = self._inflight[url] = Future()
+                leader = True
+            else:
+                self._stats["coalesced"] += 1
+                leader = False
+        if not leader:
+            return pending.result(timeout=self.wait_seconds)
+
+        try:
+            details = self.cache.get(url)  # a fetch may have finished just before we led
+            if details is None:
+                with self._host_slot(url):
+                    self._bump("fetches")
+                    details = fetch(url)
+                self._bump("evictions", self.cache.put(url, details))
+        except BaseException as exc:
+            self._bump("errors")
+            pending.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+        pending.set_result(details)
+        return details
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(max(1, self.per_host))
+        with limit:
+            yield
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.workers),
+                    thread_name_prefix="job-details",
+                )
+            return self._executor
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["enabled"] = self.cache.active
+        return stats
+
+
+job_details = JobDetailsService()
@@ -0,0 +1,179 @@
+# backend/app/features/keywords/search_index.py
+
+from bisect import bisect_left
+from collections import Counter
+import re
+
+SEARCH_FIELDS = ("company", "role", "location", "category")
+_TOKEN_RE = re.compile(r"\w+")
+# Joins the lowercased fields of a job so one `in` test covers all four; a
+# query containing it can never match across fields, so it takes the slow path.
+_FIELD_SEPARATOR = "\x00"
+_RUN_CACHE_SIZE = 4096
+
+
+class JobSearchIndex:
+    """
+    Inverted index over the new-grad catalog for `GET /jobs/new-grad`.
+
+    Results are exactly those of the original filter: `search` must be a
+    substring of the lowercased company, role, location or category, and
+    `category` must equal the lowercased category. Matches keep catalog order.
+
+    Each word run of the query narrows the candidates through token postings.
+    A run with a non-word character before it in the query must start a token,
+    one with a non-word character after it must end one; so interior runs are
+    exact token lookups, a leading run is a suffix scan, a trailing run a
+    prefix range on the sorted vocabulary, and a lone run a vocabulary
+    substring scan. Multi-run queries are then verified against the
+    pre-lowercased fields.
+    """
+
+    def __init__(self, jobs: list[dict]):
+        fields = [_lowered_fields(job) for job in jobs]
+        joined = [_FIELD_SEPARATOR.join(row) for row in fields]
+        postings = {}
+        for index, text in enumerate(joined):
+            for token in set(_TOKEN_RE.findall(text)):
+                postings.setdefault(token, []).append(index)
+        self._assign(jobs, fields, joined, postings)
+
+    def _assign(self, jobs, fields, joined, postings) -> None:
+        self.jobs = jobs
+        self._fields = fields
+        self._joined = joined
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+
+        self._buckets = {}
+        for index, row in enumerate(fields):
+            self._buckets.setdefault(row[3], []).append(index)
+
+        self.category_counts = dict(sorted(Counter(job["category"] for job in jobs).items()))
+        self.categories = list(self.category_counts)
+        self._run_cache = {}
+
+    def updated(self, jobs: list[dict]) -> "JobSearchIndex":
+        """
+        Index for a refreshed catalog. Rows whose id and searchable fields are
+        unchanged keep their lowercased fields and postings (moved to their new
+        positions); only added and edited rows are tokenized again.
+        """
+        old_positions = {job["id"]: index for index, job in enumerate(self.jobs)}
+        if len(old_positions) != len(self.jobs) or len({job["id"] for job in jobs}) != len(jobs):
+            return JobSearchIndex(jobs)  # ids must be unique to line rows up
+
+        old_jobs = self.jobs
+        remap = [-1] * len(old_jobs)
+        fields, joined, fresh = [], [], []
+        for position, job in enumerate(jobs):
+            old = old_positions.get(job["id"])
+            row = self._fields[old] if old is not None else None
+            if row is not None and job != old_jobs[old] and _lowered_fields(job) != row:
+                row = None
+            if row is None:
+                row = _lowered_fields(job)
+                joined.append(_FIELD_SEPARATOR.join(row))
+                fresh.append(position)
+            else:
+                joined.append(self._joined[old])
+                remap[old] = position
+            fields.append(row)
+
+        postings = {}
+        for token, positions in self._postings.items():
+            moved = [remap[index] for index in positions if remap[index] >= 0]
+            if moved:
+                postings[token] = moved
+        for position in fresh:
+            for token in set(_TOKEN_RE.findall(joined[position])):
+                postings.setdefault(token, []).append(position)
+
+        index = JobSearchIndex.__new__(JobSearchIndex)
+        index._assign(jobs, fields, joined, postings)
+        return index
+
+    def search(self, search: str = "", category: str = "", offset: int = 0, limit: int | None = None):
+        """Return (total matches, jobs in [offset, offset + limit))."""
+        matches = self.match_indices(search, category)
+        stop = None if limit is None else offset + limit
+        return len(matches), [self.jobs[index] for index in matches[offset:stop]]
+
+    def match_indices(self, search: str = "", category: str = "") -> list[int]:
+        candidates = None
+        if category and category != "all":
+            candidates = self._buckets.get(category, [])
+            if not candidates:
+                return []
+
+        if not search:
+            return list(candidates) if candidates is not None else list(range(len(self.jobs)))
+
+        found, needs_verify = self._search_candidates(search)
+        if found is None:
+            pool = candidates if candidates is not None else range(len(self.jobs))
+            return self._verify(pool, search)
+
+        if candidates is not None:
+            found = found.intersection(candidates)
+        matches = sorted(found)
+        if needs_verify:
+            matches = self._verify(matches, search)
+        return matches
+
+    def _verify(self, indices, search: str) -> list[int]:
+        if _FIELD_SEPARATOR in search:
+            fields = self._fields
+            return [index for index in indices if any(search in field for field in fields[index])]
+        joined = self._joined
+        return [index for index in indices if search in joined[index]]
+
+    def _search_candidates(self, search: str):
+        """Return (candidate set, needs_verify); (None, True) when the query has no word runs."""
+        runs = list(_TOKEN_RE.finditer(search))
+        if not runs:
+            return None, True
+
+        postings = sorted(
+            (
+                self._run_postings(run.group(), run.start() > 0, run.end() < len(search))
+                for run in runs
+            ),
+            key=len,
+        )
+        found = set(postings[0])
+        for other in postings[1:]:
+            if not found:
+                break
+            found &= other
+        # A lone run with no punctuation around it is the whole query: postings are exact.
+        return found, not (len(runs) == 1 and runs[0].group() == search)
+
+    def _run_postings(self, run: str, starts_token: bool, ends_token: bool) -> frozenset:
+        key = (run, starts_token, ends_token)
+        cached = self._run_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if starts_token and ends_token:
+            tokens = [run] if run in self._postings else []
+        elif starts_token:
+            tokens = []
+            position = bisect_left(self._vocabulary, run)
+            while position < len(self._vocabulary) and self._vocabulary[position].startswith(run):
+                tokens.append(self._vocabulary[position])
+                position += 1
+        elif ends_token:
+            tokens = [token for token in self._vocabulary if token.endswith(run)]
+        else:
+            tokens = [token for token in self._vocabulary if run in token]
+
+        result = frozenset(index for token in tokens for index in self._postings[token])
+        if len(self._run_cache) >= _RUN_CACHE_SIZE:
+            self._run_cache.clear()
+        self._run_cache[key] = result
+        return result
+
+
+def _lowered_fields(job: dict) -> tuple:
+    return tuple(job[name].lower() for name in SEARCH_FIELDS)
@@ -0,0 +1,240 @@
+# backend/app/features/keywords/service.py
+
+import hashlib
+import threading
+
+_stats = {"hits": 0, "misses": 0, "writes": 0, "invalidations": 0}
+_stats_lock = threading.Lock()
+
+
+def _bump(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def chunk_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ChunkEmbeddingDAO:
+    """Resume chunk embeddings stored as float32 BLOBs, keyed by (resume, chunk hash, model)."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def load(self, resume_id: int, model_name: str, hashes: list[str]) -> dict:
+        if not hashes:
+            return {}
+        placeholders = ",".join("?" for _ in hashes)
+        rows = self.conn.execute(
+            f"""
+            SELECT chunk_hash, dim, embedding
+            FROM resume_chunk_embeddings
+            WHERE resume_id = ? AND model_name = ? AND chunk_hash IN ({placeholders})
+            """,
+            (resume_id, model_name, *hashes),
+        ).fetchall()
+        return {row["chunk_hash"]: (row["dim"], row["embedding"]) for row in rows}
+
+    def save(self, resume_id: int, model_name: str, entries: list[tuple]) -> None:
+        """Store entries: [(chunk_hash, float32 vector), ...]; the caller commits."""
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO resume_chunk_embeddings
+              (resume_id, chunk_hash, model_name, dim, embedding)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (resume_id, digest, model_name, int(vector.shape[0]), vector.tobytes())
+                for digest, vector in entries
+            ],
+        )
+
+    def delete_for_resume(self, resume_id: int) -> None:
+        """Drop a resume's embeddings; the caller commits."""
+        self.conn.execute("DELETE FROM resume_chunk_embeddings WHERE resume_id = ?", (resume_id,))
+        _bump("invalidations")
+
+    def delete_for_user(self, user_id: int) -> None:
+        """Drop embeddings for every resume of a user; the caller commits."""
+        self.conn.execute(
+            """
+            DELETE FROM resume_chunk_embeddings
+            WHERE resume_id IN (SELECT id FROM resumes WHERE user_id = ?)
+            """,
+            (user_id,),
+        )
+        _bump("invalidations")
+
+
+def encode_resume_chunks(conn, model, model_name: str, resume_id: int, chunks: list[str]):
+    """
+    Return a float32 (len(chunks), dim) matrix of normalized chunk embeddings,
+    encoding only the chunks that are not stored for this resume and model yet.
+    """
+    import numpy as np
+
+    dao = ChunkEmbeddingDAO(conn)
+    hashes = [chunk_hash(chunk) for chunk in chunks]
+    stored = dao.load(resume_id, model_name, hashes)
+    missing = [index for index, digest in enumerate(hashes) if digest not in stored]
+    _bump("hits", len(chunks) - len(missing))
+    _bump("misses", len(missing))
+
+    vectors = {
+        digest: np.frombuffer(blob, dtype=np.float32, count=dim)
+        for digest, (dim, blob) in stored.items()
+    }
+    if missing:
+        encoded = np.asarray(
+            model.encode([chunks[index] for index in missing], normalize_embeddings=True),
+            dtype=np.float32,
+        )
+        new_entries = list(dict(
+            (hashes[index], vector) for index, vector in zip(missing, encoded)
+        ).items())
+        dao.save(resume_id, model_name, new_entries)
+        conn.commit()
+        _bump("writes", len(new_entries))
+        vectors.update(new_entries)
+
+    return np.stack([vectors[digest] for digest in hashes])
+
+
+def top_k_indices(scores, k: int):
+    """
+    Indices of the k highest scores, highest first; ties keep ascending index
+    order (same as a stable `sorted(..., reverse=True)`).
+    """
+    import numpy as np
+
+    count = len(scores)
+    if k <= 0 or count == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= count:
+        return np.argsort(-scores, kind="stable")
+
+    # Partition first, then widen the cut to every score tied with the k-th
+    # so the stable sort below decides ties exactly like a full sort would.
+    kth = np.partition(scores, count - k)[count - k]
+    candidates = np.flatnonzero(scores >= kth)
+    order = np.argsort(-scores[candidates], kind="stable")
+    return candidates[order][:k]
+
+
+def embedding_cache_stats() -> dict:
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    return stats
+
+
+class JobCatalogIndex:
+    """
+    Embedding matrix for the new-grad job catalog.
+
+    Rows are keyed by `description_seed`: on a catalog refresh, rows whose seed
+    was already indexed are copied over from the previous matrix and only new
+    or edited descriptions are encoded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._model_name = None
+        self._fingerprint = None
+        self._jobs = []
+        self._matrix = None
+        self._stats = {"syncs": 0, "rebuilds": 0, "encoded": 0, "reused": 0}
+
+    def sync(self, jobs: list[dict], model, model_name: str):
+        """Bring the index in line with `jobs`; returns (jobs, matrix) for searching."""
+        import numpy as np
+
+        seeds = tuple(job["description_seed"] for job in jobs)
+        fingerprint = (model_name, seeds)
+        with self._lock:
+            self._stats["syncs"] += 1
+            if fingerprint == self._fingerprint:
+                return self._jobs, self._matrix
+
+            previous_rows = {}
+            if model_name == self._model_name and self._matrix is not None:
+                previous_rows = {job["description_seed"]: row for row, job in enumerate(self._jobs)}
+            source_rows = np.fromiter(
+                (previous_rows.get(seed, -1) for seed in seeds), dtype=np.intp, count=len(seeds)
+            )
+            new_seeds = list(dict.fromkeys(seed for seed, row in zip(seeds, source_rows) if row < 0))
+
+            encoded = None
+            if new_seeds:
+                encoded = np.asarray(model.encode(new_seeds, normalize_embeddings=True), dtype=np.float32)
+                self._stats["encoded"] += len(new_seeds)
+            if encoded is not None:
+                dim = encoded.shape[1]
+            elif previous_rows:
+                dim = self._matrix.shape[1]
+            else:
+                dim = 0
+
+            matrix = np.empty((len(seeds), dim), dtype=np.float32)
+            kept = source_rows >= 0
+            matrix[kept] = self._matrix[source_rows[kept]] if kept.any() else 0
+            if encoded is not None:
+                encoded_row = {seed: row for row, seed in enumerate(new_seeds)}
+                missing = np.flatnonzero(~kept)
+                matrix[missing] = encoded[[encoded_row[seeds[index]] for index in missing]]
+            self._stats["reused"] += int(kept.sum())
+
+            self._model_name = model_name
+            self._jobs = list(jobs)
+            self._matrix = matrix
+            self._fingerprint = fingerprint
+            self._stats["rebuilds"] += 1
+            return self._jobs, self._matrix
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "jobs": len(self._jobs), "model": self._model_name}
+
+
+job_catalog_index = JobCatalogIndex()
+
+
+def filter_job_indices(jobs: list[dict], category: str = "", location: str = "") -> list[int]:
+    category = (category or "").strip().lower()
+    location = (location or "").strip().lower()
+    return [
+        index for index, job in enumerate(jobs)
+        if (not category or category == "all" or job["category"].lower() == category)
+        and (not location or location in job["location"].lower())
+    ]
+
+
+def rank_jobs_semantic(jobs, matrix, resume_embeddings, candidates: list[int], k: int) -> list[tuple]:
+    """Top-k (job index, score) by cosine similarity to the mean resume chunk embedding."""
+    import numpy as np
+
+    if not candidates:
+        return []
+    profile = np.asarray(resume_embeddings, dtype=np.float32).mean(axis=0)
+    norm = float(np.linalg.norm(profile))
+    if norm:
+        profile /= norm
+    candidate_index = np.asarray(candidates, dtype=np.intp)
+    scores = matrix[candidate_index] @ profile
+    return [
+        (int(candidate_index[position]), float(scores[position]))
+        for position in top_k_indices(scores, k)
+    ]
+
+
+def rank_jobs_lexical(jobs, resume_keywords: set, job_keywords, candidates: list[int], k: int) -> list[tuple]:
+    """Fallback ranking: share of each job's keywords that appear in the resume."""
+    scored = []
+    for index in candidates:
+        keywords = job_keywords(jobs[index])
+        score = len(keywords & resume_keywords) / len(keywords) if keywords else 0.0
+        scored.append((index, score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:k]
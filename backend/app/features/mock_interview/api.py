@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from backend.app.common.wire import get_db_conn
@@ -37,23 +37,17 @@ def create_interview_session():
         user_id = _current_user_id()
         conn = get_db_conn()
 
-        try:
-            questions = build_question_set(role, company, question_count)
-            session_id = create_session(conn, user_id, role, company, questions)
-            return jsonify(
-                {
-                    "session_id": session_id,
-                    "role": role,
-                    "company": company,
-                    "questions": questions,
-                    "message": "Session created successfully",
-                }
-            ), 201
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        questions = build_question_set(role, company, question_count)
+        session_id = create_session(conn, user_id, role, company, questions)
+        return jsonify(
+            {
+                "session_id": session_id,
+                "role": role,
+                "company": company,
+                "questions": questions,
+                "message": "Session created successfully",
+            }
+        ), 201
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -76,24 +70,16 @@ def get_feedback():
         if not question_prompt:
             return jsonify({"error": "Question prompt is required"}), 400
 
-        user_id = _current_user_id()
-        conn = get_db_conn()
+        _current_user_id()
+        ai_helper = AIHelper()
+        feedback = ai_helper.generateInterviewFeedback(
+            question_prompt,
+            answer_text,
+            role,
+            company,
+        )
 
-        try:
-            ai_helper = AIHelper()
-            feedback = ai_helper.generateInterviewFeedback(
-                question_prompt,
-                answer_text,
-                role,
-                company,
-            )
-
-            return jsonify(feedback), 200
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        return jsonify(feedback), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -118,18 +104,22 @@ def submit_interview():
         user_id = _current_user_id()
         conn = get_db_conn()
 
-        try:
-            result = submit_answers(conn, session_id, user_id, answers, role, company)
-
-            # ✅ Award +20 points for completing a mock interview (only if submit succeeded)
-            award_mock_interview_completed(user_id)
-
-            return jsonify(result), 200
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        result = submit_answers(
+            conn,
+            session_id,
+            user_id,
+            answers,
+            role,
+            company,
+            grading_mode=current_app.config.get("INTERVIEW_GRADING_MODE", "serial"),
+            max_workers=current_app.config.get("INTERVIEW_GRADING_MAX_WORKERS", 4),
+            timeout_seconds=current_app.config.get("INTERVIEW_GRADING_TIMEOUT_SECONDS", 20.0),
+        )
+
+        # ✅ Award +20 points for completing a mock interview (only if submit succeeded)
+        award_mock_interview_completed(user_id)
+
+        return jsonify(result), 200
     except PermissionError as e:
         return jsonify({"error": str(e)}), 403
     except ValueError as e:
@@ -145,16 +135,10 @@ def get_interview_session(session_id: int):
     try:
         user_id = _current_user_id()
         conn = get_db_conn()
-        try:
-            detail = get_session_detail(conn, session_id, user_id)
-            if detail is None:
-                return jsonify({"error": "Session not found"}), 404
-            return jsonify(detail), 200
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        detail = get_session_detail(conn, session_id, user_id)
+        if detail is None:
+            return jsonify({"error": "Session not found"}), 404
+        return jsonify(detail), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -167,14 +151,8 @@ def get_user_sessions():
         user_id = _current_user_id()
         conn = get_db_conn()
 
-        try:
-            dao = MockInterviewDAO(conn)
-            sessions = dao.list_user_sessions_summary(user_id)
-            return jsonify({"sessions": sessions}), 200
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        dao = MockInterviewDAO(conn)
+        sessions = dao.list_user_sessions_summary(user_id)
+        return jsonify({"sessions": sessions}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
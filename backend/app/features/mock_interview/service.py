@@ -1,9 +1,16 @@
 # backend/app/features/mock_interview/service.py
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 import json
+import math
+import time
 from backend.app.services.ai_helper import AIHelper
 
+GRADING_MODES = ("serial", "concurrent", "batch")
+DEFAULT_GRADING_WORKERS = 4
+DEFAULT_GRADING_TIMEOUT_SECONDS = 20.0
+
 
 class MockInterviewDAO:
     def __init__(self, conn):
@@ -73,6 +80,43 @@ class MockInterviewDAO:
         )
         self.conn.commit()
 
+    def save_submission(
+        self,
+        interview_id: int,
+        answer_rows: list[tuple],
+        submitted_at: str,
+        average_score: float,
+        total_score: float,
+    ):
+        """Replace the answers and summary of an interview in a single transaction.
+
+        answer_rows: (qid, prompt, answer, feedback_json) tuples.
+        """
+        try:
+            self.conn.execute("DELETE FROM answers WHERE interview_id = ?", (interview_id,))
+            self.conn.executemany(
+                """
+                INSERT INTO answers (interview_id, qid, prompt, answer, feedback_json)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (interview_id, qid, prompt, answer, json.dumps(feedback) if feedback else None)
+                    for qid, prompt, answer, feedback in answer_rows
+                ],
+            )
+            self.conn.execute(
+                """
+                UPDATE interviews
+                SET submitted_at = ?, average_score = ?, total_score = ?
+                WHERE id = ?
+                """,
+                (submitted_at, average_score, total_score, interview_id),
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
     def get_interview(self, interview_id: int):
         row = self.conn.execute(
             """
@@ -149,13 +193,160 @@ def get_feedback_for_answer(
     return ai_helper.generateInterviewFeedback(question, answer, role, company)
 
 
+def _collect_answer_items(answers: dict) -> list[dict]:
+    """Flatten the submitted {qid: answer} payload, keeping the original qid order."""
+    items = []
+    for qid, answer_data in answers.items():
+        if isinstance(answer_data, dict):
+            answer_text = answer_data.get("answer", "")
+            question_prompt = answer_data.get("prompt", f"Question {qid}")
+        else:
+            answer_text = answer_data
+            question_prompt = f"Question {qid}"
+
+        if not answer_text or not answer_text.strip():
+            continue
+        items.append({"qid": qid, "prompt": question_prompt, "answer": answer_text})
+    return items
+
+
+def _grade_serial(ai_helper, items: list[dict], role: str, company: str) -> list[dict]:
+    results = []
+    for item in items:
+        started = time.perf_counter()
+        feedback = ai_helper.generateInterviewFeedback(
+            item["prompt"], item["answer"], role, company
+        )
+        results.append({
+            "feedback": feedback,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+            "timed_out": False,
+        })
+    return results
+
+
+def _grade_batch(ai_helper, items: list[dict], role: str, company: str) -> list[dict]:
+    """Grade every answer with one LLM call; latency is shared by all answers."""
+    started = time.perf_counter()
+    feedbacks = ai_helper.generateInterviewFeedbackBatch(
+        [
+            {"id": item["qid"], "question": item["prompt"], "answer": item["answer"]}
+            for item in items
+        ],
+        role,
+        company,
+    )
+    latency = round((time.perf_counter() - started) * 1000, 2)
+    return [
+        {"feedback": feedback, "latency_ms": latency, "timed_out": False}
+        for feedback in feedbacks
+    ]
+
+
+def _grade_concurrent(
+    ai_helper,
+    items: list[dict],
+    role: str,
+    company: str,
+    max_workers: int,
+    timeout_seconds: float,
+) -> list[dict]:
+    """
+    Grade answers on a bounded worker pool.
+
+    Each call gets `timeout_seconds` from the moment it starts; calls that run
+    over (or never get a worker before the batch deadline) are graded with the
+    local heuristic instead. Results are returned in the order of `items`.
+    """
+    results: list[dict | None] = [None] * len(items)
+    started_at: dict[int, float] = {}
+
+    def grade(index: int, item: dict):
+        started_at[index] = time.perf_counter()
+        return ai_helper.generateInterviewFeedback(
+            item["prompt"], item["answer"], role, company
+        )
+
+    def fallback(index: int, timed_out: bool) -> dict:
+        item = items[index]
+        began = started_at.get(index, batch_started)
+        return {
+            "feedback": ai_helper._heuristic_feedback(item["prompt"], item["answer"], role, company),
+            "latency_ms": round((time.perf_counter() - began) * 1000, 2),
+            "timed_out": timed_out,
+        }
+
+    workers = max(1, min(int(max_workers), len(items)))
+    batch_started = time.perf_counter()
+    # Queued calls still get a full timeout once they start; this bounds the whole batch.
+    deadline = batch_started + timeout_seconds * math.ceil(len(items) / workers)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="interview-grader")
+    futures = {executor.submit(grade, index, item): index for index, item in enumerate(items)}
+    pending = set(futures)
+    try:
+        while pending:
+            now = time.perf_counter()
+            wake_at = [deadline] + [
+                started_at[futures[f]] + timeout_seconds
+                for f in pending if futures[f] in started_at
+            ]
+            done, pending = wait(
+                pending,
+                timeout=max(0.01, min(wake_at) - now),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = {
+                        "feedback": future.result(),
+                        "latency_ms": round((time.perf_counter() - started_at[index]) * 1000, 2),
+                        "timed_out": False,
+                    }
+                except Exception as e:
+                    print(f"❌ Interview grading failed for {items[index]['qid']}: {e}. Falling back to heuristics.")
+                    results[index] = fallback(index, timed_out=False)
+
+            now = time.perf_counter()
+            for future in list(pending):
+                index = futures[future]
+                if now >= deadline or (
+                    index in started_at and now - started_at[index] >= timeout_seconds
+                ):
+                    future.cancel()
+                    pending.discard(future)
+                    results[index] = fallback(index, timed_out=True)
+    finally:
+        # Do not block the request on calls that already timed out.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
 def submit_answers(
-    conn, session_id: int, user_id: int, answers: dict, role: str, company: str
+    conn,
+    session_id: int,
+    user_id: int,
+    answers: dict,
+    role: str,
+    company: str,
+    grading_mode: str = "serial",
+    max_workers: int = DEFAULT_GRADING_WORKERS,
+    timeout_seconds: float = DEFAULT_GRADING_TIMEOUT_SECONDS,
 ) -> dict:
     """
     Submit all answers for an interview session.
     Returns summary with scores and feedback.
+
+    grading_mode: "serial" grades one answer at a time, "concurrent" grades on a
+    bounded worker pool with a per-call timeout and "batch" grades every answer
+    with a single LLM call. Answers are persisted in one transaction once
+    grading has finished.
     """
+    if grading_mode not in GRADING_MODES:
+        raise ValueError(f"Unknown grading mode: {grading_mode}")
+
     dao = MockInterviewDAO(conn)
     ai_helper = AIHelper()
 
@@ -167,38 +358,37 @@ def submit_answers(
     if owner_id is not None and int(owner_id) != int(user_id):
         raise PermissionError("You cannot submit answers for this session")
 
+    items = _collect_answer_items(answers)
+    grading_started = time.perf_counter()
+    if grading_mode == "batch" and items:
+        graded = _grade_batch(ai_helper, items, role, company)
+    elif grading_mode == "concurrent" and len(items) > 1:
+        graded = _grade_concurrent(ai_helper, items, role, company, max_workers, timeout_seconds)
+    else:
+        graded = _grade_serial(ai_helper, items, role, company)
+    grading_ms = round((time.perf_counter() - grading_started) * 1000, 2)
+
     all_feedback = {}
+    latency_ms = {}
+    timed_out = []
     all_scores = []
-
-    dao.delete_answers_for_interview(session_id)
-
-    for qid, answer_data in answers.items():
-        if isinstance(answer_data, dict):
-            answer_text = answer_data.get("answer", "")
-            question_prompt = answer_data.get("prompt", f"Question {qid}")
-        else:
-            answer_text = answer_data
-            question_prompt = f"Question {qid}"
-
-        if not answer_text or not answer_text.strip():
-            continue
-
-        feedback = ai_helper.generateInterviewFeedback(
-            question_prompt, answer_text, role, company
-        )
-        score = float(feedback.get("overall_score", 0))
-
-        all_feedback[qid] = feedback
-        all_scores.append(score)
-
-        dao.save_answer(session_id, qid, question_prompt, answer_text, feedback)
+    answer_rows = []
+    for item, result in zip(items, graded):
+        feedback = result["feedback"]
+        all_feedback[item["qid"]] = feedback
+        latency_ms[item["qid"]] = result["latency_ms"]
+        if result["timed_out"]:
+            timed_out.append(item["qid"])
+        all_scores.append(float(feedback.get("overall_score", 0)))
+        answer_rows.append((item["qid"], item["prompt"], item["answer"], feedback))
 
     average_score = sum(all_scores) / len(all_scores) if all_scores else 0
     total_score = sum(all_scores)
 
     now = datetime.now(timezone.utc).isoformat()
-    dao.update_interview_summary(
+    dao.save_submission(
         session_id,
+        answer_rows,
         now,
         round(average_score, 2),
         round(total_score, 2),
@@ -210,6 +400,12 @@ def submit_answers(
         "average_score": round(average_score, 2),
         "questions_answered": len(answers),
         "feedback": all_feedback,
+        "latency_ms": latency_ms,
+        "grading": {
+            "mode": grading_mode,
+            "elapsed_ms": grading_ms,
+            "timed_out": timed_out,
+        },
         "message": "Interview submitted successfully",
     }
 
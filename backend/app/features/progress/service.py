@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
-from ...db import get_db
+from ...db import get_db, unit_of_work
 
 
 BADGES = [
@@ -14,19 +14,18 @@ BADGES = [
 
 
 def ensure_progress_row(user_id: int) -> None:
-    db = get_db()
-    db.execute(
-        """
-        INSERT OR IGNORE INTO user_progress (user_id, points, best_resume_score, mock_interviews_completed)
-        VALUES (?, 0, 0, 0)
-        """,
-        (user_id,),
-    )
-    db.commit()
+    with unit_of_work() as db:
+        db.execute(
+            """
+            INSERT OR IGNORE INTO user_progress (user_id, points, best_resume_score, mock_interviews_completed)
+            VALUES (?, 0, 0, 0)
+            """,
+            (user_id,),
+        )
 
 
 def _get_progress_row(user_id: int) -> Dict[str, Any]:
-    ensure_progress_row(user_id)
+    # Read-only: a user without a row yet gets the defaults, nothing is inserted
     row = get_db().execute(
         """
         SELECT user_id, points, best_resume_score, mock_interviews_completed
@@ -51,41 +50,35 @@ def _get_badges(user_id: int) -> List[str]:
     return [r["badge_key"] for r in rows]
 
 
-def _award_badge_if_missing(user_id: int, badge_key: str) -> None:
-    db = get_db()
-    db.execute(
-        "INSERT OR IGNORE INTO user_badges (user_id, badge_key) VALUES (?, ?)",
-        (user_id, badge_key),
-    )
-    db.commit()
-
-
 def check_and_award_badges(user_id: int) -> None:
     p = _get_progress_row(user_id)
-    for badge_key, rule in BADGES:
-        if rule(p):
-            _award_badge_if_missing(user_id, badge_key)
+    earned = [(user_id, badge_key) for badge_key, rule in BADGES if rule(p)]
+    if not earned:
+        return
+    with unit_of_work() as db:
+        db.executemany(
+            "INSERT OR IGNORE INTO user_badges (user_id, badge_key) VALUES (?, ?)",
+            earned,
+        )
 
 
 def award_mock_interview_completed(user_id: int) -> None:
-    ensure_progress_row(user_id)
-    db = get_db()
-    db.execute(
-        """
-        UPDATE user_progress
-        SET points = points + 20,
-            mock_interviews_completed = mock_interviews_completed + 1,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE user_id = ?
-        """,
-        (user_id,),
-    )
-    db.commit()
-    check_and_award_badges(user_id)
+    with unit_of_work() as db:
+        ensure_progress_row(user_id)
+        db.execute(
+            """
+            UPDATE user_progress
+            SET points = points + 20,
+                mock_interviews_completed = mock_interviews_completed + 1,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = ?
+            """,
+            (user_id,),
+        )
+        check_and_award_badges(user_id)
 
 
 def award_resume_score(user_id: int, new_score_0_to_100: int) -> None:
-    ensure_progress_row(user_id)
     p = _get_progress_row(user_id)
 
     new_score = int(max(0, min(100, new_score_0_to_100)))
@@ -97,19 +90,19 @@ def award_resume_score(user_id: int, new_score_0_to_100: int) -> None:
     improvement = new_score - best
     points_awarded = (improvement // 5) * 10
 
-    db = get_db()
-    db.execute(
-        """
-        UPDATE user_progress
-        SET points = points + ?,
-            best_resume_score = ?,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE user_id = ?
-        """,
-        (points_awarded, new_score, user_id),
-    )
-    db.commit()
-    check_and_award_badges(user_id)
+    with unit_of_work() as db:
+        ensure_progress_row(user_id)
+        db.execute(
+            """
+            UPDATE user_progress
+            SET points = points + ?,
+                best_resume_score = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = ?
+            """,
+            (points_awarded, new_score, user_id),
+        )
+        check_and_award_badges(user_id)
 
 
 def get_progress_payload(user_id: int) -> Dict[str, Any]:
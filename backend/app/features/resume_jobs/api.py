@@ -0,0 +1,23 @@
+# backend/app/features/resume_jobs/api.py
+
+from flask import Blueprint, current_app, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from ...common.wire import get_db_conn
+from .service import ResumeJobDAO, fail_interrupted_resume_jobs, serialize_job
+
+bp = Blueprint("resume_jobs", __name__, url_prefix="/api/resume/jobs")
+
+
+@bp.get("/<job_id>")
+@jwt_required()
+def get_resume_job(job_id: str):
+    """Report the status, per-stage progress and final result of an async upload."""
+    user_id = int(get_jwt_identity())
+    conn = get_db_conn()
+    # A job left open by a restarted worker would otherwise be polled forever
+    fail_interrupted_resume_jobs(conn, current_app.config["RESUME_JOB_STALE_SECONDS"], job_id)
+    job = ResumeJobDAO(conn).get(job_id)
+    if job is None or int(job["user_id"]) != user_id:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(serialize_job(job)), 200
@@ -0,0 +1,439 @@
+# backend/app/features/resume_jobs/service.py
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import threading
+import time
+from uuid import uuid4
+
+from ...db import get_db, unit_of_work
+from ...services.ai_helper import AIHelper
+from ..progress.service import award_resume_score
+
+JOB_STAGES = ("queued", "parsing", "extracting", "scoring", "storing", "completed")
+HASH_CHUNK_SIZE = 64 * 1024
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class ResumeParseError(Exception):
+    """Raised when no text could be extracted from an uploaded resume."""
+
+
+def _full_text(parsed_resume: dict) -> str:
+    for section in (parsed_resume.get("sections") or []):
+        if section.get("name") == "full_content":
+            return section.get("content") or ""
+    return ""
+
+
+def save_upload_with_hash(file_storage, filepath: str) -> str:
+    """Stream an uploaded file to disk and return its SHA-256 hex digest."""
+    digest = hashlib.sha256()
+    stream = file_storage.stream
+    with open(filepath, "wb") as out:
+        while True:
+            chunk = stream.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.hexdigest()
+
+
+def hash_file(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def edited_content_hash(parsed_json: str) -> str:
+    """
+    content_hash for a resume whose parse was edited. It never equals a file
+    hash, so the edited row is not reused for a later upload of the original
+    file, and backfill-resume-hashes (which only fills NULLs) leaves it alone.
+    """
+    return "edited:" + hashlib.sha256(parsed_json.encode("utf-8")).hexdigest()
+
+
+def find_reusable_resume(conn, user_id: int, content_hash: str):
+    """
+    Return the user's newest resume with the same content. Other users' rows
+    are never reused. Rows whose stored file is gone are skipped.
+    """
+    rows = conn.execute(
+        """
+        SELECT r.id, r.user_id, r.file_path, r.parsed_json, fr.score, fr.summary, fr.details_json
+        FROM resumes r
+        LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
+        WHERE r.content_hash = ? AND r.user_id = ?
+        ORDER BY r.id DESC
+        LIMIT 5
+        """,
+        (content_hash, user_id),
+    ).fetchall()
+    for row in rows:
+        if row["parsed_json"] and row["score"] is not None and os.path.exists(row["file_path"]):
+            return row
+    return None
+
+
+def insert_feedback_report(conn, resume_id: int, score: int, summary, details_json) -> int:
+    """
+    Add a feedback report and point the resume's latest_feedback_id at it.
+    The caller commits, so both writes land in the same transaction.
+    """
+    feedback_id = conn.execute(
+        """
+        INSERT INTO feedback_reports (resume_id, score, summary, details_json)
+        VALUES (?, ?, ?, ?)
+        """,
+        (resume_id, score, summary, details_json),
+    ).lastrowid
+    conn.execute("UPDATE resumes SET latest_feedback_id = ? WHERE id = ?", (feedback_id, resume_id))
+    return feedback_id
+
+
+def reuse_resume(user_id: int, content_hash: str, source, file_path: str, original_name: str | None = None) -> dict:
+    """
+    Store a new upload with the results of an already processed copy of the
+    same file. The new row keeps its own `file_path` and `original_name`.
+    """
+    with unit_of_work() as db_conn:
+        cursor = db_conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO resumes (user_id, file_path, original_name, parsed_json, content_hash)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (user_id, file_path, original_name, source["parsed_json"], content_hash),
+        )
+        resume_db_id = cursor.lastrowid
+        insert_feedback_report(
+            db_conn, resume_db_id, int(source["score"]), source["summary"], source["details_json"]
+        )
+        award_resume_score(int(user_id), int(source["score"]))
+
+    return {
+        "resume_db_id": resume_db_id,
+        "parsed_data": json.loads(source["parsed_json"]),
+        "resume_score": int(source["score"]),
+        "resume_summary": source["summary"],
+        "deduplicated": True,
+    }
+
+
+def remove_resume_file_if_unused(conn, file_path: str) -> None:
+    """Delete a stored upload once no resume row references it any more."""
+    if not file_path:
+        return
+    still_used = conn.execute(
+        "SELECT 1 FROM resumes WHERE file_path = ? LIMIT 1",
+        (file_path,),
+    ).fetchone()
+    if still_used is None and os.path.exists(file_path):
+        os.remove(file_path)
+
+
+def process_resume(
+    user_id: int,
+    filepath: str,
+    on_stage=None,
+    content_hash: str | None = None,
+    original_name: str | None = None,
+) -> dict:
+    """
+    Parse, extract, score and store an uploaded resume file.
+
+    on_stage(stage) is called before each stage starts. Raises ResumeParseError
+    when parsing fails; any other exception means the DB write failed.
+    """
+    def stage(name):
+        if on_stage:
+            on_stage(name)
+
+    ai_helper = AIHelper()
+
+    stage("parsing")
+    parsed_resume_data = ai_helper.parseResume(filepath)
+    if "error" in parsed_resume_data:
+        raise ResumeParseError(parsed_resume_data["error"])
+
+    stage("extracting")
+    parsed_resume_data["extracted_data"] = ai_helper.extractResumeFields(
+        _full_text(parsed_resume_data)
+    )
+
+    stage("scoring")
+    resume_evaluation = ai_helper.scoreResume(parsed_resume_data)
+
+    stage("storing")
+    with unit_of_work() as db_conn:
+        cursor = db_conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO resumes (user_id, file_path, original_name, parsed_json, content_hash)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (user_id, filepath, original_name, json.dumps(parsed_resume_data), content_hash),
+        )
+        resume_db_id = cursor.lastrowid
+        insert_feedback_report(
+            db_conn,
+            resume_db_id,
+            int(resume_evaluation["score"]),
+            resume_evaluation["summary"],
+            json.dumps(resume_evaluation["details"]),
+        )
+        award_resume_score(int(user_id), int(resume_evaluation["score"]))
+
+    return {
+        "resume_db_id": resume_db_id,
+        "parsed_data": parsed_resume_data,
+        "resume_score": int(resume_evaluation["score"]),
+        "resume_summary": resume_evaluation["summary"],
+    }
+
+
+def evaluation_is_stale(details: dict) -> bool:
+    """True for feedback stored before the rubric produced metrics and suggestions."""
+    return (
+        not details or
+        not isinstance(details.get("suggestions"), list) or
+        "metrics" not in details
+    )
+
+
+def store_refreshed_evaluation(conn, resume_id: int, parsed_json: dict, ai_helper=None) -> dict:
+    """
+    Re-score a resume and append the result as its newest feedback_reports row.
+    The caller commits, so several resumes can be upgraded in one transaction.
+    """
+    evaluation = (ai_helper or AIHelper()).scoreResume(parsed_json)
+    insert_feedback_report(
+        conn,
+        resume_id,
+        int(evaluation["score"]),
+        evaluation["summary"],
+        json.dumps(evaluation["details"]),
+    )
+    return evaluation
+
+
+class ResumeJobDAO:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def create(self, user_id: int, file_path: str, original_name: str) -> str:
+        job_id = str(uuid4())
+        self.conn.execute(
+            """
+            INSERT INTO resume_jobs (id, user_id, file_path, original_name, status, stage, stages_json)
+            VALUES (?, ?, ?, ?, 'queued', 'queued', '[]')
+            """,
+            (job_id, user_id, file_path, original_name),
+        )
+        self.conn.commit()
+        return job_id
+
+    def get(self, job_id: str):
+        row = self.conn.execute(
+            """
+            SELECT id, user_id, file_path, original_name, status, stage, stages_json,
+                   resume_id, result_json, error,
+                   CAST(created_at AS TEXT) AS created_at,
+                   CAST(updated_at AS TEXT) AS updated_at
+            FROM resume_jobs
+            WHERE id = ?
+            """,
+            (job_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def update_progress(self, job_id: str, status: str, stage: str, stages: list):
+        self.conn.execute(
+            """
+            UPDATE resume_jobs
+            SET status = ?, stage = ?, stages_json = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (status, stage, json.dumps(stages), job_id),
+        )
+        self.conn.commit()
+
+    def complete(self, job_id: str, stages: list, result: dict):
+        self.conn.execute(
+            """
+            UPDATE resume_jobs
+            SET status = 'completed', stage = 'completed', stages_json = ?,
+                resume_id = ?, result_json = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (json.dumps(stages), result.get("resume_db_id"), json.dumps(result), job_id),
+        )
+        self.conn.commit()
+
+    def fail(self, job_id: str, stages: list, error: str):
+        self.conn.execute(
+            """
+            UPDATE resume_jobs
+            SET status = 'failed', stages_json = ?, error = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (json.dumps(stages), error, job_id),
+        )
+        self.conn.commit()
+
+    def fail_interrupted(self, stale_seconds: int, job_id: str | None = None) -> list:
+        """
+        Fail queued/running jobs with no progress for `stale_seconds`.
+
+        Jobs run on an in-process executor, so a job still open when its
+        worker restarted is never picked up again. Returns the failed jobs'
+        upload paths so the caller can remove them.
+        """
+        query = """
+            SELECT id, file_path FROM resume_jobs
+            WHERE status IN ('queued', 'running') AND updated_at < datetime('now', ?)
+        """
+        params = [f"-{int(stale_seconds)} seconds"]
+        if job_id is not None:
+            query += " AND id = ?"
+            params.append(job_id)
+        rows = self.conn.execute(query, params).fetchall()
+        if not rows:
+            return []
+        self.conn.executemany(
+            """
+            UPDATE resume_jobs
+            SET status = 'failed', error = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status IN ('queued', 'running')
+            """,
+            [("Upload was interrupted by a server restart. Please upload the file again.", row["id"]) for row in rows],
+        )
+        self.conn.commit()
+        return [row["file_path"] for row in rows]
+
+
+class _StageRecorder:
+    """Tracks per-stage start times/durations and persists them on every transition."""
+
+    def __init__(self, dao: ResumeJobDAO, job_id: str):
+        self.dao = dao
+        self.job_id = job_id
+        self.stages = []
+        self._started = None
+
+    def _close_current(self):
+        if self.stages and self._started is not None:
+            self.stages[-1]["duration_ms"] = round((time.perf_counter() - self._started) * 1000, 2)
+
+    def __call__(self, stage: str):
+        self._close_current()
+        self.stages.append({
+            "stage": stage,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": None,
+        })
+        self._started = time.perf_counter()
+        self.dao.update_progress(self.job_id, "running", stage, self.stages)
+
+    def finish(self):
+        self._close_current()
+        self._started = None
+        return self.stages
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, int(max_workers)),
+                thread_name_prefix="resume-job",
+            )
+        return _executor
+
+
+def _run_job(app, job_id: str) -> None:
+    with app.app_context():
+        dao = ResumeJobDAO(get_db())
+        job = dao.get(job_id)
+        if job is None:
+            return
+
+        recorder = _StageRecorder(dao, job_id)
+        try:
+            result = process_resume(
+                int(job["user_id"]),
+                job["file_path"],
+                on_stage=recorder,
+                content_hash=hash_file(job["file_path"]),
+                original_name=job["original_name"],
+            )
+        except ResumeParseError as e:
+            dao.fail(job_id, recorder.finish(), f"Parsing failed: {e}")
+            _remove_file(job["file_path"])
+            return
+        except Exception as e:
+            app.logger.error(f"Resume job {job_id} failed: {e}")
+            get_db().rollback()
+            dao.fail(job_id, recorder.finish(), "Database error during resume upload.")
+            _remove_file(job["file_path"])
+            return
+
+        result.update({
+            "message": "Resume uploaded and parsed successfully",
+            "filename": job["original_name"],
+            "size": os.path.getsize(job["file_path"]),
+        })
+        dao.complete(job_id, recorder.finish(), result)
+
+
+def _remove_file(filepath: str) -> None:
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+
+
+def fail_interrupted_resume_jobs(conn, stale_seconds: int, job_id: str | None = None) -> int:
+    """Fail jobs lost to a worker restart and remove their uploads; returns how many were failed."""
+    file_paths = ResumeJobDAO(conn).fail_interrupted(stale_seconds, job_id)
+    for file_path in file_paths:
+        remove_resume_file_if_unused(conn, file_path)
+    return len(file_paths)
+
+
+def enqueue_resume_job(app, user_id: int, filepath: str, original_name: str) -> str:
+    """Record a queued job for a saved upload and hand it to the background pool."""
+    job_id = ResumeJobDAO(get_db()).create(user_id, filepath, original_name)
+    _get_executor(app.config.get("RESUME_JOB_WORKERS", 2)).submit(_run_job, app, job_id)
+    return job_id
+
+
+def serialize_job(job: dict) -> dict:
+    def _load(raw, default):
+        try:
+            return json.loads(raw) if raw else default
+        except json.JSONDecodeError:
+            return default
+
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "stage": job["stage"],
+        "stages": _load(job.get("stages_json"), []),
+        "filename": job["original_name"],
+        "resume_db_id": job.get("resume_id"),
+        "result": _load(job.get("result_json"), None),
+        "error": job.get("error"),
+        "created_at": job.get("created_at"),
+        "updated_at": job.get("updated_at"),
+    }
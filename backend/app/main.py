@@ -9,6 +9,20 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from . import db
 from .services.ai_helper import AIHelper
 from .features.progress.service import award_resume_score
+from .features.keywords.service import ChunkEmbeddingDAO
+from .features.resume_jobs.service import (
+    ResumeParseError,
+    edited_content_hash,
+    enqueue_resume_job,
+    evaluation_is_stale,
+    find_reusable_resume,
+    insert_feedback_report,
+    process_resume,
+    remove_resume_file_if_unused,
+    reuse_resume,
+    save_upload_with_hash,
+    store_refreshed_evaluation,
+)
 
 bp = Blueprint("main", __name__)
 
@@ -20,7 +34,9 @@ def _current_user_id():
     return int(user_id)
 
 
-def _resume_display_name(file_path: str) -> str:
+def _resume_display_name(file_path: str, original_name: str | None = None) -> str:
+    if original_name:
+        return original_name
     filename = os.path.basename(file_path or "")
     if "_" in filename:
         return filename.split("_", 1)[1]
@@ -51,7 +67,11 @@ def _set_resume_text(parsed_resume: dict, new_text: str) -> dict:
     return parsed_copy
 
 
-def _serialize_resume_row(row) -> dict:
+def _serialize_resume_row(row, conn=None) -> dict:
+    """
+    Shape a resume row for the API. Feedback stored before the current rubric
+    is re-scored once and written back through `conn`; the caller commits.
+    """
     parsed_json = {}
     details_json = {}
     try:
@@ -65,21 +85,16 @@ def _serialize_resume_row(row) -> dict:
 
     score = int(row["score"]) if row["score"] is not None else 0
     summary = row["summary"] or ""
-    needs_refresh = (
-        not details_json or
-        not isinstance(details_json.get("suggestions"), list) or
-        "metrics" not in details_json
-    )
 
-    if parsed_json and needs_refresh:
-        refreshed = AIHelper().scoreResume(parsed_json)
+    if parsed_json and evaluation_is_stale(details_json):
+        refreshed = store_refreshed_evaluation(conn or db.get_db(), int(row["id"]), parsed_json)
         score = int(refreshed["score"])
         summary = refreshed["summary"]
         details_json = refreshed["details"]
 
     return {
         "id": int(row["id"]),
-        "filename": _resume_display_name(row["file_path"]),
+        "filename": _resume_display_name(row["file_path"], row["original_name"]),
         "uploadedAt": row["created_at"],
         "resumeText": _resume_text_from_parsed(parsed_json),
         "resumeScore": score,
@@ -139,53 +154,55 @@ def upload_resume():
     os.makedirs(upload_dir, exist_ok=True)
     filepath = os.path.join(upload_dir, saved_name)
     
-    # 1. Save the file to disk
-    file.save(filepath)
-
-    # 2. Parse the resume content
-    ai_helper = AIHelper()
-    parsed_resume_data = ai_helper.parseResume(filepath)
-
-    # Check if parsing failed before continuing
-    if "error" in parsed_resume_data:
-        os.remove(filepath)
-        return jsonify({"error": f"Parsing failed: {parsed_resume_data['error']}"}), 500
-
-    # 2b. Extract structured fields using LLM
-    full_text = ""
-    for section in (parsed_resume_data.get("sections") or []):
-        if section.get("name") == "full_content":
-            full_text = section.get("content") or ""
-            break
-    parsed_resume_data["extracted_data"] = ai_helper.extractResumeFields(full_text)
+    # 1. Save the file to disk, hashing the stream as it is written
+    content_hash = save_upload_with_hash(file, filepath)
+
+    # Same bytes were already processed: reuse the results; the new upload keeps its own file.
+    duplicate = find_reusable_resume(db.get_db(), user_id, content_hash)
+    if duplicate is not None:
+        try:
+            result = reuse_resume(user_id, content_hash, duplicate, filepath, original_name)
+        except Exception as e:
+            current_app.logger.error(f"Failed to save resume record to DB: {e}")
+            os.remove(filepath)
+            return jsonify({"error": "Database error during resume upload."}), 500
+        finally:
+            db.close_db()
+        return jsonify({
+            "message": "Resume uploaded and parsed successfully",
+            "resume_db_id": result["resume_db_id"],
+            "filename": original_name,
+            "size": size,
+            "parsed_data": result["parsed_data"],
+            "resume_score": result["resume_score"],
+            "resume_summary": result["resume_summary"],
+            "deduplicated": True,
+        }), 200
+
+    # Opt-in async mode: hand parsing/extraction/scoring to the background pool.
+    async_flag = (request.args.get("async") or request.form.get("async") or "").strip().lower()
+    run_async = (
+        async_flag in {"1", "true", "yes"}
+        if async_flag
+        else bool(current_app.config.get("RESUME_UPLOAD_ASYNC", False))
+    )
+    if run_async:
+        job_id = enqueue_resume_job(
+            current_app._get_current_object(), user_id, filepath, original_name
+        )
+        return jsonify({
+            "message": "Resume upload accepted for processing",
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/api/resume/jobs/{job_id}",
+        }), 202
 
-    # 3. Store the record in the database
-    db_conn = db.get_db()
-    cursor = db_conn.cursor()
+    # 2. Parse, extract fields, score and store the resume
     try:
-        resume_evaluation = ai_helper.scoreResume(parsed_resume_data)
-        cursor.execute(
-            """
-            INSERT INTO resumes (user_id, file_path, parsed_json)
-            VALUES (?, ?, ?)
-            """,
-            (user_id, filepath, json.dumps(parsed_resume_data)),
-        )
-        resume_db_id = cursor.lastrowid
-        cursor.execute(
-            """
-            INSERT INTO feedback_reports (resume_id, score, summary, details_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                resume_db_id,
-                int(resume_evaluation["score"]),
-                resume_evaluation["summary"],
-                json.dumps(resume_evaluation["details"]),
-            ),
-        )
-        db_conn.commit()
-        award_resume_score(int(user_id), int(resume_evaluation["score"]))
+        result = process_resume(user_id, filepath, content_hash=content_hash, original_name=original_name)
+    except ResumeParseError as e:
+        os.remove(filepath)
+        return jsonify({"error": f"Parsing failed: {e}"}), 500
     except Exception as e:
         # If DB save fails, log the error and remove the saved file
         current_app.logger.error(f"Failed to save resume record to DB: {e}")
@@ -194,15 +211,15 @@ def upload_resume():
     finally:
         db.close_db()
 
-    # 4. Return success response
+    # 3. Return success response
     return jsonify({
         "message": "Resume uploaded and parsed successfully",
-        "resume_db_id": resume_db_id,
+        "resume_db_id": result["resume_db_id"],
         "filename": original_name,
         "size": os.path.getsize(filepath),
-        "parsed_data": parsed_resume_data,
-        "resume_score": int(resume_evaluation["score"]),
-        "resume_summary": resume_evaluation["summary"],
+        "parsed_data": result["parsed_data"],
+        "resume_score": result["resume_score"],
+        "resume_summary": result["resume_summary"],
     }), 200
 
 
@@ -214,22 +231,18 @@ def list_resumes():
     conn = db.get_db()
     rows = conn.execute(
         """
-        SELECT r.id, r.file_path, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
+        SELECT r.id, r.file_path, r.original_name, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
         FROM resumes r
-        LEFT JOIN feedback_reports fr
-          ON fr.id = (
-            SELECT id
-            FROM feedback_reports
-            WHERE resume_id = r.id
-            ORDER BY created_at DESC
-            LIMIT 1
-          )
+        LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
         WHERE r.user_id = ?
         ORDER BY r.created_at DESC, r.id DESC
         """,
         (user_id,),
     ).fetchall()
-    return jsonify({"resumes": [_serialize_resume_row(row) for row in rows]}), 200
+    resumes = [_serialize_resume_row(row, conn) for row in rows]
+    if conn.in_transaction:
+        conn.commit()
+    return jsonify({"resumes": resumes}), 200
 
 
 @bp.get("/resume/<int:resume_id>")
@@ -239,23 +252,19 @@ def get_resume(resume_id: int):
     conn = db.get_db()
     row = conn.execute(
         """
-        SELECT r.id, r.file_path, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
+        SELECT r.id, r.file_path, r.original_name, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
         FROM resumes r
-        LEFT JOIN feedback_reports fr
-          ON fr.id = (
-            SELECT id
-            FROM feedback_reports
-            WHERE resume_id = r.id
-            ORDER BY created_at DESC
-            LIMIT 1
-          )
+        LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
         WHERE r.id = ? AND r.user_id = ?
         """,
         (resume_id, user_id),
     ).fetchone()
     if row is None:
         return jsonify({"error": "Resume not found"}), 404
-    return jsonify(_serialize_resume_row(row)), 200
+    resume = _serialize_resume_row(row, conn)
+    if conn.in_transaction:
+        conn.commit()
+    return jsonify(resume), 200
 
 
 @bp.put("/resume/<int:resume_id>")
@@ -284,37 +293,27 @@ def update_resume(resume_id: int):
     updated_parsed = _set_resume_text(parsed_json, resume_text)
     resume_evaluation = ai_helper.scoreResume(updated_parsed)
 
-    conn.execute(
-        "UPDATE resumes SET parsed_json = ? WHERE id = ? AND user_id = ?",
-        (json.dumps(updated_parsed), resume_id, user_id),
-    )
-    conn.execute(
-        """
-        INSERT INTO feedback_reports (resume_id, score, summary, details_json)
-        VALUES (?, ?, ?, ?)
-        """,
-        (
+    updated_json = json.dumps(updated_parsed)
+    with db.unit_of_work():
+        conn.execute(
+            "UPDATE resumes SET parsed_json = ?, content_hash = ? WHERE id = ? AND user_id = ?",
+            (updated_json, edited_content_hash(updated_json), resume_id, user_id),
+        )
+        ChunkEmbeddingDAO(conn).delete_for_resume(resume_id)
+        insert_feedback_report(
+            conn,
             resume_id,
             int(resume_evaluation["score"]),
             resume_evaluation["summary"],
             json.dumps(resume_evaluation["details"]),
-        ),
-    )
-    conn.commit()
-    award_resume_score(user_id, int(resume_evaluation["score"]))
+        )
+        award_resume_score(user_id, int(resume_evaluation["score"]))
 
     refreshed = conn.execute(
         """
-        SELECT r.id, r.file_path, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
+        SELECT r.id, r.file_path, r.original_name, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
         FROM resumes r
-        LEFT JOIN feedback_reports fr
-          ON fr.id = (
-            SELECT id
-            FROM feedback_reports
-            WHERE resume_id = r.id
-            ORDER BY created_at DESC
-            LIMIT 1
-          )
+        LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
         WHERE r.id = ? AND r.user_id = ?
         """,
         (resume_id, user_id),
@@ -345,9 +344,10 @@ def update_resume_fields(resume_id: int):
         parsed_json = {}
 
     parsed_json["extracted_data"] = new_fields
+    updated_json = json.dumps(parsed_json)
     conn.execute(
-        "UPDATE resumes SET parsed_json = ? WHERE id = ? AND user_id = ?",
-        (json.dumps(parsed_json), resume_id, user_id),
+        "UPDATE resumes SET parsed_json = ?, content_hash = ? WHERE id = ? AND user_id = ?",
+        (updated_json, edited_content_hash(updated_json), resume_id, user_id),
     )
     conn.commit()
     return jsonify({"message": "Fields updated successfully", "extracted_data": new_fields}), 200
@@ -372,7 +372,7 @@ def resume_delete(resume_id: int):
     user_id = _current_user_id()
     conn = db.get_db()
     row = conn.execute(
-        "SELECT file_path FROM resumes WHERE id = ? AND user_id = ?",
+        "SELECT file_path, original_name FROM resumes WHERE id = ? AND user_id = ?",
         (resume_id, user_id),
     ).fetchone()
     if row is None:
@@ -380,10 +380,11 @@ def resume_delete(resume_id: int):
 
     conn.execute("DELETE FROM feedback_reports WHERE resume_id = ?", (resume_id,))
     conn.execute("DELETE FROM keyword_analyses WHERE resume_id = ?", (resume_id,))
+    ChunkEmbeddingDAO(conn).delete_for_resume(resume_id)
     conn.execute("DELETE FROM resumes WHERE id = ? AND user_id = ?", (resume_id, user_id))
     conn.commit()
 
-    if row["file_path"] and os.path.exists(row["file_path"]):
-        os.remove(row["file_path"])
+    # Deduplicated uploads stored before per-upload files may still share one
+    remove_resume_file_if_unused(conn, row["file_path"])
 
-    return jsonify({"message": f"Deleted {_resume_display_name(row['file_path'])}"}), 200
+    return jsonify({"message": f"Deleted {_resume_display_name(row['file_path'], row['original_name'])}"}), 200
@@ -0,0 +1,23 @@
+"""Job-application tracker table and the interview columns added with it."""
+from . import add_column_if_missing
+
+
+def upgrade(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_applications (
+          id           INTEGER PRIMARY KEY AUTOINCREMENT,
+          user_id      INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+          company_name TEXT    NOT NULL,
+          applied_date TEXT    NOT NULL,
+          stage        TEXT    NOT NULL DEFAULT 'applied',
+          field        TEXT    NOT NULL DEFAULT '',
+          created_at   TEXT    NOT NULL DEFAULT (datetime('now'))
+        )
+        """
+    )
+    add_column_if_missing(conn, "interviews", "user_id", "INTEGER REFERENCES users(id)")
+    add_column_if_missing(conn, "interviews", "submitted_at", "TEXT")
+    add_column_if_missing(conn, "interviews", "average_score", "REAL")
+    add_column_if_missing(conn, "interviews", "total_score", "REAL")
+    add_column_if_missing(conn, "interviews", "questions_json", "TEXT")
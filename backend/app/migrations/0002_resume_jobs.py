@@ -0,0 +1,23 @@
+"""Background resume processing jobs (async upload mode)."""
+
+
+def upgrade(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS resume_jobs (
+          id            TEXT PRIMARY KEY,
+          user_id       INTEGER NOT NULL,
+          file_path     TEXT NOT NULL,
+          original_name TEXT NOT NULL,
+          status        TEXT NOT NULL DEFAULT 'queued',
+          stage         TEXT NOT NULL DEFAULT 'queued',
+          stages_json   TEXT,
+          resume_id     INTEGER,
+          result_json   TEXT,
+          error         TEXT,
+          created_at    TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+          updated_at    TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+          FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+        """
+    )
@@ -0,0 +1,7 @@
+"""SHA-256 of uploaded resumes for duplicate-upload detection."""
+from . import add_column_if_missing
+
+
+def upgrade(conn):
+    add_column_if_missing(conn, "resumes", "content_hash", "TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_resumes_content_hash ON resumes (content_hash)")
@@ -0,0 +1,18 @@
+"""Persisted sentence-transformer embeddings of resume chunks."""
+
+
+def upgrade(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS resume_chunk_embeddings (
+          resume_id  INTEGER NOT NULL,
+          chunk_hash TEXT NOT NULL,
+          model_name TEXT NOT NULL,
+          dim        INTEGER NOT NULL,
+          embedding  BLOB NOT NULL,
+          created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+          PRIMARY KEY (resume_id, chunk_hash, model_name),
+          FOREIGN KEY (resume_id) REFERENCES resumes (id)
+        )
+        """
+    )
@@ -0,0 +1,23 @@
+"""Parsed new-grad job catalog shared by all workers, with the last refresh diff."""
+from . import add_column_if_missing
+
+
+def upgrade(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_catalog (
+          source              TEXT PRIMARY KEY,
+          version             INTEGER NOT NULL DEFAULT 0,
+          jobs_json           TEXT,
+          job_count           INTEGER NOT NULL DEFAULT 0,
+          content_hash        TEXT,
+          etag                TEXT,
+          last_modified       TEXT,
+          fetched_at          REAL,
+          checked_at          REAL,
+          refresh_lease_until REAL,
+          last_diff_json      TEXT
+        )
+        """
+    )
+    add_column_if_missing(conn, "job_catalog", "last_diff_json", "TEXT")
@@ -0,0 +1,20 @@
+"""Secondary indexes for the per-user and per-parent lookups on every page load."""
+
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_resumes_user_created ON resumes (user_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_resumes_file_path ON resumes (file_path)",
+    "CREATE INDEX IF NOT EXISTS idx_feedback_reports_resume_created ON feedback_reports (resume_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_keyword_analyses_resume_created ON keyword_analyses (resume_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_answers_interview ON answers (interview_id, id)",
+    "CREATE INDEX IF NOT EXISTS idx_interviews_user_created ON interviews (user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_job_applications_user_applied ON job_applications (user_id, applied_date)",
+    "CREATE INDEX IF NOT EXISTS idx_user_badges_user_earned ON user_badges (user_id, earned_at)",
+    "CREATE INDEX IF NOT EXISTS idx_interview_sessions_user ON interview_sessions (user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_interview_answers_session ON interview_answers (session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_resume_jobs_user ON resume_jobs (user_id)",
+)
+
+
+def upgrade(conn):
+    for statement in INDEXES:
+        conn.execute(statement)
@@ -0,0 +1,19 @@
+"""Denormalized pointer from each resume to its newest feedback report, backfilled."""
+from . import add_column_if_missing
+
+
+def upgrade(conn):
+    add_column_if_missing(conn, "resumes", "latest_feedback_id", "INTEGER")
+    # One pass over resumes; each lookup is a probe of idx_feedback_reports_resume_created
+    conn.execute(
+        """
+        UPDATE resumes
+        SET latest_feedback_id = (
+          SELECT id
+          FROM feedback_reports
+          WHERE resume_id = resumes.id
+          ORDER BY created_at DESC, id DESC
+          LIMIT 1
+        )
+        """
+    )
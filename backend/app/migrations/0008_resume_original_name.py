@@ -0,0 +1,6 @@
+"""Each resume's own uploaded filename; older rows fall back to the name inside file_path."""
+from . import add_column_if_missing
+
+
+def upgrade(conn):
+    add_column_if_missing(conn, "resumes", "original_name", "TEXT")
@@ -0,0 +1,6 @@
+"""When the last catalog refresh failed, so workers wait out a retry window instead of refetching."""
+from . import add_column_if_missing
+
+
+def upgrade(conn):
+    add_column_if_missing(conn, "job_catalog", "failed_at", "REAL")
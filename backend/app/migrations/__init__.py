@@ -0,0 +1,122 @@
+# backend/app/migrations/__init__.py
+"""
+Numbered schema migrations for existing databases.
+
+Each `NNNN_name.py` module in this package defines `upgrade(conn)`. Applied
+versions are recorded in `schema_version`, so an up-to-date worker only reads
+`MAX(version)` at start-up. `database/schema.sql` always holds the complete
+current schema: a freshly created database is stamped at the latest version
+instead of replaying migrations. Migrations must stay idempotent because
+databases created before versioning existed are upgraded from version 0.
+"""
+import importlib
+import os
+import re
+import sqlite3
+from typing import Callable, NamedTuple
+
+_MODULE_RE = re.compile(r"^(\d{4})_(\w+)\.py$")
+_migrations = None
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    upgrade: Callable
+
+
+def load_migrations() -> list[Migration]:
+    global _migrations
+    if _migrations is None:
+        found = []
+        for filename in sorted(os.listdir(os.path.dirname(__file__))):
+            match = _MODULE_RE.match(filename)
+            if match:
+                module = importlib.import_module(f"{__name__}.{filename[:-3]}")
+                found.append(Migration(int(match.group(1)), match.group(2), module.upgrade))
+        versions = [migration.version for migration in found]
+        if versions != list(range(1, len(found) + 1)):
+            raise RuntimeError(f"Migration versions must be 1..N without gaps, got {versions}")
+        _migrations = found
+    return _migrations
+
+
+def latest_version() -> int:
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def _create_version_table(conn) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+          version INTEGER PRIMARY KEY,
+          name TEXT NOT NULL,
+          applied_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """
+    )
+
+
+def current_version(conn) -> int:
+    """Highest applied version; 0 for a database that predates versioning."""
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:  # no schema_version table yet
+        return 0
+    return row[0] or 0
+
+
+def is_current(conn) -> bool:
+    return current_version(conn) >= latest_version()
+
+
+def stamp(conn) -> None:
+    """Mark every migration applied; for databases just built from schema.sql."""
+    _create_version_table(conn)
+    conn.executemany(
+        "INSERT OR IGNORE INTO schema_version (version, name) VALUES (?, ?)",
+        [(migration.version, migration.name) for migration in load_migrations()],
+    )
+    conn.commit()
+
+
+def upgrade(conn) -> list[Migration]:
+    """
+    Apply pending migrations, each in its own write transaction, and return them.
+
+    BEGIN IMMEDIATE serializes workers starting together: whoever waits
+    re-reads the version inside the lock and skips what was just applied.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    _create_version_table(conn)
+    conn.commit()
+
+    applied = []
+    for migration in load_migrations():
+        if migration.version <= current_version(conn):
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if migration.version > current_version(conn):
+                migration.upgrade(conn)
+                conn.execute(
+                    "INSERT INTO schema_version (version, name) VALUES (?, ?)",
+                    (migration.version, migration.name),
+                )
+                applied.append(migration)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return applied
+
+
+def column_names(conn, table: str) -> set[str]:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+
+
+def add_column_if_missing(conn, table: str, column: str, declaration: str) -> None:
+    if column not in column_names(conn, table):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
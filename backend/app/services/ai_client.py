@@ -0,0 +1,186 @@
+import os
+import threading
+import time
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+
+PREFERRED_MODELS = [
+    'models/gemini-1.5-flash',
+    'models/gemini-1.5-flash-latest',
+    'models/gemini-1.5-pro',
+    'models/gemini-1.5-pro-latest',
+    'models/gemini-1.0-pro',
+    'models/gemini-pro',
+]
+DEFAULT_DISCOVERY_TTL_SECONDS = 60 * 60
+DEFAULT_DISCOVERY_RETRY_SECONDS = 60
+
+
+class ModelRegistry:
+    """
+    Process-wide holder for the Gemini client.
+
+    Model discovery (`genai.configure` + `genai.list_models`) runs once per TTL
+    window and the resulting `GenerativeModel` is shared by every AIHelper.
+    A discovery that fails on a Gemini or network error is only trusted for
+    the shorter retry window, so a transient outage does not disable the AI
+    features for a whole TTL. One thread at a time runs discovery, outside
+    the lock; the others keep getting the last resolved model, and only wait
+    when there is none yet.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_DISCOVERY_TTL_SECONDS,
+        retry_seconds: int = DEFAULT_DISCOVERY_RETRY_SECONDS,
+    ):
+        self._lock = threading.Lock()
+        self._ttl_seconds = ttl_seconds
+        self._retry_seconds = retry_seconds
+        self._model = None
+        self._model_name = None
+        self._api_key = None
+        self._resolved_at = None
+        self._failed = False
+        self._discovering = None
+        self._stats = {
+            "discovery_runs": 0,
+            "discovery_errors": 0,
+            "cache_hits": 0,
+            "stale_served": 0,
+        }
+
+    def configure(self, ttl_seconds: int | None = None, retry_seconds: int | None = None) -> None:
+        with self._lock:
+            if ttl_seconds is not None:
+                self._ttl_seconds = max(0, int(ttl_seconds))
+            if retry_seconds is not None:
+                self._retry_seconds = max(0, int(retry_seconds))
+
+    def get_model(self):
+        """Return `(model, model_name)`; model is None when only local logic is available."""
+        api_key = os.getenv("GOOGLE_API_KEY")
+        with self._lock:
+            if self._is_fresh(api_key):
+                self._stats["cache_hits"] += 1
+                return self._model, self._model_name
+            done = self._discovering
+            leader = done is None
+            if leader:
+                # This thread runs the discovery; the network calls happen outside the lock.
+                done = self._discovering = threading.Event()
+                self._stats["discovery_runs"] += 1
+                previous = (self._model, self._model_name) if api_key == self._api_key else (None, None)
+            elif self._resolved_at is not None and api_key == self._api_key:
+                # Another thread is rediscovering; keep serving the last known model meanwhile.
+                self._stats["stale_served"] += 1
+                return self._model, self._model_name
+
+        if not leader:
+            done.wait()
+            with self._lock:
+                return self._model, self._model_name
+
+        started = time.time()
+        try:
+            model, model_name, failed = self._discover(api_key, previous)
+            with self._lock:
+                self._api_key = api_key
+                self._resolved_at = started
+                self._failed = failed
+                self._model, self._model_name = model, model_name
+                return model, model_name
+        finally:
+            with self._lock:
+                self._discovering = None
+            done.set()
+
+    def warm(self) -> None:
+        """Resolve the model eagerly (called from create_app)."""
+        self.get_model()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._resolved_at = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "model": self._model_name,
+                "resolved_at": self._resolved_at,
+                "ttl_seconds": self._ttl_seconds,
+                "retry_seconds": self._retry_seconds,
+                "last_discovery_failed": self._failed,
+            }
+
+    def _is_fresh(self, api_key) -> bool:
+        ttl = min(self._ttl_seconds, self._retry_seconds) if self._failed else self._ttl_seconds
+        return (
+            self._resolved_at is not None
+            and api_key == self._api_key
+            and time.time() - self._resolved_at < ttl
+        )
+
+    def _discover(self, api_key, previous) -> tuple:
+        """
+        Resolve a model for `api_key` without touching the shared state;
+        returns `(model, model_name, failed)`. `previous` is the last
+        known-good `(model, model_name)` for this key.
+        """
+        if not api_key:
+            print("⚠️  UYARI: GOOGLE_API_KEY bulunamadı. Yerel mantık kullanılacak.")
+            return None, None, False
+        if genai is None:
+            print("⚠️  google.generativeai is not installed. Local fallback logic will be used.")
+            return None, None, False
+
+        failed = False
+        try:
+            genai.configure(api_key=api_key)
+
+            # 1. Mevcut ve desteklenen modelleri listele
+            available_models = []
+            try:
+                for m in genai.list_models():
+                    if 'generateContent' in m.supported_generation_methods:
+                        available_models.append(m.name)
+            except Exception as e:
+                self._bump("discovery_errors")
+                failed = True
+                print(f"⚠️ Model listesi alınırken hata: {e}")
+                if previous[0] is not None:
+                    # Keep serving the last known-good model until the retry window ends.
+                    return previous[0], previous[1], True
+
+            print(f"ℹ️ Erişilebilir Modeller: {available_models}")
+
+            # 2. En uygun modeli seç (Flash > Pro > Diğerleri)
+            target_model = next(
+                (pref for pref in PREFERRED_MODELS if pref in available_models),
+                None,
+            )
+            # Eğer tercihlerden hiçbiri yoksa, listenin başındaki herhangi bir modeli al
+            if not target_model and available_models:
+                target_model = available_models[0]
+
+            if target_model:
+                print(f"✅ Seçilen Model: {target_model}")
+                return genai.GenerativeModel(target_model), target_model, failed
+            print("❌ Uygun bir model bulunamadı (generateContent destekleyen).")
+        except Exception as e:
+            self._bump("discovery_errors")
+            failed = True
+            print(f"❌ AI Client Init Error: {e}")
+        return None, None, failed
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+model_registry = ModelRegistry()
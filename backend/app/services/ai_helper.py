@@ -2,75 +2,126 @@ import os
 import fitz  # PyMuPDF
 import docx  # python-docx
 import json
-from flask import current_app
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from flask import current_app, has_app_context
 from dotenv import load_dotenv
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
+from .ai_client import model_registry
+from .llm_cache import llm_cache, normalize_text
+from .rubric import ANSWER_RUBRIC, QUESTION_RUBRIC, RESUME_RUBRIC, content_terms, count_digits
+
+# Bump a template's version whenever its prompt changes so cached responses are not reused.
+PROMPT_TEMPLATE_VERSIONS = {
+    "extract_resume_fields": 1,
+    "interview_questions": 1,
+    "interview_feedback": 1,
+    "interview_feedback_batch": 1,
+}
 
 # .env dosyasını yükle
 load_dotenv()
 
+# PDF extraction budgets; overridable through app.config with the same names.
+PDF_EXTRACTION_DEFAULTS = {
+    "PDF_MAX_PAGES": 40,
+    "PDF_MAX_CHARS": 200_000,
+    "PDF_PARALLEL_PAGE_THRESHOLD": 32,
+    "PDF_PARALLEL_WORKERS": min(4, os.cpu_count() or 1),
+}
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _question_signals(question: str) -> dict:
+    """Question-side heuristic signals; read-only, shared between answers."""
+    question_lower = question.lower()
+    return {"terms": frozenset(content_terms(question_lower)), **QUESTION_RUBRIC.scan(question_lower)}
+
+
+def _pdf_setting(name: str, override=None) -> int:
+    if override is not None:
+        return int(override)
+    if has_app_context():
+        return int(current_app.config.get(name, PDF_EXTRACTION_DEFAULTS[name]))
+    return PDF_EXTRACTION_DEFAULTS[name]
+
+
+def _iter_pdf_pages(doc, start: int, stop: int):
+    """Yield (page_index, text, elapsed_ms) for pages in [start, stop)."""
+    for index in range(start, stop):
+        started = time.perf_counter()
+        text = doc.load_page(index).get_text()
+        yield index, text, round((time.perf_counter() - started) * 1000, 3)
+
+
+def _extract_pdf_page_range(filepath: str, start: int, stop: int, max_chars: int) -> list:
+    """Process-pool worker: open the PDF itself and extract one contiguous page range."""
+    pages = []
+    total = 0
+    with fitz.open(filepath) as doc:
+        for page in _iter_pdf_pages(doc, start, stop):
+            pages.append(page)
+            total += len(page[1])
+            if total >= max_chars:
+                break
+    return pages
+
+
+def _get_pdf_pool(workers: int) -> ProcessPoolExecutor:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # spawn: forking a threaded WSGI worker is not safe
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_pool
+
+
 class AIHelper:
     """
     Handles AI interactions using dynamic model selection to prevent 404 errors.
+
+    Model discovery is shared through `model_registry`, so constructing an
+    AIHelper per request is cheap. LLM responses go through `llm_cache`;
+    pass bypass_cache=True to always re-prompt (fresh responses are still stored).
     """
     
-    def __init__(self):
-        # API anahtarını .env dosyasından al
-        api_key = os.getenv("GOOGLE_API_KEY")
-        self.model = None
+    def __init__(self, bypass_cache: bool = False):
+        self.model, self.model_name = model_registry.get_model()
+        self.bypass_cache = bypass_cache
 
-        if api_key and genai is not None:
-            try:
-                genai.configure(api_key=api_key)
-                
-                # 1. Mevcut ve desteklenen modelleri listele
-                available_models = []
+    def _generate_json(self, template: str, cache_input: dict, prompt: str, is_valid=None):
+        """
+        Run a prompt through the response cache and return the parsed JSON payload.
+        Only responses that parse (and pass `is_valid`) are cached.
+        """
+        key = llm_cache.make_key(
+            self.model_name, template, PROMPT_TEMPLATE_VERSIONS[template], cache_input
+        )
+        if self.bypass_cache:
+            llm_cache.record_bypass()
+        else:
+            cached = llm_cache.get(key)
+            if cached is not None:
                 try:
-                    for m in genai.list_models():
-                        if 'generateContent' in m.supported_generation_methods:
-                            available_models.append(m.name)
-                except Exception as e:
-                    print(f"⚠️ Model listesi alınırken hata: {e}")
-
-                print(f"ℹ️ Erişilebilir Modeller: {available_models}")
-
-                # 2. En uygun modeli seç (Flash > Pro > Diğerleri)
-                target_model = None
-                preferences = [
-                    'models/gemini-1.5-flash',
-                    'models/gemini-1.5-flash-latest',
-                    'models/gemini-1.5-pro',
-                    'models/gemini-1.5-pro-latest',
-                    'models/gemini-1.0-pro',
-                    'models/gemini-pro'
-                ]
-
-                # Tercih listesinden, mevcut modeller içinde olan ilkini seç
-                for pref in preferences:
-                    if pref in available_models:
-                        target_model = pref
-                        break
-                
-                # Eğer tercihlerden hiçbiri yoksa, listenin başındaki herhangi bir modeli al
-                if not target_model and available_models:
-                    target_model = available_models[0]
-
-                if target_model:
-                    print(f"✅ Seçilen Model: {target_model}")
-                    self.model = genai.GenerativeModel(target_model)
-                else:
-                    print("❌ Uygun bir model bulunamadı (generateContent destekleyen).")
+                    return json.loads(cached)
+                except ValueError:
+                    pass
 
-            except Exception as e:
-                print(f"❌ AI Client Init Error: {e}")
-        elif api_key and genai is None:
-            print("⚠️  google.generativeai is not installed. Local fallback logic will be used.")
-        else:
-            print("⚠️  UYARI: GOOGLE_API_KEY bulunamadı. Yerel mantık kullanılacak.")
+        response = self.model.generate_content(prompt)
+        content = self._clean_json_text(response.text)
+        parsed = json.loads(content)
+        if is_valid is None or is_valid(parsed):
+            llm_cache.put(key, self.model_name, template, content)
+        return parsed
 
     def _read_docx(self, filepath):
         try:
@@ -81,24 +132,103 @@ class AIHelper:
             return None
 
     def _read_pdf(self, filepath):
+        text, _ = self._extract_pdf(filepath)
+        return text
+
+    def _extract_pdf(
+        self,
+        filepath,
+        max_pages=None,
+        max_chars=None,
+        parallel_threshold=None,
+        workers=None,
+    ):
+        """
+        Extract PDF text page by page within a page and character budget.
+
+        Documents with at least `parallel_threshold` pages (after the page
+        budget) are split into page ranges extracted on a process pool.
+        Returns (text, stats) where stats includes per-page timings; text is
+        None on failure.
+        """
+        max_pages = _pdf_setting("PDF_MAX_PAGES", max_pages)
+        max_chars = _pdf_setting("PDF_MAX_CHARS", max_chars)
+        parallel_threshold = _pdf_setting("PDF_PARALLEL_PAGE_THRESHOLD", parallel_threshold)
+        workers = max(1, _pdf_setting("PDF_PARALLEL_WORKERS", workers))
+        started = time.perf_counter()
+
         try:
-            doc = fitz.open(filepath)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            return text
+            with fitz.open(filepath) as doc:
+                page_count = doc.page_count
+                page_limit = min(page_count, max_pages)
+                pages = None
+                parallel = workers > 1 and page_limit >= parallel_threshold
+                if parallel:
+                    try:
+                        pages = self._extract_pdf_parallel(filepath, page_limit, max_chars, workers)
+                    except Exception as e:
+                        print(f"⚠️ Parallel PDF extraction failed, reading serially: {e}")
+                        parallel = False
+                if pages is None:
+                    pages = []
+                    total = 0
+                    for page in _iter_pdf_pages(doc, 0, page_limit):
+                        pages.append(page)
+                        total += len(page[1])
+                        if total >= max_chars:
+                            break
         except Exception as e:
-            current_app.logger.error(f"Error reading PDF {filepath}: {e}")
-            return None
+            if has_app_context():
+                current_app.logger.error(f"Error reading PDF {filepath}: {e}")
+            return None, {"error": str(e)}
+
+        parts = []
+        total = 0
+        truncated = page_limit < page_count
+        for _, text, _ in pages:
+            remaining = max_chars - total
+            if len(text) > remaining:
+                parts.append(text[:remaining])
+                total += remaining
+                truncated = True
+                break
+            parts.append(text)
+            total += len(text)
+
+        stats = {
+            "page_count": page_count,
+            "pages_read": len(parts),
+            "chars": total,
+            "truncated": truncated,
+            "parallel": parallel,
+            "workers": workers if parallel else 1,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "page_timings_ms": [elapsed for _, _, elapsed in pages[:len(parts)]],
+        }
+        return "".join(parts), stats
+
+    def _extract_pdf_parallel(self, filepath, page_limit, max_chars, workers):
+        span = -(-page_limit // workers)
+        ranges = [(start, min(start + span, page_limit)) for start in range(0, page_limit, span)]
+        pool = _get_pdf_pool(workers)
+        futures = [
+            pool.submit(_extract_pdf_page_range, filepath, start, stop, max_chars)
+            for start, stop in ranges
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
 
     def parseResume(self, filepath: str) -> dict:
         """
         CV dosyasından metin okur.
         """
         ext = os.path.splitext(filepath)[1].lower()
+        extraction = None
 
         if ext == '.pdf':
-            raw_text = self._read_pdf(filepath)
+            raw_text, extraction = self._extract_pdf(filepath)
         elif ext == '.docx':
             raw_text = self._read_docx(filepath)
         else:
@@ -107,12 +237,15 @@ class AIHelper:
         if not raw_text:
             return {"error": "Failed to extract text."}
 
-        return {
+        parsed = {
             "summary": "Text extracted successfully.",
             "raw_text": raw_text[:500] + "..." if len(raw_text) > 500 else raw_text,
             "sections": [{"name": "full_content", "content": raw_text}],
             "extracted_data": {"name": None, "email": None, "phone": None, "summary": None, "skills": [], "work_experience": [], "education": []}
         }
+        if extraction:
+            parsed["extraction"] = extraction
+        return parsed
 
     def extractResumeFields(self, text: str) -> dict:
         """
@@ -152,9 +285,12 @@ Return ONLY valid JSON with these exact keys, no extra text, no markdown code bl
 
 Resume text:
 {text[:4000]}"""
-                response = self.model.generate_content(prompt)
-                content = self._clean_json_text(response.text)
-                parsed = json.loads(content)
+                parsed = self._generate_json(
+                    "extract_resume_fields",
+                    {"text": text[:4000]},
+                    prompt,
+                    is_valid=lambda payload: isinstance(payload, dict),
+                )
                 return self._normalize_extracted_fields(parsed)
             except Exception as e:
                 print(f"⚠️ Field extraction failed, falling back to regex: {e}")
@@ -232,9 +368,12 @@ Resume text:
                 - prompt: the interview question
                 - tags: an array of 2 or 3 short lowercase tags
                 """
-                response = self.model.generate_content(prompt)
-                content = self._clean_json_text(response.text)
-                parsed = json.loads(content)
+                parsed = self._generate_json(
+                    "interview_questions",
+                    {"role": role_text.lower(), "company": company_text.lower(), "count": safe_count},
+                    prompt,
+                    is_valid=lambda payload: isinstance(payload, list) and bool(payload),
+                )
                 if isinstance(parsed, list) and parsed:
                     return self._normalize_generated_questions(parsed, safe_count)
             except Exception as e:
@@ -366,15 +505,124 @@ Resume text:
                 IMPORTANT: Return ONLY the JSON object. Do not wrap it in markdown code blocks.
                 """
 
-                response = self.model.generate_content(prompt)
-                content = self._clean_json_text(response.text)
-                parsed = json.loads(content)
+                parsed = self._generate_json(
+                    "interview_feedback",
+                    {"question": question, "answer": answer, "role": role, "company": company},
+                    prompt,
+                    is_valid=lambda payload: isinstance(payload, dict),
+                )
                 return self._normalize_interview_feedback(parsed, question, answer)
             except Exception as e:
                 print(f"❌ Gemini API Error: {e}. Falling back to heuristics.")
 
         return self._heuristic_feedback(question, answer, role, company)
 
+    def generateInterviewFeedbackBatch(self, items: list[dict], role: str = "", company: str = "") -> list[dict]:
+        """
+        Grade several answers with a single structured prompt.
+
+        items: [{"id": "q1", "question": "...", "answer": "..."}, ...]
+        Returns one feedback dict per item, in the same order. Items the model
+        drops or returns malformed are graded with the local heuristic.
+        """
+        if not items:
+            return []
+
+        prompt_context = f" for a {role} role" if role else ""
+        company_context = f" at {company}" if company else ""
+        graded = {}
+
+        if self.model:
+            try:
+                answers_block = json.dumps(
+                    [
+                        {"id": str(item["id"]), "question": item["question"], "answer": item["answer"]}
+                        for item in items
+                    ],
+                    ensure_ascii=False,
+                    indent=2,
+                )
+                prompt = f"""
+                You are an expert interviewer evaluating {len(items)} candidate answers{prompt_context}{company_context}.
+
+                Answers (JSON):
+                {answers_block}
+
+                Evaluate EACH answer independently on these dimensions:
+                - accuracy: Did the answer address the question correctly and stay internally consistent?
+                - clearness: Was the answer easy to follow, structured, and concise?
+                - confidence: Did the answer sound direct and professional without bluffing?
+
+                Return a JSON array with exactly one object per answer. Each object must have these exact keys:
+                - id: the id of the answer being evaluated
+                - summary: A 1-2 sentence overview of the answer quality.
+                - strengths: A list of 2-3 specific strong points.
+                - suggestions: A list of 2-3 actionable improvements.
+                - metrics: {{
+                    "accuracy": {{"score": 1-5, "label": "Needs work|Developing|Solid|Strong|Excellent", "reason": "short reason"}},
+                    "clearness": {{"score": 1-5, "label": "Needs work|Developing|Solid|Strong|Excellent", "reason": "short reason"}},
+                    "confidence": {{"score": 1-5, "label": "Needs work|Developing|Solid|Strong|Excellent", "reason": "short reason"}}
+                  }}
+                - evaluator: {{
+                    "provider": "gemini",
+                    "method": "llm_rubric_batch"
+                  }}
+
+                IMPORTANT: Return ONLY the JSON array. Do not wrap it in markdown code blocks.
+                """
+
+                parsed = self._generate_json(
+                    "interview_feedback_batch",
+                    {
+                        "items": [
+                            [str(i["id"]), normalize_text(i["question"]), normalize_text(i["answer"])]
+                            for i in items
+                        ],
+                        "role": role,
+                        "company": company,
+                    },
+                    prompt,
+                    is_valid=lambda payload: isinstance(payload, list) and len(payload) == len(items),
+                )
+                if not isinstance(parsed, list):
+                    raise ValueError("batch feedback is not a JSON array")
+                for entry in parsed:
+                    if isinstance(entry, dict) and "id" in entry:
+                        graded.setdefault(str(entry["id"]), entry)
+            except Exception as e:
+                print(f"❌ Gemini Batch Feedback Error: {e}. Falling back to heuristics.")
+
+        results = []
+        missing = []
+        for index, item in enumerate(items):
+            entry = graded.get(str(item["id"]))
+            feedback = None
+            if self._is_valid_feedback_payload(entry):
+                try:
+                    feedback = self._normalize_interview_feedback(entry, item["question"], item["answer"])
+                except Exception as e:
+                    print(f"⚠️ Malformed batch feedback for {item['id']}: {e}")
+            if feedback is None:
+                missing.append(index)
+            results.append(feedback)
+
+        fallbacks = self.heuristic_feedback_many(
+            [(items[index]["question"], items[index]["answer"]) for index in missing],
+            role,
+            company,
+        )
+        for index, feedback in zip(missing, fallbacks):
+            results[index] = feedback
+        return results
+
+    def _is_valid_feedback_payload(self, payload) -> bool:
+        if not isinstance(payload, dict):
+            return False
+        metrics = payload.get("metrics")
+        return isinstance(metrics, dict) and any(
+            isinstance(metrics.get(key), dict) for key in ("accuracy", "clearness", "confidence")
+        )
+
     def _clean_json_text(self, content: str) -> str:
         cleaned = (content or "").strip()
         if cleaned.startswith("```json"):
@@ -455,51 +703,33 @@ Resume text:
         }
 
     def _heuristic_feedback(self, question, answer, role, company):
+        return self._heuristic_feedback_from(_question_signals(question), answer)
+
+    def heuristic_feedback_many(self, pairs, role: str = "", company: str = "") -> list[dict]:
+        """
+        Grade (question, answer) pairs with the local heuristic, in order.
+
+        Question analysis is cached, so grading many answers to the same
+        questions only pays for the answer-side scan.
+        """
+        feedback_from = self._heuristic_feedback_from
+        return [feedback_from(_question_signals(question), answer) for question, answer in pairs]
+
+    def _heuristic_feedback_from(self, question_signals: dict, answer: str) -> dict:
         words = answer.split()
         word_count = len(words)
         answer_lower = answer.lower()
-        question_lower = question.lower()
 
-        question_terms = {
-            token.strip(".,!?")
-            for token in question_lower.split()
-            if len(token.strip(".,!?")) > 3
-        }
-        answer_terms = {
-            token.strip(".,!?")
-            for token in answer_lower.split()
-            if len(token.strip(".,!?")) > 3
-        }
-        overlap = len(question_terms & answer_terms)
-
-        behavioral_markers = sum(
-            1 for token in ["example", "when", "project", "team", "deadline", "challenge", "situation"]
-            if token in question_lower
-        )
-        technical_markers = sum(
-            1 for token in ["system", "debug", "algorithm", "database", "api", "performance", "bug"]
-            if token in question_lower
-        )
+        overlap = len(question_signals["terms"] & content_terms(answer_lower))
+        behavioral_markers = question_signals["behavioral_markers"]
+        technical_markers = question_signals["technical_markers"]
 
-        star_terms = sum(
-            1 for token in ["situation", "task", "action", "result"] if token in answer_lower
-        )
-        impact_signals = sum(
-            1 for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered"]
-            if token in answer_lower
-        )
-        evidence_signals = sum(
-            1 for token in ["for example", "for instance", "specifically", "because", "so that", "which led to"]
-            if token in answer_lower
-        )
-        ownership_signals = sum(
-            1 for token in ["i led", "i built", "i created", "i implemented", "i owned", "i drove", "i resolved"]
-            if token in answer_lower
-        )
-        filler_signals = sum(
-            1 for token in ["maybe", "i guess", "kind of", "sort of", "probably", "i think"]
-            if token in answer_lower
-        )
+        found = ANSWER_RUBRIC.scan(answer_lower)
+        star_terms = found["star_terms"]
+        impact_signals = found["impact_signals"]
+        evidence_signals = found["evidence_signals"]
+        ownership_signals = found["ownership_signals"]
+        filler_signals = found["filler_signals"]
         sentence_count = max(1, answer.count(".") + answer.count("!") + answer.count("?"))
         avg_sentence_length = word_count / sentence_count
         long_run_on_penalty = 1 if avg_sentence_length > 32 else 0
@@ -516,7 +746,7 @@ Resume text:
             accuracy_score += 1
         if evidence_signals > 0:
             accuracy_score += 1
-        if technical_markers > 0 and any(token in answer_lower for token in ["tradeoff", "root cause", "latency", "query", "cache", "test"]):
+        if technical_markers > 0 and found["has_technical_detail"]:
             accuracy_score += 1
         if behavioral_markers > 0 and (star_terms >= 2 or impact_signals > 0):
             accuracy_score += 1
@@ -528,7 +758,7 @@ Resume text:
         clearness_score = 1
         if 35 <= word_count <= 180:
             clearness_score += 1
-        if star_terms >= 2 or any(token in answer_lower for token in ["first", "then", "finally"]):
+        if star_terms >= 2 or found["has_sequence_words"]:
             clearness_score += 1
         if avg_sentence_length <= 24:
             clearness_score += 1
@@ -541,13 +771,13 @@ Resume text:
         clearness_score = max(1, clearness_score)
 
         confidence_score = 1
-        if "i " in answer_lower or "my " in answer_lower:
+        if found["speaks_personally"]:
             confidence_score += 1
         if ownership_signals > 0:
             confidence_score += 1
         if filler_signals == 0 and word_count >= 25:
             confidence_score += 1
-        if impact_signals > 0 or any(token in answer_lower for token in ["confident", "comfortable", "i would", "i can"]):
+        if impact_signals > 0 or found["sounds_assured"]:
             confidence_score += 1
         if filler_signals >= 2:
             confidence_score -= 1
@@ -657,47 +887,26 @@ Resume text:
         ]
         bullet_count = len(bullet_lines)
 
-        digit_count = sum(ch.isdigit() for ch in text)
+        found = RESUME_RUBRIC.scan(lowered)
         checks = {
-            "has_email": "@" in text,
-            "has_phone": digit_count >= 10,
-            "has_skills_section": "skill" in lowered or "skills" in lowered,
-            "has_experience_section": "experience" in lowered or "work experience" in lowered,
-            "has_education_section": "education" in lowered,
-            "has_project_section": "project" in lowered or "projects" in lowered,
-            "has_summary_section": "summary" in lowered or "profile" in lowered,
-            "has_links": "linkedin.com" in lowered or "github.com" in lowered or "portfolio" in lowered,
+            "has_email": found["has_email"],
+            "has_phone": count_digits(text) >= 10,
+            "has_skills_section": found["has_skills_section"],
+            "has_experience_section": found["has_experience_section"],
+            "has_education_section": found["has_education_section"],
+            "has_project_section": found["has_project_section"],
+            "has_summary_section": found["has_summary_section"],
+            "has_links": found["has_links"],
             "has_bullets": bullet_count >= 3,
             "length_ok": 220 <= word_count <= 850,
-            "has_metrics": any(
-                token in lowered
-                for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered", "$"]
-            ),
-            "has_action_verbs": any(
-                token in lowered
-                for token in [
-                    "built", "led", "created", "implemented", "designed", "developed", "launched",
-                    "optimized", "analyzed", "managed", "delivered", "improved", "automated",
-                ]
-            ),
-            "has_dates": any(month in lowered for month in [
-                "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"
-            ]) or "202" in text or "201" in text,
+            "has_metrics": found["has_metrics"],
+            "has_action_verbs": found["has_action_verbs"],
+            "has_dates": found["has_dates"],
         }
 
-        filler_phrases = sum(
-            1 for phrase in ["responsible for", "worked on", "helped with", "various tasks", "team player"]
-            if phrase in lowered
-        )
-        action_verb_hits = sum(
-            lowered.count(token) for token in [
-                "built", "led", "created", "implemented", "designed", "developed", "launched",
-                "optimized", "analyzed", "managed", "delivered", "improved", "automated",
-            ]
-        )
-        metric_hits = sum(
-            lowered.count(token) for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "$", "kpi"]
-        )
+        filler_phrases = found["filler_phrases"]
+        action_verb_hits = found["action_verb_hits"]
+        metric_hits = found["metric_hits"]
         contact_score = 0
         contact_score += 5 if checks["has_email"] else 0
         contact_score += 5 if checks["has_phone"] else 0
@@ -715,7 +924,7 @@ Resume text:
         impact_score = 6
         impact_score += min(8, metric_hits * 2)
         impact_score += 4 if checks["has_project_section"] and checks["has_metrics"] else 0
-        impact_score += 2 if "result" in lowered or "outcome" in lowered else 0
+        impact_score += 2 if found["has_outcome"] else 0
         impact_score = min(20, impact_score)
 
         writing_score = 8
@@ -0,0 +1,179 @@
+import os
+import threading
+import time
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+# Pre-exported quantized graph shipped in the sentence-transformers model repos.
+ONNX_INT8_FILE = "onnx/model_qint8_avx2.onnx"
+
+
+def auto_threads(cpu_count: int | None = None, workers: int | None = None) -> int:
+    """Intra-op threads per process so `workers` WSGI processes do not oversubscribe the CPUs."""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    workers = workers or int(os.environ.get("WEB_CONCURRENCY", 1) or 1)
+    return max(1, cpu_count // max(1, workers))
+
+
+def _load_torch(model_name: str, threads: int):
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    torch.set_num_threads(threads)
+    return SentenceTransformer(model_name, device="cpu", local_files_only=True)
+
+
+def _load_torch_int8(model_name: str, threads: int):
+    import torch
+
+    model = _load_torch(model_name, threads)
+    # Dynamic quantization: Linear weights stored as int8, activations quantized on the fly.
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _load_onnx(model_name: str, threads: int, file_name: str | None = None):
+    import onnxruntime
+    from sentence_transformers import SentenceTransformer
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = threads
+    session_options.inter_op_num_threads = 1
+    model_kwargs = {"provider": "CPUExecutionProvider", "session_options": session_options}
+    if file_name:
+        model_kwargs["file_name"] = file_name
+    return SentenceTransformer(
+        model_name, device="cpu", backend="onnx", model_kwargs=model_kwargs, local_files_only=True
+    )
+
+
+def _load_onnx_int8(model_name: str, threads: int):
+    return _load_onnx(model_name, threads, file_name=ONNX_INT8_FILE)
+
+
+LOADERS = {
+    "torch": _load_torch,
+    "torch-int8": _load_torch_int8,
+    "onnx": _load_onnx,
+    "onnx-int8": _load_onnx_int8,
+}
+
+
+class EmbeddingBackend:
+    """
+    Process-wide sentence-embedding model behind one `encode` call.
+
+    `backend` selects the CPU runtime: fp32 PyTorch ("torch"), dynamically
+    int8-quantized PyTorch ("torch-int8"), or ONNX Runtime with the fp32 or
+    int8 graph ("onnx", "onnx-int8"). The model loads once, either eagerly
+    through `warm()` on a background thread at app start or on first use; a
+    failed load (missing package or model files) is remembered so requests
+    fall back immediately instead of retrying the import.
+    """
+
+    def __init__(self, backend: str = "torch", model_name: str = DEFAULT_MODEL, threads: int = 0):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self.backend = backend
+        self.model_name = model_name
+        self.threads = threads
+        self._model = None
+        self._error = None
+        self._warm_thread = None
+        self._stats = {"loads": 0, "load_seconds": None, "threads": None,
+                       "encode_calls": 0, "texts": 0, "encode_seconds": 0.0}
+
+    def configure(self, backend=None, model_name=None, threads=None) -> None:
+        if backend is not None and backend not in LOADERS:
+            raise ValueError(f"Unknown embedding backend {backend!r}; expected one of {BACKENDS}")
+        with self._lock:
+            before = (self.backend, self.model_name, self.threads)
+            if backend is not None:
+                self.backend = backend
+            if model_name is not None:
+                self.model_name = model_name
+            if threads is not None:
+                self.threads = int(threads)
+            if (self.backend, self.model_name, self.threads) != before:
+                self._model, self._error = None, None
+
+    @property
+    def model_key(self) -> str:
+        """Name stored with cached embeddings; quantized runtimes produce slightly different vectors."""
+        return self.model_name if self.backend == "torch" else f"{self.model_name}@{self.backend}"
+
+    def get(self):
+        """Load the model if needed and return self; raises ImportError/OSError when unavailable."""
+        with self._load_lock:
+            with self._lock:
+                if self._model is not None:
+                    return self
+                if self._error is not None:
+                    raise self._error
+                backend, model_name = self.backend, self.model_name
+                threads = self.threads or auto_threads()
+
+            started = time.perf_counter()
+            try:
+                model = LOADERS[backend](model_name, threads)
+            except (ImportError, OSError) as exc:
+                with self._lock:
+                    self._error = exc
+                print(f"⚠️ Embedding backend {backend} unavailable: {exc}")
+                raise
+
+            with self._lock:
+                self._model = model
+                self._stats["loads"] += 1
+                self._stats["load_seconds"] = round(time.perf_counter() - started, 3)
+                self._stats["threads"] = threads
+            return self
+
+    def encode(self, texts, normalize_embeddings=True):
+        import numpy as np
+
+        started = time.perf_counter()
+        vectors = self._model.encode(list(texts), normalize_embeddings=normalize_embeddings)
+        with self._lock:
+            self._stats["encode_calls"] += 1
+            self._stats["texts"] += len(texts)
+            self._stats["encode_seconds"] += time.perf_counter() - started
+        return np.asarray(vectors, dtype=np.float32)
+
+    def warm(self) -> None:
+        """Load the model on a background thread so the first request does not pay for it."""
+        with self._lock:
+            if self._model is not None or self._error is not None:
+                return
+            if self._warm_thread is not None and self._warm_thread.is_alive():
+                return
+            self._warm_thread = threading.Thread(target=self._warm, name="embedding-warmup", daemon=True)
+            self._warm_thread.start()
+
+    def _warm(self) -> None:
+        try:
+            self.get()
+        except (ImportError, OSError):
+            pass
+
+    def wait(self, timeout=None) -> None:
+        """Block until the warm-up thread, if any, has finished (CLI and tests)."""
+        thread = self._warm_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                "backend": self.backend,
+                "model": self.model_key,
+                "loaded": self._model is not None,
+                "error": str(self._error) if self._error is not None else None,
+            })
+        if stats["encode_calls"]:
+            stats["texts_per_second"] = round(stats["texts"] / max(stats["encode_seconds"], 1e-9), 1)
+        stats["encode_seconds"] = round(stats["encode_seconds"], 3)
+        return stats
+
+
+embedding_backend = EmbeddingBackend()
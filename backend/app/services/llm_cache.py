@@ -0,0 +1,105 @@
+import hashlib
+import json
+import time
+
+from .sqlite_cache import SQLiteTTLCache
+
+
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_AGE_SECONDS = 60 * 60 * 24 * 7
+
+
+def normalize_text(value) -> str:
+    """Collapse whitespace so cosmetic differences do not defeat the cache."""
+    return " ".join(str(value or "").split())
+
+
+class LLMResponseCache(SQLiteTTLCache):
+    """
+    SQLite-backed, content-addressed cache for raw LLM responses.
+
+    Keys are a SHA-256 of (model name, prompt template, template version,
+    normalized input). Expiry, LRU eviction and error handling come from
+    SQLiteTTLCache; `enabled` switches the cache off without losing its path.
+    """
+
+    table = "llm_cache"
+    key_column = "key"
+    created_column = "created_at"
+    label = "LLM cache"
+    touch = "last_accessed_at = ?, hit_count = hit_count + 1"
+    extra_stats = ("bypassed",)
+    schema = """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+          key TEXT PRIMARY KEY,
+          model_name TEXT,
+          template TEXT NOT NULL,
+          response_text TEXT NOT NULL,
+          created_at REAL NOT NULL,
+          last_accessed_at REAL NOT NULL,
+          hit_count INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed
+          ON llm_cache (last_accessed_at);
+        CREATE INDEX IF NOT EXISTS idx_llm_cache_created
+          ON llm_cache (created_at);
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+        enabled: bool = True,
+    ):
+        super().__init__(path, max_entries, max_age_seconds)
+        self.enabled = enabled
+
+    def configure(self, path=None, max_entries=None, max_age_seconds=None, enabled=None) -> None:
+        with self._lock:
+            if path is not None:
+                self.path = path
+            if max_entries is not None:
+                self.max_entries = int(max_entries)
+            if max_age_seconds is not None:
+                self.max_age_seconds = int(max_age_seconds)
+            if enabled is not None:
+                self.enabled = bool(enabled)
+
+    @staticmethod
+    def make_key(model_name: str | None, template: str, template_version: int, payload: dict) -> str:
+        normalized = {
+            key: normalize_text(value) if isinstance(value, str) else value
+            for key, value in payload.items()
+        }
+        material = json.dumps(
+            [model_name or "", template, int(template_version), normalized],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @property
+    def active(self) -> bool:
+        return bool(self.enabled and self.path)
+
+    def get(self, key: str) -> str | None:
+        row = self._read(key, "response_text")
+        return row[0] if row else None
+
+    def put(self, key: str, model_name: str | None, template: str, response_text: str) -> None:
+        now = time.time()
+        self._write(
+            """
+            INSERT OR REPLACE INTO llm_cache
+              (key, model_name, template, response_text, created_at, last_accessed_at, hit_count)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+            """,
+            (key, model_name, template, response_text, now, now),
+        )
+
+    def record_bypass(self) -> None:
+        self._bump("bypassed")
+
+
+llm_cache = LLMResponseCache()
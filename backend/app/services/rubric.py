@@ -0,0 +1,139 @@
+import re
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def count_digits(text: str) -> int:
+    """Same result as `sum(ch.isdigit() for ch in text)` without a per-character Python loop."""
+    total = sum(map(text.count, "0123456789"))
+    if not text.isascii():
+        total += sum(1 for ch in _NON_ASCII.findall(text) if ch.isdigit())
+    return total
+
+
+def _prune_redundant(terms) -> tuple:
+    """Drop terms that contain another term of the same any-of group; they can never decide it."""
+    unique = tuple(dict.fromkeys(terms))
+    return tuple(
+        term for term in unique
+        if not any(other != term and other in term for other in unique)
+    )
+
+
+class Rubric:
+    """
+    Declarative term tables compiled into a single scan plan.
+
+    `any_of` maps a name to terms of which at least one must appear,
+    `total_of` maps a name to terms whose occurrences are summed, and
+    `present_of` maps a name to terms counted once each if they appear.
+
+    Every distinct term is searched at most once per scan: counted terms use
+    one `str.count`, which also answers their presence; `present_of` terms
+    one substring test each. `any_of` groups reuse those results and only scan
+    for their remaining terms, short-circuiting like `any()`.
+    """
+
+    def __init__(self, any_of=None, total_of=None, present_of=None):
+        self.any_of = {name: _prune_redundant(terms) for name, terms in (any_of or {}).items()}
+        self.total_of = {name: tuple(terms) for name, terms in (total_of or {}).items()}
+        self.present_of = {name: frozenset(terms) for name, terms in (present_of or {}).items()}
+
+        self.counted_terms = tuple(dict.fromkeys(
+            term for terms in self.total_of.values() for term in terms
+        ))
+        counted = set(self.counted_terms)
+        self.presence_terms = tuple(
+            term
+            for terms in self.present_of.values()
+            for term in sorted(terms)
+            if term not in counted
+        )
+        known = counted | set(self.presence_terms)
+        self._any_plan = tuple(
+            (
+                name,
+                frozenset(term for term in terms if term in known),
+                tuple(term for term in terms if term not in known),
+            )
+            for name, terms in self.any_of.items()
+        )
+
+    def scan(self, text: str) -> dict:
+        counts = {term: text.count(term) for term in self.counted_terms}
+        found = {term for term in self.presence_terms if term in text}
+        found.update(term for term, hits in counts.items() if hits)
+
+        result = {}
+        for name, known_terms, other_terms in self._any_plan:
+            result[name] = not found.isdisjoint(known_terms) or any(term in text for term in other_terms)
+        for name, terms in self.total_of.items():
+            result[name] = sum(counts[term] for term in terms)
+        for name, terms in self.present_of.items():
+            result[name] = len(found & terms)
+        return result
+
+
+ACTION_VERBS = (
+    "built", "led", "created", "implemented", "designed", "developed", "launched",
+    "optimized", "analyzed", "managed", "delivered", "improved", "automated",
+)
+MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+
+# Scanned against the lowercased resume text; "@" and the year prefixes are
+# unaffected by lowercasing, so they match the original checks on the raw text.
+RESUME_RUBRIC = Rubric(
+    any_of={
+        "has_email": ("@",),
+        "has_skills_section": ("skill", "skills"),
+        "has_experience_section": ("experience", "work experience"),
+        "has_education_section": ("education",),
+        "has_project_section": ("project", "projects"),
+        "has_summary_section": ("summary", "profile"),
+        "has_links": ("linkedin.com", "github.com", "portfolio"),
+        "has_metrics": ("%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered", "$"),
+        "has_action_verbs": ACTION_VERBS,
+        "has_dates": MONTHS + ("202", "201"),
+        "has_outcome": ("result", "outcome"),
+    },
+    total_of={
+        "action_verb_hits": ACTION_VERBS,
+        "metric_hits": ("%", "percent", "improved", "reduced", "increased", "saved", "grew", "$", "kpi"),
+    },
+    present_of={
+        "filler_phrases": ("responsible for", "worked on", "helped with", "various tasks", "team player"),
+    },
+)
+
+# Interview answer heuristics; scanned against lowercased text.
+QUESTION_RUBRIC = Rubric(
+    present_of={
+        "behavioral_markers": ("example", "when", "project", "team", "deadline", "challenge", "situation"),
+        "technical_markers": ("system", "debug", "algorithm", "database", "api", "performance", "bug"),
+    },
+)
+
+ANSWER_RUBRIC = Rubric(
+    any_of={
+        "has_technical_detail": ("tradeoff", "root cause", "latency", "query", "cache", "test"),
+        "has_sequence_words": ("first", "then", "finally"),
+        "speaks_personally": ("i ", "my "),
+        "sounds_assured": ("confident", "comfortable", "i would", "i can"),
+    },
+    present_of={
+        "star_terms": ("situation", "task", "action", "result"),
+        "impact_signals": ("%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered"),
+        "evidence_signals": ("for example", "for instance", "specifically", "because", "so that", "which led to"),
+        "ownership_signals": ("i led", "i built", "i created", "i implemented", "i owned", "i drove", "i resolved"),
+        "filler_signals": ("maybe", "i guess", "kind of", "sort of", "probably", "i think"),
+    },
+)
+
+
+def content_terms(lowered: str) -> set:
+    """Punctuation-stripped tokens longer than three characters."""
+    return {
+        term
+        for term in {token.strip(".,!?") for token in set(lowered.split())}
+        if len(term) > 3
+    }
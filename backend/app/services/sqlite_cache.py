@@ -0,0 +1,128 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+
+class SQLiteTTLCache:
+    """
+    Base for small SQLite-backed caches with age and size limits.
+
+    Subclasses name their `table`, its `key_column` and `created_column`, and
+    give the CREATE statements in `schema`; the table must also carry a
+    `last_accessed_at` column. Entries older than `max_age_seconds` are
+    misses and are deleted on the next write, and the least recently read
+    ones are evicted beyond `max_entries`. Reads and writes that hit a SQLite
+    error are logged and treated as misses / skipped writes. The cache is a
+    no-op until a path is configured.
+    """
+
+    table = None
+    key_column = "key"
+    created_column = "created_at"
+    schema = ""
+    label = "Cache"
+    # SET clause run on every hit; subclasses can add counters
+    touch = "last_accessed_at = ?"
+    extra_stats = ()
+
+    def __init__(self, path: str | None = None, max_entries: int = 0, max_age_seconds: int = 0):
+        self._lock = threading.Lock()
+        self._initialized_path = None
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._stats = dict.fromkeys(("hits", "misses", "writes", "evictions", "errors", *self.extra_stats), 0)
+
+    @property
+    def active(self) -> bool:
+        return bool(self.path)
+
+    def _read(self, key: str, columns: str):
+        """Return the `columns` of a fresh entry, or None on a miss or a failed read."""
+        if not self.active:
+            return None
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    f"SELECT {columns}, {self.created_column} FROM {self.table} WHERE {self.key_column} = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or now - row[-1] > self.max_age_seconds:
+                    self._bump("misses")
+                    return None
+                conn.execute(f"UPDATE {self.table} SET {self.touch} WHERE {self.key_column} = ?", (now, key))
+                conn.commit()
+        except sqlite3.Error as e:
+            self._bump("errors")
+            print(f"⚠️ {self.label} read failed: {e}")
+            return None
+        self._bump("hits")
+        return row[:-1]
+
+    def _write(self, insert_sql: str, params) -> int:
+        """Run an INSERT OR REPLACE and evict; returns how many entries were evicted."""
+        if not self.active:
+            return 0
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(insert_sql, params)
+                evicted = self._evict(conn, time.time())
+                conn.commit()
+        except sqlite3.Error as e:
+            self._bump("errors")
+            print(f"⚠️ {self.label} write failed: {e}")
+            return 0
+        self._bump("writes")
+        self._bump("evictions", evicted)
+        return evicted
+
+    def clear(self) -> None:
+        if not self.path:
+            return
+        with closing(self._connect()) as conn:
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["enabled"] = self.active
+        return stats
+
+    def _evict(self, conn, now: float) -> int:
+        expired = conn.execute(
+            f"DELETE FROM {self.table} WHERE {self.created_column} < ?",
+            (now - self.max_age_seconds,),
+        ).rowcount
+        overflow = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0] - self.max_entries
+        trimmed = 0
+        if overflow > 0:
+            trimmed = conn.execute(
+                f"""
+                DELETE FROM {self.table} WHERE {self.key_column} IN (
+                  SELECT {self.key_column} FROM {self.table} ORDER BY last_accessed_at ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            ).rowcount
+        return max(0, expired) + max(0, trimmed)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        if self._initialized_path != self.path:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                conn.executescript(self.schema)
+                self._initialized_path = self.path
+        return conn
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
@@ -0,0 +1,126 @@
+"""
+Load-test the job-applications API with and without the SQLite connection pool.
+
+Concurrent threads drive the Flask test client against a seeded database: most
+requests list a user's applications, the rest add one. "connect" is the
+previous behaviour (a fresh default connection per app context, rollback
+journal); "pooled" checks connections out of db.pool with the WAL / NORMAL /
+busy_timeout profile. Each mode uses its own database file, since WAL mode
+persists in the file.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_db_pool [--threads 8] [--requests 400] [--write-ratio 0.2]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from flask_jwt_extended import create_access_token
+
+from backend.app import create_app
+from backend.app import db as db_module
+from backend.app.db import ConnectionPool, get_db
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
+
+
+def build_app(path: str, pooled: bool, users: int, applications: int):
+    os.environ["DATABASE_PATH"] = path
+    app = create_app()
+    app.config.update(TESTING=True, DATABASE=path, DB_POOL_ENABLED=pooled)
+    with app.app_context():
+        conn = get_db()
+        with open(SCHEMA_PATH) as f:
+            conn.executescript(f.read())
+        tokens = []
+        for index in range(users):
+            user_id = conn.execute(
+                "INSERT INTO users (email, password_hash, name) VALUES (?, 'x', 'Bench')",
+                (f"bench{index}@test.com",),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO job_applications (user_id, company_name, applied_date) VALUES (?, ?, '2026-01-02')",
+                [(user_id, f"Company {n}") for n in range(applications)],
+            )
+            tokens.append(create_access_token(identity=str(user_id)))
+        conn.commit()
+    return app, tokens
+
+
+def run_load(app, tokens, threads: int, requests: int, write_ratio: float):
+    latencies, failures = [], []
+    lock = threading.Lock()
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        client = app.test_client()
+        headers = {"Authorization": f"Bearer {tokens[seed % len(tokens)]}"}
+        for _ in range(requests // threads):
+            started = time.perf_counter()
+            if rng.random() < write_ratio:
+                rv = client.post(
+                    "/api/v1/applications/",
+                    json={"company_name": "Acme", "applied_date": "2026-02-03"},
+                    headers=headers,
+                )
+            else:
+                rv = client.get("/api/v1/applications/", headers=headers)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                if rv.status_code >= 400:
+                    failures.append(rv.status_code)
+
+    pool_threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    started = time.perf_counter()
+    for thread in pool_threads:
+        thread.start()
+    for thread in pool_threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / wall,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "failures": len(failures),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--applications", type=int, default=50, help="seeded applications per user")
+    args = parser.parse_args()
+
+    db_module.pool = ConnectionPool(max_idle=args.threads)
+    print(f"{'mode':>8} {'req/s':>8} {'p50 ms':>7} {'p95 ms':>7} {'failed':>6}  pool")
+    for mode in ("connect", "pooled"):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            app, tokens = build_app(path, mode == "pooled", args.users, args.applications)
+            result = run_load(app, tokens, args.threads, args.requests, args.write_ratio)
+            assert result["requests"] == args.requests // args.threads * args.threads
+            stats = db_module.pool.stats()
+            pool_note = f"created={stats['created']} reused={stats['reused']}" if mode == "pooled" else ""
+            print(
+                f"{mode:>8} {result['rps']:>8.0f} {result['p50_ms']:>7.2f} {result['p95_ms']:>7.2f} "
+                f"{result['failures']:>6}  {pool_note}"
+            )
+        finally:
+            db_module.pool.clear()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.unlink(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
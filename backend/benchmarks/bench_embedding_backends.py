@@ -0,0 +1,109 @@
+"""
+Compare load time, memory and encode throughput of the embedding backends.
+
+Each backend loads in a fresh process so its peak RSS is not shared with the
+others. Vectors from each runtime are compared with the fp32 "torch" output
+by mean cosine similarity; a backend whose package or model files are not
+installed is reported as unavailable instead of failing the run.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_embedding_backends [--backends torch onnx-int8] [--texts 512] [--threads 0]
+"""
+import argparse
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from backend.app.services.embeddings import BACKENDS, DEFAULT_MODEL, EmbeddingBackend
+
+SENTENCES = [
+    "Built a Python data pipeline that loads SQL tables every hour for analysts.",
+    "Designed React components and a design system for the customer dashboard.",
+    "Verified FPGA timing closure and wrote SystemVerilog testbenches.",
+    "Led a team of four interns shipping a Flask API with JWT authentication.",
+    "Trained gradient boosted models to forecast weekly demand across stores.",
+    "Migrated on-call alerting to Prometheus and cut pages by a third.",
+]
+
+
+def sample_texts(count: int) -> list[str]:
+    return [f"{SENTENCES[i % len(SENTENCES)]} Role {i}." for i in range(count)]
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def measure(backend_name: str, model_name: str, threads: int, texts: list[str], repeat: int) -> dict:
+    """Runs in a child process: load, encode, and report."""
+    backend = EmbeddingBackend(backend=backend_name, model_name=model_name, threads=threads)
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+    try:
+        backend.get()
+    except (ImportError, OSError) as exc:
+        return {"backend": backend_name, "error": str(exc).splitlines()[0]}
+    load_seconds = time.perf_counter() - started
+
+    vectors = backend.encode(texts)  # first call also warms kernels and tokenizer caches
+    encode_seconds = best_of(lambda: backend.encode(texts), repeat)
+    return {
+        "backend": backend_name,
+        "load_seconds": load_seconds,
+        "rss_mb": peak_rss_mb() - rss_before,
+        "texts_per_second": len(texts) / encode_seconds,
+        "threads": backend.stats()["threads"],
+        "vectors": vectors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--threads", type=int, default=0, help="0 = cpu_count // WEB_CONCURRENCY")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts)
+    backends = list(dict.fromkeys(["torch", *args.backends]))  # fp32 is the reference
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in backends:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[name] = pool.submit(measure, name, args.model, args.threads, texts, args.repeat).result()
+
+    reference = results["torch"].get("vectors")
+    print(f"{'backend':>10} {'threads':>7} {'load s':>7} {'RSS MB':>7} {'texts/s':>8} {'cosine vs fp32':>15}")
+    for name in backends:
+        result = results[name]
+        if "error" in result:
+            print(f"{name:>10} unavailable: {result['error']}")
+            continue
+        vectors = result["vectors"]
+        if reference is not None:
+            assert vectors.shape == reference.shape, "embedding width differs from fp32"
+            agreement = f"{float(np.mean(np.sum(vectors * reference, axis=1))):.4f}"
+        else:
+            agreement = "n/a"
+        print(
+            f"{name:>10} {result['threads']:>7} {result['load_seconds']:>7.2f} {result['rss_mb']:>7.0f} "
+            f"{result['texts_per_second']:>8.0f} {agreement:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
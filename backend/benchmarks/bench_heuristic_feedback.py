@@ -0,0 +1,112 @@
+"""
+Microbenchmark the local interview-answer heuristic used when the LLM fails.
+
+Compares the original per-marker-list scans with the ANSWER_RUBRIC tables
+plus the cached question analysis (signal extraction only, checked for
+identical output), then reports end-to-end answers/sec for `_heuristic_feedback`
+called per answer and for `heuristic_feedback_many` over the same pairs.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_heuristic_feedback [--answers 5000] [--questions 8]
+"""
+import argparse
+import random
+import time
+
+from backend.app.services.ai_helper import AIHelper, _question_signals
+from backend.app.services.rubric import ANSWER_RUBRIC, content_terms
+
+QUESTION_TEMPLATES = [
+    "Tell me about a time you handled a tight deadline on a team project.",
+    "How would you debug a slow database query in a production system?",
+    "Describe a challenge where API performance regressed. What was the situation?",
+    "Give an example of a conflict with a stakeholder and how you resolved it.",
+    "Walk me through designing a cache for a read-heavy service.",
+    "What is the hardest bug you have fixed?",
+    "Why do you want to work on this team?",
+    "How do you prioritise work when everything is urgent?",
+]
+PHRASES = [
+    "I led", "I built", "my team", "first", "then", "finally", "because", "so that", "for example",
+    "specifically", "maybe", "I think", "kind of", "improved", "reduced latency by 30%", "delivered",
+    "the root cause", "query", "cache", "tests", "tradeoff", "situation", "task", "action", "result",
+    "I would", "confident", "we", "shipped", "the", "service", "users", "on", "a", "weekly", "release.",
+]
+
+
+def legacy_signals(question: str, answer: str) -> dict:
+    answer_lower = answer.lower()
+    question_lower = question.lower()
+    question_terms = {t.strip(".,!?") for t in question_lower.split() if len(t.strip(".,!?")) > 3}
+    answer_terms = {t.strip(".,!?") for t in answer_lower.split() if len(t.strip(".,!?")) > 3}
+    return {
+        "overlap": len(question_terms & answer_terms),
+        "behavioral_markers": sum(1 for t in ["example", "when", "project", "team", "deadline", "challenge", "situation"] if t in question_lower),
+        "technical_markers": sum(1 for t in ["system", "debug", "algorithm", "database", "api", "performance", "bug"] if t in question_lower),
+        "star_terms": sum(1 for t in ["situation", "task", "action", "result"] if t in answer_lower),
+        "impact_signals": sum(1 for t in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered"] if t in answer_lower),
+        "evidence_signals": sum(1 for t in ["for example", "for instance", "specifically", "because", "so that", "which led to"] if t in answer_lower),
+        "ownership_signals": sum(1 for t in ["i led", "i built", "i created", "i implemented", "i owned", "i drove", "i resolved"] if t in answer_lower),
+        "filler_signals": sum(1 for t in ["maybe", "i guess", "kind of", "sort of", "probably", "i think"] if t in answer_lower),
+        "has_technical_detail": any(t in answer_lower for t in ["tradeoff", "root cause", "latency", "query", "cache", "test"]),
+        "has_sequence_words": any(t in answer_lower for t in ["first", "then", "finally"]),
+        "speaks_personally": "i " in answer_lower or "my " in answer_lower,
+        "sounds_assured": any(t in answer_lower for t in ["confident", "comfortable", "i would", "i can"]),
+    }
+
+
+def table_signals(question: str, answer: str) -> dict:
+    answer_lower = answer.lower()
+    question_signals = _question_signals(question)
+    return {
+        "overlap": len(question_signals["terms"] & content_terms(answer_lower)),
+        "behavioral_markers": question_signals["behavioral_markers"],
+        "technical_markers": question_signals["technical_markers"],
+        **ANSWER_RUBRIC.scan(answer_lower),
+    }
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def best_of(fn, repeat: int) -> float:
+    return min(timed(fn) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--answers", type=int, default=5000)
+    parser.add_argument("--questions", type=int, default=8)
+    parser.add_argument("--words", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    questions = QUESTION_TEMPLATES[: max(1, args.questions)]
+    pairs = [
+        (rng.choice(questions), " ".join(rng.choice(PHRASES) for _ in range(rng.randint(10, args.words * 2))))
+        for _ in range(args.answers)
+    ]
+    for question, answer in pairs:
+        assert legacy_signals(question, answer) == table_signals(question, answer), "rule tables changed the signals"
+
+    helper = AIHelper.__new__(AIHelper)
+    n = len(pairs)
+    legacy = best_of(lambda: [legacy_signals(q, a) for q, a in pairs], args.repeat)
+    tables = best_of(lambda: [table_signals(q, a) for q, a in pairs], args.repeat)
+    single = best_of(lambda: [helper._heuristic_feedback(q, a, "", "") for q, a in pairs], args.repeat)
+    many = best_of(lambda: helper.heuristic_feedback_many(pairs), args.repeat)
+
+    print(f"{n} answers over {len(questions)} distinct questions")
+    print(f"{'signals (legacy lists)':<28} {n / legacy:>10.0f} answers/s")
+    print(f"{'signals (rule tables)':<28} {n / tables:>10.0f} answers/s  ({legacy / tables:.2f}x)")
+    print(f"{'_heuristic_feedback':<28} {n / single:>10.0f} answers/s")
+    print(f"{'heuristic_feedback_many':<28} {n / many:>10.0f} answers/s  ({single / many:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark the similarity step of keywords._compute_hybrid_match across chunk counts.
+
+Uses random unit vectors with the MiniLM embedding width (384) in place of
+model output, so only the matrix / best-score / top-3 work is measured. The
+original nested Python loops are compared with the float32 matrix path.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_hybrid_match [--chunks 6 18 50 100 200] [--dim 384]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from backend.app.features.keywords.api import _summarize_similarity
+
+
+def legacy_summary(job_embeddings, resume_embeddings):
+    job_vectors = job_embeddings.tolist()
+    resume_vectors = resume_embeddings.tolist()
+    matrix = []
+    for job_vector in job_vectors:
+        matrix.append([sum(a * b for a, b in zip(job_vector, r)) for r in resume_vectors])
+    best = [max(row) for row in matrix]
+    coverage = sum(1 for score in best if score >= 0.35) / len(best)
+    semantic = sum(best) / len(best)
+    ranked = sorted(range(len(best)), key=lambda idx: best[idx], reverse=True)[:3]
+    pairs = [
+        (job_idx, max(range(len(matrix[job_idx])), key=lambda idx: matrix[job_idx][idx]))
+        for job_idx in ranked
+    ]
+    return semantic, coverage, pairs
+
+
+def unit_rows(rng, rows: int, dim: int):
+    matrix = rng.standard_normal((rows, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, nargs="+", default=[6, 18, 50, 100, 200])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'chunks':>7} {'legacy ms':>10} {'numpy ms':>9} {'speedup':>8}")
+    for chunks in args.chunks:
+        jobs = unit_rows(rng, chunks, args.dim)
+        resumes = unit_rows(rng, chunks, args.dim)
+
+        semantic, coverage, pairs = legacy_summary(jobs, resumes)
+        fast = _summarize_similarity(jobs, resumes)
+        assert [pair[:2] for pair in fast["top_pairs"]] == pairs, "top matches differ"
+        assert abs(fast["semantic_score"] - semantic) < 1e-5 and fast["coverage_score"] == coverage
+
+        legacy = best_of(lambda: legacy_summary(jobs, resumes), args.repeat)
+        vectorized = best_of(lambda: _summarize_similarity(jobs, resumes), args.repeat)
+        print(f"{chunks:>7} {legacy * 1000:>10.2f} {vectorized * 1000:>9.3f} {legacy / vectorized:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark GET /jobs/new-grad filtering on a synthetic catalog: linear scan vs JobSearchIndex.
+
+The linear scan is the per-request filter the endpoint used before (lowercase
+four fields of every job, substring test). The index is built once per catalog
+load, so its build time is reported separately from per-query latency, along
+with the cost of applying a refresh that adds, removes and edits `--churn` of
+the rows incrementally instead of rebuilding.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_job_search [--jobs 50000] [--repeat 5] [--churn 0.01]
+"""
+import argparse
+import random
+import time
+
+from backend.app.features.keywords.search_index import JobSearchIndex
+
+COMPANIES = [
+    "Google", "Meta", "Jane Street", "Stripe", "Datadog", "Two Sigma", "Ford Motor", "Nvidia",
+    "Amazon", "Citadel", "Palantir", "Snowflake", "Qualcomm", "Intel", "Rivian", "Robinhood",
+]
+ROLE_PREFIXES = ["Software", "Data", "Hardware", "Backend", "Frontend", "Machine Learning", "Embedded"]
+ROLE_SUFFIXES = ["Engineer", "Engineer I", "Developer", "Scientist", "Analyst", "Engineer - New Grad"]
+CITIES = [
+    "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Boston, MA", "Chicago, IL",
+    "Remote", "Atlanta, GA", "Denver, CO", "Toronto, ON",
+]
+CATEGORIES = ["Software Engineering", "Data Science, AI & Machine Learning", "Hardware Engineering",
+              "Quantitative Finance", "Product Management"]
+QUERIES = [
+    ("engineer", ""), ("google", ""), ("new york", ""), ("san fran", ""), ("remote", "software engineering"),
+    ("machine learning engineer", ""), ("co", ""), ("acme 4217", ""), ("", "quantitative finance"),
+]
+
+
+def make_catalog(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(count):
+        company = rng.choice(COMPANIES) if rng.random() < 0.6 else f"Acme {rng.randrange(10000)}"
+        jobs.append({
+            "id": f"job-{index}",
+            "company": company,
+            "role": f"{rng.choice(ROLE_PREFIXES)} {rng.choice(ROLE_SUFFIXES)}",
+            "location": rng.choice(CITIES),
+            "category": rng.choice(CATEGORIES),
+        })
+    return jobs
+
+
+def linear_filter(jobs, search, category):
+    if category and category != "all":
+        jobs = [job for job in jobs if job["category"].lower() == category]
+    if search:
+        jobs = [
+            job for job in jobs
+            if search in job["company"].lower()
+            or search in job["role"].lower()
+            or search in job["location"].lower()
+            or search in job["category"].lower()
+        ]
+    categories = sorted({job["category"] for job in jobs})
+    return len(jobs), jobs[:40], categories
+
+
+def churned(jobs: list[dict], fraction: float, seed: int = 1) -> list[dict]:
+    """Drop, edit and add `fraction` of the rows each, like a day of upstream README edits."""
+    rng = random.Random(seed)
+    count = max(1, int(len(jobs) * fraction))
+    dropped = set(rng.sample(range(len(jobs)), count))
+    new_jobs = [dict(job) for index, job in enumerate(jobs) if index not in dropped]
+    for job in rng.sample(new_jobs, count):
+        job["location"] = rng.choice(CITIES)
+        job["age"] = "1d"
+    added = make_catalog(count, seed=seed + 1)
+    for index, job in enumerate(added):
+        job["id"] = f"new-{index}"
+    return added + new_jobs
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--churn", type=float, default=0.01)
+    args = parser.parse_args()
+
+    jobs = make_catalog(args.jobs)
+    started = time.perf_counter()
+    index = JobSearchIndex(jobs)
+    print(f"index build: {(time.perf_counter() - started) * 1000:.0f} ms for {len(jobs)} jobs")
+
+    refreshed = churned(jobs, args.churn)
+    assert index.updated(refreshed).search("engineer", limit=40) == JobSearchIndex(refreshed).search("engineer", limit=40)
+    rebuild = best_of(lambda: JobSearchIndex(refreshed), max(1, args.repeat // 2))
+    update = best_of(lambda: index.updated(refreshed), max(1, args.repeat // 2))
+    print(
+        f"refresh with {args.churn:.0%} churn: rebuild {rebuild * 1000:.0f} ms, "
+        f"incremental {update * 1000:.0f} ms ({rebuild / update:.1f}x)\n"
+    )
+
+    print(f"{'query':>28} {'category':>22} {'hits':>6} {'linear ms':>10} {'index ms':>9} {'speedup':>8}")
+    for search, category in QUERIES:
+        total, page, _ = linear_filter(jobs, search, category)
+        assert index.search(search, category, limit=40) == (total, page), (search, category)
+
+        linear = best_of(lambda: linear_filter(jobs, search, category), args.repeat)
+        indexed = best_of(lambda: index.search(search, category, limit=40), args.repeat)
+        print(
+            f"{search!r:>28} {category!r:>22} {total:>6} {linear * 1000:>10.2f} "
+            f"{indexed * 1000:>9.3f} {linear / indexed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark the resume list query with and without the latest_feedback_id pointer.
+
+One user is seeded with --resumes resumes (10k by default), each carrying
+--reports feedback reports, on the full schema with the hot-path indexes.
+"subquery" is the previous list query, which finds each resume's newest report
+with a correlated ORDER BY created_at DESC LIMIT 1; "pointer" joins through
+resumes.latest_feedback_id. The 0007 backfill that fills the pointer for
+existing data is timed once on the same database.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_latest_feedback [--resumes 10000] [--reports 3] [--repeat 5]
+"""
+import argparse
+import os
+import sqlite3
+import time
+
+from backend.app import migrations
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
+
+SUBQUERY_LIST = """
+    SELECT r.id, r.file_path, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
+    FROM resumes r
+    LEFT JOIN feedback_reports fr
+      ON fr.id = (
+        SELECT id
+        FROM feedback_reports
+        WHERE resume_id = r.id
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+      )
+    WHERE r.user_id = ?
+    ORDER BY r.created_at DESC, r.id DESC
+"""
+
+POINTER_LIST = """
+    SELECT r.id, r.file_path, r.parsed_json, r.created_at, fr.score, fr.summary, fr.details_json
+    FROM resumes r
+    LEFT JOIN feedback_reports fr ON fr.id = r.latest_feedback_id
+    WHERE r.user_id = ?
+    ORDER BY r.created_at DESC, r.id DESC
+"""
+
+
+def seed(conn, resumes: int, reports: int) -> int:
+    with open(SCHEMA_PATH) as f:
+        conn.executescript(f.read())
+    user_id = conn.execute(
+        "INSERT INTO users (email, password_hash, name) VALUES ('bench@test.com', 'x', 'Bench')"
+    ).lastrowid
+    conn.executemany(
+        "INSERT INTO resumes (user_id, file_path, parsed_json, created_at) VALUES (?, ?, '{}', ?)",
+        [
+            (user_id, f"resume-{n}.pdf", f"2026-01-01 {n // 3600 % 24:02d}:{n // 60 % 60:02d}:{n % 60:02d}")
+            for n in range(resumes)
+        ],
+    )
+    resume_ids = [row[0] for row in conn.execute("SELECT id FROM resumes")]
+    conn.executemany(
+        "INSERT INTO feedback_reports (resume_id, score, summary, details_json, created_at) "
+        "VALUES (?, ?, ?, '{}', ?)",
+        [
+            (resume_id, 40 + k, f"report {k}", f"2026-02-{k + 1:02d} 00:00:00")
+            for resume_id in resume_ids
+            for k in range(reports)
+        ],
+    )
+    conn.commit()
+    return user_id
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=10000)
+    parser.add_argument("--reports", type=int, default=3, help="feedback reports per resume")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(":memory:")
+    user_id = seed(conn, args.resumes, args.reports)
+    backfill = {migration.name: migration for migration in migrations.load_migrations()}["resume_latest_feedback"]
+    started = time.perf_counter()
+    backfill.upgrade(conn)
+    conn.commit()
+    backfill_ms = (time.perf_counter() - started) * 1000
+
+    def run(query):
+        return conn.execute(query, (user_id,)).fetchall()
+
+    expected = run(SUBQUERY_LIST)
+    assert run(POINTER_LIST) == expected and len(expected) == args.resumes
+    assert all(row[5] == f"report {args.reports - 1}" for row in expected)
+
+    print(f"{args.resumes} resumes x {args.reports} reports; backfill {backfill_ms:.1f} ms")
+    print(f"{'query':>9} {'ms':>8}")
+    for name, query in (("subquery", SUBQUERY_LIST), ("pointer", POINTER_LIST)):
+        print(f"{name:>9} {best_of(lambda: run(query), args.repeat) * 1000:>8.2f}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
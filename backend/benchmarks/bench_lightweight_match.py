@@ -0,0 +1,109 @@
+"""
+Benchmark keywords._compute_lightweight_match: nested re-tokenizing loops vs bitset scoring.
+
+Synthetic resumes and job descriptions of 12+ sentence chunks are matched
+with the legacy implementation and the current one, first with a cold
+resume-profile cache (one match per resume) and then warm (the same resume
+matched against many jobs, as the batch and recommendation paths do).
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_lightweight_match [--pairs 200] [--repeat 3]
+"""
+import argparse
+import random
+import time
+
+from backend.app.features.keywords.api import (
+    _compute_lightweight_match,
+    _resume_keyword_profile,
+    _split_text_chunks,
+    _tokenize_keywords,
+)
+
+WORDS = (
+    "python sql react typescript kubernetes docker terraform kafka spark airflow pipeline latency "
+    "throughput customers stakeholders designed built shipped migrated reduced improved automated "
+    "dashboards monitoring alerting postgres redis graphql rest microservices testing ci/cd node.js "
+    "c++ java golang rust pandas numpy pytorch tensorflow analytics experimentation frontend backend"
+).split()
+FILLER = "the and with for from our your team across into using while".split()
+
+
+def sentence(rng):
+    words = [rng.choice(WORDS) if rng.random() < 0.6 else rng.choice(FILLER) for _ in range(rng.randint(10, 22))]
+    return " ".join(words).capitalize() + "."
+
+
+def document(rng, sentences):
+    return "\n".join(sentence(rng) for _ in range(sentences))
+
+
+def legacy_match(resume_text, job_description):
+    resume_keywords = _tokenize_keywords(resume_text)
+    jd_keywords = _tokenize_keywords(job_description)
+    shared = sorted(resume_keywords.intersection(jd_keywords))
+    lexical_overlap = len(shared) / len(jd_keywords) if jd_keywords else 0.0
+    resume_chunks = _split_text_chunks(resume_text, max_chunks=12) or [resume_text]
+    job_chunks = _split_text_chunks(job_description, max_chunks=12) or [job_description]
+    chunk_scores = []
+    for job_chunk in job_chunks:
+        job_chunk_tokens = _tokenize_keywords(job_chunk)
+        best_score = 0.0
+        for resume_chunk in resume_chunks:
+            resume_chunk_tokens = _tokenize_keywords(resume_chunk)
+            score = (
+                len(job_chunk_tokens.intersection(resume_chunk_tokens)) / len(job_chunk_tokens)
+                if job_chunk_tokens else 0.0
+            )
+            best_score = max(best_score, score)
+        chunk_scores.append(best_score)
+    semantic = sum(chunk_scores) / len(chunk_scores)
+    return round(max(0.0, min(1.0, semantic * 0.7 + lexical_overlap * 0.3)), 4)
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    resumes = [document(rng, 14) for _ in range(args.pairs)]
+    jobs = [document(rng, 14) for _ in range(args.pairs)]
+    for resume, job in zip(resumes, jobs):
+        assert _compute_lightweight_match(resume, job)["score"] == legacy_match(resume, job), "scores differ"
+
+    def run_legacy():
+        for resume, job in zip(resumes, jobs):
+            legacy_match(resume, job)
+
+    def run_cold():
+        _resume_keyword_profile.cache_clear()
+        for resume, job in zip(resumes, jobs):
+            _compute_lightweight_match(resume, job)
+
+    def run_warm():
+        for job in jobs:
+            _compute_lightweight_match(resumes[0], job)
+
+    legacy = best_of(run_legacy, args.repeat)
+    cold = best_of(run_cold, args.repeat)
+    warm = best_of(run_warm, args.repeat)
+    per = 1000 / args.pairs
+    print(f"{'variant':>28} {'ms/match':>9} {'speedup':>8}")
+    print(f"{'legacy nested loops':>28} {legacy * per:>9.3f} {'1.0x':>8}")
+    print(f"{'bitsets, cold resume':>28} {cold * per:>9.3f} {legacy / cold:>7.1f}x")
+    print(f"{'bitsets, cached resume':>28} {warm * per:>9.3f} {legacy / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
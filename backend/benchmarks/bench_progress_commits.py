@@ -0,0 +1,132 @@
+"""
+Count commits per resume upload before and after the progress unit of work.
+
+Each upload stores a resume and its feedback report for a fresh user and
+awards the score, which also grants the first badges. "per-statement" replays
+the previous flow: the upload committed, then award_resume_score committed
+its progress-row insert twice, the score update, and each badge separately.
+"unit-of-work" is reuse_resume as it is now, with the upload and the whole
+award in one transaction. COMMITs are counted with a trace callback; both modes
+run on their own database file with the same connection settings.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_progress_commits [--uploads 300] [--no-pool]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from backend.app import create_app
+from backend.app import db as db_module
+from backend.app.db import get_db
+from backend.app.features.progress.service import BADGES
+from backend.app.features.resume_jobs.service import reuse_resume
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
+SOURCE = {"file_path": "bench.pdf", "parsed_json": "{}", "score": 72, "summary": "ok", "details_json": "{}"}
+
+
+def legacy_upload(user_id: int, content_hash: str, source, file_path: str, original_name: str) -> None:
+    conn = get_db()
+
+    def ensure_row():
+        conn.execute(
+            "INSERT OR IGNORE INTO user_progress (user_id, points, best_resume_score, mock_interviews_completed) "
+            "VALUES (?, 0, 0, 0)",
+            (user_id,),
+        )
+        conn.commit()
+
+    def progress_row():
+        ensure_row()
+        return dict(conn.execute(
+            "SELECT user_id, points, best_resume_score, mock_interviews_completed FROM user_progress WHERE user_id = ?",
+            (user_id,),
+        ).fetchone())
+
+    resume_id = conn.execute(
+        "INSERT INTO resumes (user_id, file_path, original_name, parsed_json, content_hash) VALUES (?, ?, ?, ?, ?)",
+        (user_id, file_path, original_name, source["parsed_json"], content_hash),
+    ).lastrowid
+    feedback_id = conn.execute(
+        "INSERT INTO feedback_reports (resume_id, score, summary, details_json) VALUES (?, ?, ?, ?)",
+        (resume_id, source["score"], source["summary"], source["details_json"]),
+    ).lastrowid
+    conn.execute("UPDATE resumes SET latest_feedback_id = ? WHERE id = ?", (feedback_id, resume_id))
+    conn.commit()
+
+    ensure_row()
+    best = progress_row()["best_resume_score"]
+    new_score = int(source["score"])
+    if new_score <= best:
+        return
+    conn.execute(
+        "UPDATE user_progress SET points = points + ?, best_resume_score = ?, updated_at = CURRENT_TIMESTAMP "
+        "WHERE user_id = ?",
+        ((new_score - best) // 5 * 10, new_score, user_id),
+    )
+    conn.commit()
+    p = progress_row()
+    for badge_key, rule in BADGES:
+        if rule(p):
+            conn.execute("INSERT OR IGNORE INTO user_badges (user_id, badge_key) VALUES (?, ?)", (user_id, badge_key))
+            conn.commit()
+
+
+def run(upload, uploads: int, pooled: bool):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_PATH"] = path
+    app = create_app()
+    app.config.update(TESTING=True, DATABASE=path, DB_POOL_ENABLED=pooled)
+    try:
+        with app.app_context():
+            conn = get_db()
+            with open(SCHEMA_PATH) as f:
+                conn.executescript(f.read())
+            conn.executemany(
+                "INSERT INTO users (email, password_hash, name) VALUES (?, 'x', 'Bench')",
+                [(f"bench{n}@test.com",) for n in range(uploads)],
+            )
+            conn.commit()
+            user_ids = [row[0] for row in conn.execute("SELECT id FROM users ORDER BY id")]
+
+            statements = []
+            conn.set_trace_callback(statements.append)
+            started = time.perf_counter()
+            for user_id in user_ids:
+                upload(user_id, f"hash-{user_id}", SOURCE, f"bench-{user_id}.pdf", "bench.pdf")
+            elapsed = time.perf_counter() - started
+            conn.set_trace_callback(None)
+
+            state = (
+                conn.execute("SELECT SUM(points), SUM(best_resume_score) FROM user_progress").fetchone()[:],
+                conn.execute("SELECT COUNT(*) FROM user_badges").fetchone()[0],
+                conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0],
+            )
+        return statements.count("COMMIT") / uploads, elapsed / uploads, state
+    finally:
+        db_module.pool.clear()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uploads", type=int, default=300)
+    parser.add_argument("--no-pool", action="store_true", help="default rollback-journal connections")
+    args = parser.parse_args()
+
+    print(f"{'mode':>14} {'commits/upload':>15} {'ms/upload':>10}")
+    results = {}
+    for name, upload in (("per-statement", legacy_upload), ("unit-of-work", reuse_resume)):
+        commits, seconds, state = run(upload, args.uploads, not args.no_pool)
+        results[name] = state
+        print(f"{name:>14} {commits:>15.1f} {seconds * 1000:>10.3f}")
+    assert results["per-statement"] == results["unit-of-work"]
+
+
+if __name__ == "__main__":
+    main()
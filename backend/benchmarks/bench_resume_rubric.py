@@ -0,0 +1,122 @@
+"""
+Benchmark AIHelper.scoreResume throughput on a corpus of synthetic resumes.
+
+Reports resumes/sec for the full scoreResume call and for the term scan alone,
+comparing the compiled rubric (RESUME_RUBRIC.scan) with the original per-term
+`in` / `str.count` scans. Both scans are checked for identical output.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_resume_rubric [--resumes 2000] [--lines 60]
+"""
+import argparse
+import random
+import time
+
+from backend.app.services.ai_helper import AIHelper
+from backend.app.services.rubric import RESUME_RUBRIC, count_digits
+
+VOCABULARY = (
+    "built led created implemented designed developed launched optimized analyzed managed "
+    "delivered improved automated reduced increased saved grew percent kpi python sql java react "
+    "aws docker kubernetes pipeline service platform customers revenue latency dashboards team "
+    "scheduled skilled modeled cross-functional stakeholders migration api testing analytics "
+    "the a of to in and with for by across over"
+).split()
+HEADINGS = ["Summary", "Experience", "Work Experience", "Skills", "Education", "Projects", "Profile"]
+EXTRAS = ["35%", "$1.2M", "2021", "Jan 2019", "github.com/dev", "linkedin.com/in/dev", "responsible for",
+          "worked on", "team player", "outcome", "results"]
+ACTION_VERBS = [
+    "built", "led", "created", "implemented", "designed", "developed", "launched",
+    "optimized", "analyzed", "managed", "delivered", "improved", "automated",
+]
+
+
+def make_resume(rng: random.Random, lines: int) -> str:
+    out = [f"Candidate {rng.randint(1, 10**6)} | dev{rng.randint(1, 999)}@mail.com | 555 010 {rng.randint(1000, 9999)}"]
+    for _ in range(lines):
+        if rng.random() < 0.1:
+            out.append(rng.choice(HEADINGS))
+            continue
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(6, 16))]
+        if rng.random() < 0.4:
+            words.insert(rng.randrange(len(words)), rng.choice(EXTRAS))
+        out.append(rng.choice(["- ", "• ", "* ", ""]) + " ".join(words).capitalize())
+    return "\n".join(out)
+
+
+def legacy_scan(text: str) -> dict:
+    lowered = text.lower()
+    return {
+        "digits": sum(ch.isdigit() for ch in text),
+        "has_email": "@" in text,
+        "has_skills_section": "skill" in lowered or "skills" in lowered,
+        "has_experience_section": "experience" in lowered or "work experience" in lowered,
+        "has_education_section": "education" in lowered,
+        "has_project_section": "project" in lowered or "projects" in lowered,
+        "has_summary_section": "summary" in lowered or "profile" in lowered,
+        "has_links": "linkedin.com" in lowered or "github.com" in lowered or "portfolio" in lowered,
+        "has_metrics": any(
+            token in lowered
+            for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered", "$"]
+        ),
+        "has_action_verbs": any(token in lowered for token in ACTION_VERBS),
+        "has_dates": any(month in lowered for month in [
+            "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"
+        ]) or "202" in text or "201" in text,
+        "has_outcome": "result" in lowered or "outcome" in lowered,
+        "filler_phrases": sum(
+            1 for phrase in ["responsible for", "worked on", "helped with", "various tasks", "team player"]
+            if phrase in lowered
+        ),
+        "action_verb_hits": sum(lowered.count(token) for token in ACTION_VERBS),
+        "metric_hits": sum(
+            lowered.count(token)
+            for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "$", "kpi"]
+        ),
+    }
+
+
+def compiled_scan(text: str) -> dict:
+    return {"digits": count_digits(text), **RESUME_RUBRIC.scan(text.lower())}
+
+
+def rate(fn, corpus, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(corpus) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--lines", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_resume(rng, args.lines) for _ in range(args.resumes)]
+    for text in corpus:
+        assert legacy_scan(text) == compiled_scan(text), "compiled rubric changed the scan output"
+
+    helper = AIHelper.__new__(AIHelper)
+    score = lambda text: helper.scoreResume({"sections": [{"name": "full_content", "content": text}]})
+
+    legacy = rate(legacy_scan, corpus, args.repeat)
+    compiled = rate(compiled_scan, corpus, args.repeat)
+    full = rate(score, corpus, args.repeat)
+    avg_chars = sum(map(len, corpus)) // len(corpus)
+
+    print(f"corpus: {len(corpus)} resumes, ~{avg_chars} chars each")
+    print(f"{'term scan (legacy)':<26} {legacy:>10.0f} resumes/s")
+    print(f"{'term scan (compiled)':<26} {compiled:>10.0f} resumes/s  ({compiled / legacy:.2f}x)")
+    print(f"{'scoreResume end-to-end':<26} {full:>10.0f} resumes/s")
+
+
+if __name__ == "__main__":
+    main()
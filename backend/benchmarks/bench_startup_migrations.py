@@ -0,0 +1,109 @@
+"""
+Benchmark the schema check each worker runs at start-up on an up-to-date database.
+
+"probes" replays the ad-hoc start-up block that create_app used to run (three
+CREATE TABLE IF NOT EXISTS, PRAGMA table_info probes and a commit) and
+"versioned" is the migrations.is_current read of schema_version. Both run
+against the same freshly initialised database; statements are counted with
+a trace callback. Full create_app() time is reported alongside.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_startup_migrations [--repeat 200]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from backend.app import create_app, migrations
+
+
+def legacy_startup_probes(conn):
+    conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'users'").fetchone()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            company_name TEXT NOT NULL, applied_date TEXT NOT NULL, stage TEXT NOT NULL DEFAULT 'applied',
+            field TEXT NOT NULL DEFAULT '', created_at TEXT NOT NULL DEFAULT (datetime('now')))
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS resume_jobs (
+            id TEXT PRIMARY KEY, user_id INTEGER NOT NULL, file_path TEXT NOT NULL, original_name TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued', stage TEXT NOT NULL DEFAULT 'queued', stages_json TEXT,
+            resume_id INTEGER, result_json TEXT, error TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id))
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS resume_chunk_embeddings (
+            resume_id INTEGER NOT NULL, chunk_hash TEXT NOT NULL, model_name TEXT NOT NULL, dim INTEGER NOT NULL,
+            embedding BLOB NOT NULL, created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (resume_id, chunk_hash, model_name), FOREIGN KEY (resume_id) REFERENCES resumes (id))
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_catalog (
+            source TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0, jobs_json TEXT,
+            job_count INTEGER NOT NULL DEFAULT 0, content_hash TEXT, etag TEXT, last_modified TEXT,
+            fetched_at REAL, checked_at REAL, refresh_lease_until REAL, last_diff_json TEXT)
+    """)
+    conn.execute("PRAGMA table_info(job_catalog)").fetchall()
+    conn.execute("PRAGMA table_info(resumes)").fetchall()
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_resumes_content_hash ON resumes (content_hash)")
+    conn.execute("PRAGMA table_info(interviews)").fetchall()
+    conn.commit()
+    conn.execute("PRAGMA table_info(interviews)").fetchall()
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def count_statements(conn, fn) -> int:
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        fn(conn)
+    finally:
+        conn.set_trace_callback(None)
+    return len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.unlink(path)
+    os.environ["DATABASE_PATH"] = path
+    try:
+        create_app()  # builds and stamps the database
+        conn = sqlite3.connect(path)
+        assert migrations.is_current(conn)
+
+        print(f"{'check':>10} {'statements':>10} {'ms':>8}")
+        legacy_statements = count_statements(conn, legacy_startup_probes)
+        legacy = best_of(lambda: legacy_startup_probes(conn), args.repeat)
+        print(f"{'probes':>10} {legacy_statements:>10} {legacy * 1000:>8.3f}")
+        versioned_statements = count_statements(conn, migrations.is_current)
+        versioned = best_of(lambda: migrations.is_current(conn), args.repeat)
+        print(f"{'versioned':>10} {versioned_statements:>10} {versioned * 1000:>8.3f}  ({legacy / versioned:.0f}x)")
+        conn.close()
+
+        app_start = best_of(create_app, max(3, args.repeat // 20))
+        print(f"create_app() on a current database: {app_start * 1000:.1f} ms")
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+DROP TABLE IF EXISTS schema_version;
+DROP TABLE IF EXISTS resume_jobs;
+DROP TABLE IF EXISTS resume_chunk_embeddings;
+DROP TABLE IF EXISTS job_catalog;
 DROP TABLE IF EXISTS resources;
 DROP TABLE IF EXISTS answers;
 DROP TABLE IF EXISTS interviews;
@@ -38,15 +42,76 @@ CREATE TABLE user_badges (
   FOREIGN KEY (user_id) REFERENCES users (id)
 );
 
+-- Badge list per user in award order
+CREATE INDEX idx_user_badges_user_earned ON user_badges (user_id, earned_at);
+
 CREATE TABLE resumes (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   user_id INTEGER NOT NULL,
   file_path TEXT NOT NULL,
+  -- Filename as uploaded; NULL for rows that predate it (the name is then read from file_path)
+  original_name TEXT,
   parsed_json TEXT,
+  content_hash TEXT,
+  -- Newest feedback_reports row, kept current by insert_feedback_report (no FK: reports are deleted first)
+  latest_feedback_id INTEGER,
+  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  FOREIGN KEY (user_id) REFERENCES users (id)
+);
+
+-- SHA-256 of the uploaded file, used to reuse results for duplicate uploads
+CREATE INDEX idx_resumes_content_hash ON resumes (content_hash);
+-- Resume list / latest resume per user, and shared-file checks on delete
+CREATE INDEX idx_resumes_user_created ON resumes (user_id, created_at, id);
+CREATE INDEX idx_resumes_file_path ON resumes (file_path);
+
+-- Background resume processing jobs (async upload mode)
+CREATE TABLE resume_jobs (
+  id TEXT PRIMARY KEY,
+  user_id INTEGER NOT NULL,
+  file_path TEXT NOT NULL,
+  original_name TEXT NOT NULL,
+  status TEXT NOT NULL DEFAULT 'queued',
+  stage TEXT NOT NULL DEFAULT 'queued',
+  stages_json TEXT,
+  resume_id INTEGER,
+  result_json TEXT,
+  error TEXT,
   created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
   FOREIGN KEY (user_id) REFERENCES users (id)
 );
 
+CREATE INDEX idx_resume_jobs_user ON resume_jobs (user_id);
+
+-- Sentence-transformer embeddings of resume chunks (float32 bytes), reused across matches
+CREATE TABLE resume_chunk_embeddings (
+  resume_id INTEGER NOT NULL,
+  chunk_hash TEXT NOT NULL,
+  model_name TEXT NOT NULL,
+  dim INTEGER NOT NULL,
+  embedding BLOB NOT NULL,
+  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (resume_id, chunk_hash, model_name),
+  FOREIGN KEY (resume_id) REFERENCES resumes (id)
+);
+
+-- Parsed new-grad job catalog per source, shared by all workers and revalidated with ETag / If-Modified-Since
+CREATE TABLE job_catalog (
+  source TEXT PRIMARY KEY,
+  version INTEGER NOT NULL DEFAULT 0,
+  jobs_json TEXT,
+  job_count INTEGER NOT NULL DEFAULT 0,
+  content_hash TEXT,
+  etag TEXT,
+  last_modified TEXT,
+  fetched_at REAL,
+  checked_at REAL,
+  refresh_lease_until REAL,
+  last_diff_json TEXT,
+  failed_at REAL
+);
+
 CREATE TABLE feedback_reports (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   resume_id INTEGER NOT NULL,
@@ -57,6 +122,9 @@ CREATE TABLE feedback_reports (
   FOREIGN KEY (resume_id) REFERENCES resumes (id)
 );
 
+-- Latest feedback report per resume
+CREATE INDEX idx_feedback_reports_resume_created ON feedback_reports (resume_id, created_at, id);
+
 CREATE TABLE keyword_analyses (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   resume_id INTEGER NOT NULL,
@@ -67,6 +135,8 @@ CREATE TABLE keyword_analyses (
   FOREIGN KEY (resume_id) REFERENCES resumes (id)
 );
 
+CREATE INDEX idx_keyword_analyses_resume_created ON keyword_analyses (resume_id, created_at);
+
 CREATE TABLE interview_sessions (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   user_id INTEGER NOT NULL,
@@ -74,6 +144,8 @@ CREATE TABLE interview_sessions (
   FOREIGN KEY (user_id) REFERENCES users (id)
 );
 
+CREATE INDEX idx_interview_sessions_user ON interview_sessions (user_id);
+
 CREATE TABLE interview_questions (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   text TEXT NOT NULL,
@@ -91,6 +163,8 @@ CREATE TABLE interview_answers (
   FOREIGN KEY (question_id) REFERENCES interview_questions (id)
 );
 
+CREATE INDEX idx_interview_answers_session ON interview_answers (session_id);
+
 CREATE TABLE interviews (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   user_id INTEGER REFERENCES users(id),
@@ -103,6 +177,9 @@ CREATE TABLE interviews (
   questions_json TEXT
 );
 
+-- Mock interview history per user, newest first
+CREATE INDEX idx_interviews_user_created ON interviews (user_id, created_at);
+
 -- Career resources (articles, resume guides, interview tips)
 CREATE TABLE resources (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -130,6 +207,8 @@ CREATE TABLE answers (
   FOREIGN KEY (interview_id) REFERENCES interviews (id)
 );
 
+CREATE INDEX idx_answers_interview ON answers (interview_id, id);
+
 CREATE TABLE IF NOT EXISTS job_applications (
   id           INTEGER PRIMARY KEY AUTOINCREMENT,
   user_id      INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -139,3 +218,12 @@ CREATE TABLE IF NOT EXISTS job_applications (
   field        TEXT    NOT NULL DEFAULT '',
   created_at   TEXT    NOT NULL DEFAULT (datetime('now'))
 );
+
+CREATE INDEX IF NOT EXISTS idx_job_applications_user_applied ON job_applications (user_id, applied_date);
+
+-- Applied migrations (see backend/app/migrations); init-db stamps a fresh database at the latest version
+CREATE TABLE schema_version (
+  version INTEGER PRIMARY KEY,
+  name TEXT NOT NULL,
+  applied_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
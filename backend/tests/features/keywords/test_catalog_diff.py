@@ -0,0 +1,123 @@
+"""
+Tests for stable job ids and incremental catalog updates.
+Incrementally updated indexes are compared with ones built from scratch.
+"""
+import random
+
+import pytest
+
+from backend.app.features.keywords.api import _parse_jobs_from_readme
+from backend.app.features.keywords.catalog import diff_catalogs, stable_job_id
+from backend.app.features.keywords.search_index import JobSearchIndex
+from backend.app.features.keywords.service import JobCatalogIndex
+
+
+def _row(company, role, apply_url):
+    return (
+        f"<tr><td>{company}</td><td>{role}</td><td>Remote</td>"
+        f"<td><a href=\"{apply_url}\">Apply</a></td><td>1d</td></tr>"
+    )
+
+
+def _readme(rows):
+    return (
+        "## Software Engineering New Grad Roles\n<table><tbody>"
+        + "".join(_row(*row) for row in rows)
+        + "</tbody></table>\n"
+    )
+
+
+def test_ids_survive_rows_added_above():
+    rows = [("Acme", "Software Engineer", "https://a/1"), ("Globex", "Data Engineer", "https://g/1")]
+    before = {job["company"]: job["id"] for job in _parse_jobs_from_readme(_readme(rows))}
+    after = {
+        job["company"]: job["id"]
+        for job in _parse_jobs_from_readme(_readme([("Initech", "ML Engineer", "https://i/1")] + rows))
+    }
+
+    assert before["Acme"] == after["Acme"] == stable_job_id("Acme", "Software Engineer", "https://a/1")
+    assert before["Globex"] == after["Globex"]
+
+
+def test_continuation_rows_and_duplicates_get_distinct_ids():
+    rows = [
+        ("Acme", "Software Engineer", "https://a/1"),
+        ("↳", "Data Engineer", "https://a/2"),
+        ("Acme", "Software Engineer", "https://a/1"),
+    ]
+    jobs = _parse_jobs_from_readme(_readme(rows))
+    base = stable_job_id("Acme", "Software Engineer", "https://a/1")
+
+    assert [job["id"] for job in jobs] == [base, stable_job_id("Acme", "Data Engineer", "https://a/2"), f"{base}-2"]
+
+
+def test_diff_catalogs():
+    old = [{"id": "a", "role": "x"}, {"id": "b", "role": "y"}, {"id": "c", "role": "z"}]
+    new = [{"id": "d", "role": "w"}, {"id": "a", "role": "x"}, {"id": "c", "role": "z2"}]
+    assert diff_catalogs(old, new) == {"added": ["d"], "removed": ["b"], "changed": ["c"], "unchanged": 1}
+
+
+def _catalog(rng, ids):
+    words = ["Software", "Data", "Engineer", "Analyst", "Remote", "New York, NY", "C++", "Quant"]
+    return [
+        {
+            "id": job_id,
+            "company": f"Co {job_id}",
+            "role": " ".join(rng.sample(words, 2)),
+            "location": rng.choice(["Remote", "New York, NY", "Austin, TX"]),
+            "category": rng.choice(["Software Engineering", "Data Science"]),
+        }
+        for job_id in ids
+    ]
+
+
+def _churn(rng, jobs):
+    new_jobs = [dict(job) for job in jobs if rng.random() > 0.1]
+    for job in rng.sample(new_jobs, len(new_jobs) // 10):
+        job["location"] = "Seattle, WA" if rng.random() < 0.5 else job["location"]
+        job["age"] = "3d"
+    new_jobs += _catalog(rng, [f"new-{index}" for index in range(20)])
+    rng.shuffle(new_jobs)
+    return new_jobs
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_updated_search_index_matches_rebuild(seed):
+    rng = random.Random(seed)
+    jobs = _catalog(rng, [f"job-{index}" for index in range(200)])
+    new_jobs = _churn(rng, jobs)
+
+    incremental = JobSearchIndex(jobs).updated(new_jobs)
+    rebuilt = JobSearchIndex(new_jobs)
+
+    assert {token: sorted(ids) for token, ids in incremental._postings.items()} == {
+        token: sorted(ids) for token, ids in rebuilt._postings.items()
+    }
+    for query in ["", "engineer", "seattle", "co new-1", "york, ny", "c++", "data"]:
+        for category in ["", "data science"]:
+            assert incremental.search(query, category) == rebuilt.search(query, category)
+    assert incremental.category_counts == rebuilt.category_counts
+
+
+def test_catalog_embeddings_encode_only_changed_rows():
+    np = pytest.importorskip("numpy")
+
+    class SeedModel:
+        def __init__(self):
+            self.encoded = []
+
+        def encode(self, texts, normalize_embeddings=True):
+            self.encoded.extend(texts)
+            return np.array([[len(text), sum(map(ord, text)) % 97, 1.0] for text in texts], dtype=np.float32)
+
+    def job(job_id, seed):
+        return {"id": job_id, "description_seed": seed}
+
+    model = SeedModel()
+    index = JobCatalogIndex()
+    index.sync([job("a", "alpha"), job("b", "beta"), job("c", "gamma")], model, "fake")
+    jobs, matrix = index.sync([job("c", "gamma"), job("d", "delta"), job("a", "alpha v2")], model, "fake")
+
+    assert model.encoded == ["alpha", "beta", "gamma", "delta", "alpha v2"]
+    np.testing.assert_array_equal(matrix, SeedModel().encode(["gamma", "delta", "alpha v2"]))
+    assert index.stats()["reused"] == 1
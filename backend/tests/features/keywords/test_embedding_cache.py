@@ -0,0 +1,81 @@
+"""
+Tests for the persistent resume-chunk embedding store.
+Uses an in-memory SQLite DB and a fake encoder that records what it encodes.
+"""
+import os
+import sqlite3
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.app.features.keywords.service import (
+    ChunkEmbeddingDAO,
+    embedding_cache_stats,
+    encode_resume_chunks,
+)
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+)
+MODEL = "fake-model"
+
+
+class CountingModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.encoded.extend(texts)
+        return np.array([[len(text), 1.0, 0.5] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    with open(SCHEMA_PATH) as f:
+        conn.executescript(f.read())
+    conn.execute("INSERT INTO users (id, email, password_hash, name) VALUES (1, 'a@b.co', 'x', 'A')")
+    conn.execute("INSERT INTO resumes (id, user_id, file_path) VALUES (7, 1, 'r.pdf')")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def test_only_new_chunks_are_encoded(conn):
+    model = CountingModel()
+    before = embedding_cache_stats()
+
+    first = encode_resume_chunks(conn, model, MODEL, 7, ["alpha chunk", "beta chunk"])
+    second = encode_resume_chunks(conn, model, MODEL, 7, ["alpha chunk", "beta chunk", "gamma"])
+
+    assert model.encoded == ["alpha chunk", "beta chunk", "gamma"]
+    assert first.dtype == np.float32 and first.shape == (2, 3)
+    np.testing.assert_array_equal(second[:2], first)
+    assert second[2].tolist() == [5.0, 1.0, 0.5]
+
+    after = embedding_cache_stats()
+    assert after["hits"] - before["hits"] == 2
+    assert after["misses"] - before["misses"] == 3
+
+
+def test_embeddings_are_keyed_by_model(conn):
+    model = CountingModel()
+    encode_resume_chunks(conn, model, MODEL, 7, ["alpha chunk"])
+    encode_resume_chunks(conn, model, "other-model", 7, ["alpha chunk"])
+    assert model.encoded == ["alpha chunk", "alpha chunk"]
+
+
+def test_invalidation_forces_reencode(conn):
+    model = CountingModel()
+    encode_resume_chunks(conn, model, MODEL, 7, ["alpha chunk"])
+
+    ChunkEmbeddingDAO(conn).delete_for_resume(7)
+    conn.commit()
+    encode_resume_chunks(conn, model, MODEL, 7, ["alpha chunk"])
+
+    ChunkEmbeddingDAO(conn).delete_for_user(1)
+    conn.commit()
+    assert conn.execute("SELECT COUNT(*) FROM resume_chunk_embeddings").fetchone()[0] == 0
+    assert model.encoded == ["alpha chunk", "alpha chunk"]
@@ -0,0 +1,75 @@
+"""
+Tests for the vectorized similarity math behind _compute_hybrid_match.
+A fake encoder stands in for the sentence-transformer model.
+"""
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.app.features.keywords import api as keywords_api
+from backend.app.features.keywords.api import _summarize_similarity
+from backend.app.features.keywords.service import top_k_indices
+
+
+def reference_summary(job_embeddings, resume_embeddings):
+    """The nested-loop implementation _compute_hybrid_match used before."""
+    job_vectors = job_embeddings.tolist()
+    resume_vectors = resume_embeddings.tolist()
+    matrix = [[sum(a * b for a, b in zip(j, r)) for r in resume_vectors] for j in job_vectors]
+    best = [max(row) for row in matrix]
+    ranked = sorted(range(len(best)), key=lambda idx: best[idx], reverse=True)[:3]
+    return {
+        "semantic_score": sum(best) / len(best),
+        "coverage_score": sum(1 for score in best if score >= 0.35) / len(best),
+        "top_pairs": [
+            (job_idx, max(range(len(matrix[job_idx])), key=lambda idx: matrix[job_idx][idx]), best[job_idx])
+            for job_idx in ranked
+        ],
+    }
+
+
+def _unit_rows(rng, rows, dim=32):
+    matrix = rng.standard_normal((rows, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("job_rows,resume_rows", [(1, 1), (3, 7), (18, 18), (60, 25)])
+def test_summary_matches_nested_loops(job_rows, resume_rows):
+    rng = np.random.default_rng(job_rows * 100 + resume_rows)
+    jobs = _unit_rows(rng, job_rows)
+    resumes = _unit_rows(rng, resume_rows)
+
+    fast = _summarize_similarity(jobs, resumes)
+    slow = reference_summary(jobs, resumes)
+
+    assert fast["semantic_score"] == pytest.approx(slow["semantic_score"], abs=1e-5)
+    assert fast["coverage_score"] == slow["coverage_score"]
+    assert [pair[:2] for pair in fast["top_pairs"]] == [pair[:2] for pair in slow["top_pairs"]]
+    for (_, _, fast_score), (_, _, slow_score) in zip(fast["top_pairs"], slow["top_pairs"]):
+        assert fast_score == pytest.approx(slow_score, abs=1e-5)
+
+
+def test_top_k_breaks_ties_by_index():
+    scores = np.array([0.5, 0.9, 0.5, 0.9, 0.1, 0.5], dtype=np.float32)
+    assert top_k_indices(scores, 3).tolist() == [1, 3, 0]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 0, 2, 5, 4]
+    assert top_k_indices(scores[:0], 3).tolist() == []
+
+
+def test_compute_hybrid_match_uses_float32_embeddings():
+    class FakeModel:
+        def encode(self, texts, normalize_embeddings=True):
+            rng = np.random.default_rng(len(texts))
+            return _unit_rows(rng, len(texts), dim=8)
+
+    resume = "\n".join(f"Built service number {i} in Python with measurable latency wins." for i in range(30))
+    job = "\n".join(f"Looking for engineers to build service {i} with Python and SQL." for i in range(30))
+    with patch.object(keywords_api, "_load_sentence_transformer", return_value=FakeModel()):
+        result = keywords_api._compute_hybrid_match(resume, job, max_chunks=25)
+
+    assert len(result["top_matches"]) == 3
+    assert all(isinstance(match["score"], float) for match in result["top_matches"])
+    assert 0.0 <= result["score"] <= 1.0
+    assert "python" in result["matched_keywords"]
@@ -0,0 +1,221 @@
+"""
+Tests for the SQLite-backed new-grad job catalog.
+Downloads are replaced with fakes or a README fixture on disk.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from email.message import Message
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+import pytest
+
+from backend.app import create_app
+from backend.app.features.keywords import api as keywords_api
+from backend.app.features.keywords import catalog as catalog_module
+from backend.app.features.keywords.catalog import JobCatalogDAO, JobCatalogStore, fetch_conditional
+
+
+def _row(company, role, location):
+    return (
+        f"<tr><td><strong><a href=\"https://{company.lower()}.com\">{company}</a></strong></td>"
+        f"<td>{role}</td><td>{location}</td>"
+        f"<td><a href=\"https://{company.lower()}.com/apply\">Apply</a>"
+        f"<a href=\"https://simplify.jobs/p/{company.lower()}\">Simplify</a></td><td>2d</td></tr>"
+    )
+
+
+def make_readme(*rows):
+    return (
+        "## 💻 Software Engineering New Grad Roles\n\n<table><thead></thead><tbody>"
+        + "".join(_row(*row) for row in rows)
+        + "</tbody></table>\n"
+    )
+
+
+README_V1 = make_readme(("Acme", "Software Engineer", "Remote"), ("Globex", "Data Engineer", "Austin, TX"))
+README_V2 = make_readme(("Acme", "Software Engineer", "Remote"), ("Initech", "Backend Engineer", "NYC"))
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def store():
+    store = JobCatalogStore("test-source", "https://example.test/README.md", keywords_api._parse_jobs_from_readme)
+    with patch.object(keywords_api, "catalog_store", store):
+        yield store
+
+
+def _auth_headers(client, email="catalog@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def test_cold_cache_does_not_block_on_download(app, store):
+    release = threading.Event()
+
+    def slow_fetch(url, etag=None, last_modified=None, timeout=15):
+        release.wait(5)
+        return README_V1, '"v1"', None
+
+    client = app.test_client()
+    headers = _auth_headers(client)
+    with patch.object(catalog_module, "fetch_conditional", side_effect=slow_fetch):
+        started = time.perf_counter()
+        rv = client.get("/api/keywords/jobs/new-grad", headers=headers)
+        assert rv.status_code == 503
+        assert rv.headers["Retry-After"] == "5"
+        assert time.perf_counter() - started < 2
+
+        release.set()
+        store.wait(5)
+
+    rv = client.get("/api/keywords/jobs/new-grad", headers=headers)
+    data = json.loads(rv.data)
+    assert rv.status_code == 200
+    assert [job["company"] for job in data["jobs"]] == ["Acme", "Globex"]
+
+
+def test_revalidates_with_etag_and_serves_stale(app, store):
+    calls = []
+
+    def fetch(url, etag=None, last_modified=None, timeout=15):
+        calls.append(etag)
+        if etag == '"v1"':
+            return None
+        return README_V1, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    with app.app_context(), patch.object(catalog_module, "fetch_conditional", side_effect=fetch):
+        from backend.app.db import get_db
+        conn = get_db()
+        assert store.refresh(conn)["status"] == "updated"
+        assert store.refresh(conn)["status"] == "not_modified"
+        assert calls == [None, '"v1"']
+
+        conn.execute("UPDATE job_catalog SET checked_at = 0")
+        conn.commit()
+        jobs = store.get_jobs(conn, app)
+        store.wait(5)
+
+        assert [job["company"] for job in jobs] == ["Acme", "Globex"]
+        assert store.stats()["stale_served"] == 1
+        assert calls == [None, '"v1"', '"v1"']
+        assert JobCatalogDAO(conn).get_meta("test-source")["checked_at"] > 0
+
+
+def test_new_content_bumps_version_for_other_workers(app, store):
+    other_worker = JobCatalogStore("test-source", store.url, keywords_api._parse_jobs_from_readme)
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with patch.object(catalog_module, "fetch_conditional", return_value=(README_V1, None, None)):
+            store.refresh(conn)
+        first = other_worker.get_jobs(conn, app)
+        assert other_worker.get_jobs(conn, app) is first
+
+        with patch.object(catalog_module, "fetch_conditional", return_value=(README_V2, None, None)):
+            assert store.refresh(conn) == {
+                "status": "updated",
+                "version": 2,
+                "jobs": 2,
+                "diff": {"added": 1, "removed": 1, "changed": 0, "unchanged": 1},
+            }
+        assert [job["company"] for job in other_worker.get_jobs(conn, app)] == ["Acme", "Initech"]
+        assert other_worker.stats()["db_loads"] == 2
+
+
+def test_refresh_lease_is_exclusive(app):
+    with app.app_context():
+        from backend.app.db import get_db
+        dao = JobCatalogDAO(get_db())
+        now = time.time()
+        assert dao.claim_refresh("test-source", now)
+        assert not dao.claim_refresh("test-source", now + 1)
+        assert dao.claim_refresh("test-source", now + 500)
+
+
+def test_failed_refresh_waits_out_the_retry_window(app, store, tmp_path):
+    app.config["JOBS_CATALOG_FIXTURE"] = str(tmp_path / "missing-README.md")
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with pytest.raises(catalog_module.CatalogWarming):
+            store.get_jobs(conn, app)
+        store.wait(5)
+        assert store.stats()["errors"] == 1
+        assert JobCatalogDAO(conn).get_meta("test-source")["refresh_lease_until"] is None
+
+        with pytest.raises(catalog_module.CatalogWarming):
+            store.get_jobs(conn, app)
+        store.wait(5)
+        assert store.stats()["refreshes"] == 1
+        assert store.stats()["retries_deferred"] == 1
+
+        (tmp_path / "missing-README.md").write_text(README_V1, encoding="utf-8")
+        conn.execute("UPDATE job_catalog SET failed_at = failed_at - ?", (app.config["JOBS_CATALOG_RETRY_SECONDS"],))
+        conn.commit()
+        with pytest.raises(catalog_module.CatalogWarming):
+            store.get_jobs(conn, app)
+        store.wait(5)
+        assert [job["company"] for job in store.get_jobs(conn, app)] == ["Acme", "Globex"]
+        assert JobCatalogDAO(conn).get_meta("test-source")["failed_at"] is None
+
+
+def test_fixture_loader_command(app, store, tmp_path):
+    fixture = tmp_path / "README.md"
+    fixture.write_text(README_V1, encoding="utf-8")
+
+    runner = app.test_cli_runner()
+    with patch.object(catalog_module, "fetch_conditional", side_effect=AssertionError("no network")):
+        first = runner.invoke(args=["refresh-jobs-catalog", "--fixture", str(fixture)])
+        second = runner.invoke(args=["refresh-jobs-catalog", "--fixture", str(fixture)])
+
+    assert "Stored job catalog version 1 (2 jobs: 2 added, 0 removed, 0 changed)." in first.output
+    assert "is current (unchanged)" in second.output
+
+
+def test_fetch_conditional_sends_validators_and_handles_304():
+    seen = {}
+
+    def fake_urlopen(request, timeout=15):
+        seen.update(request.headers)
+        raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+
+    with patch.object(catalog_module, "urlopen", side_effect=fake_urlopen):
+        assert fetch_conditional("https://example.test", '"abc"', "Mon, 01 Jan 2024 00:00:00 GMT") is None
+    assert seen["If-none-match"] == '"abc"'
+    assert seen["If-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
@@ -0,0 +1,191 @@
+"""
+Tests for cached, coalesced and batched job-details fetching.
+The Simplify page fetch is replaced with fakes.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.app import create_app
+from backend.app.features.keywords import api as keywords_api
+from backend.app.features.keywords.details import JobDetailsCache, JobDetailsService
+
+
+def fake_details(url):
+    return {"title": f"Role at {url.rsplit('/', 1)[-1]}", "raw_source": url}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "job_details_cache.db")
+
+
+def test_cache_persists_across_instances_and_expires(cache_path):
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        return fake_details(url)
+
+    JobDetailsService(JobDetailsCache(cache_path)).get("https://simplify.jobs/p/1", fetch)
+    restarted = JobDetailsService(JobDetailsCache(cache_path))
+    assert restarted.get("https://simplify.jobs/p/1", fetch) == fake_details("https://simplify.jobs/p/1")
+    assert calls == ["https://simplify.jobs/p/1"]
+    assert restarted.stats()["hits"] == 1
+
+    expired = JobDetailsService(JobDetailsCache(cache_path, max_age_seconds=0))
+    time.sleep(0.01)
+    expired.get("https://simplify.jobs/p/1", fetch)
+    assert len(calls) == 2
+
+
+def test_least_recently_read_entries_are_evicted(cache_path):
+    cache = JobDetailsCache(cache_path, max_entries=2)
+    cache.put("a", {"n": 1})
+    time.sleep(0.01)
+    cache.put("b", {"n": 2})
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    assert cache.put("c", {"n": 3}) == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+
+
+def test_concurrent_requests_for_one_url_are_coalesced(cache_path):
+    service = JobDetailsService(JobDetailsCache(cache_path))
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(url):
+        calls.append(url)
+        release.wait(5)
+        return fake_details(url)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service.get("https://simplify.jobs/p/9", slow_fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.time() + 5
+    while service.stats()["coalesced"] + 1 < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ["https://simplify.jobs/p/9"]
+    assert results == [fake_details("https://simplify.jobs/p/9")] * 5
+
+
+def test_batch_respects_per_host_limit(cache_path):
+    service = JobDetailsService(JobDetailsCache(cache_path), workers=8, per_host=2)
+    lock = threading.Lock()
+    active, peak = {}, {}
+
+    def fetch(url):
+        host = url.split("/")[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.05)
+        with lock:
+            active[host] -= 1
+        if url.endswith("/bad"):
+            raise ValueError("no structured data")
+        return fake_details(url)
+
+    urls = [f"https://simplify.jobs/p/{index}" for index in range(6)] + [
+        "https://other.example/p/1", "https://other.example/bad", "https://simplify.jobs/p/0",
+    ]
+    results, errors, cache_hits = service.get_many(urls, fetch)
+
+    assert sorted(results) == sorted(set(urls) - {"https://other.example/bad"})
+    assert list(errors) == ["https://other.example/bad"]
+    assert cache_hits == 0
+    assert peak["simplify.jobs"] == 2
+    assert service.get_many(urls[:2], fetch)[2] == 2
+
+
+@pytest.fixture
+def client(cache_path, monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    with patch.object(keywords_api, "job_details", JobDetailsService(JobDetailsCache(cache_path))):
+        yield app.test_client()
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+def _auth_headers(client, email="details@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def test_batch_endpoint_serves_repeats_from_cache(client):
+    headers = _auth_headers(client)
+    urls = ["https://simplify.jobs/p/1", "https://simplify.jobs/p/2"]
+    with patch.object(keywords_api, "_fetch_job_details", side_effect=fake_details) as fetch:
+        first = client.post("/api/keywords/jobs/details/batch", json={"simplify_urls": urls}, headers=headers)
+        single = client.get(f"/api/keywords/jobs/details?simplify_url={urls[0]}", headers=headers)
+        second = client.post("/api/keywords/jobs/details/batch", json={"simplify_urls": urls}, headers=headers)
+
+    assert first.status_code == 200
+    assert json.loads(first.data)["jobs"] == {url: fake_details(url) for url in urls}
+    assert json.loads(first.data)["stats"] == {"requested": 2, "cached": 0, "fetched": 2, "failed": 0}
+    assert json.loads(single.data) == fake_details(urls[0])
+    assert json.loads(second.data)["stats"]["cached"] == 2
+    assert fetch.call_count == 2
+
+
+def test_batch_endpoint_rejects_non_simplify_urls(client):
+    headers = _auth_headers(client)
+    rejected = [
+        "file:///etc/passwd",
+        "http://169.254.169.254/latest/meta-data/",
+        "https://simplify.jobs.evil.test/p/1",
+        "https://simplify.jobs@evil.test/p/1",
+    ]
+    with patch("backend.app.features.keywords.api._fetch_job_details") as fetch:
+        rv = client.post(
+            "/api/keywords/jobs/details/batch",
+            json={"simplify_urls": ["https://simplify.jobs/p/1", *rejected]},
+            headers=headers,
+        )
+        for url in rejected:
+            assert client.get("/api/keywords/jobs/details", query_string={"simplify_url": url},
+                              headers=headers).status_code == 400
+    assert rv.status_code == 400
+    assert json.loads(rv.data)["invalid"] == rejected
+    fetch.assert_not_called()
@@ -0,0 +1,156 @@
+"""
+Tests for the new-grad job search index.
+Every query is checked against the linear substring filter it replaced.
+"""
+import json
+import os
+import random
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from backend.app import create_app
+from backend.app.features.keywords import api as keywords_api
+from backend.app.features.keywords.search_index import JobSearchIndex
+
+COMPANIES = ["Google", "Meta Platforms", "Jane Street", "C3.ai", "AT&T", "Two Sigma", "Ford Motor Co."]
+ROLES = [
+    "Software Engineer", "Software Engineer II", "Data Scientist", "Hardware Engineer - FPGA",
+    "Quant Researcher", "Full-Stack Developer", "ML Engineer (New Grad)", "C++ Developer",
+]
+LOCATIONS = ["New York, NY", "Remote", "San Francisco, CA", "Austin, TX", "München, DE", "NYC"]
+CATEGORIES = ["Software Engineering", "Data Science", "Hardware Engineering", "Quant"]
+
+QUERIES = [
+    "", "engineer", "eng", "gineer", "soft", "software engineer", "ware eng", "new york",
+    "york, ny", "ny", "c++", "c3.ai", "at&t", "&", "-", ", ", "(new grad)", "ii", "engineer ii",
+    "münchen", "remote", "e", "zzz", "a, c", "data science", "quant", "s e", "ford motor co.",
+    "\x00", "remote\x00data",
+]
+
+
+def linear_filter(jobs, search="", category=""):
+    """The filter GET /jobs/new-grad ran on every request before the index."""
+    if category and category != "all":
+        jobs = [job for job in jobs if job["category"].lower() == category]
+    if search:
+        jobs = [
+            job for job in jobs
+            if search in job["company"].lower()
+            or search in job["role"].lower()
+            or search in job["location"].lower()
+            or search in job["category"].lower()
+        ]
+    return jobs
+
+
+def make_catalog(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"job-{index}",
+            "company": rng.choice(COMPANIES),
+            "role": rng.choice(ROLES),
+            "location": rng.choice(LOCATIONS),
+            "category": rng.choice(CATEGORIES),
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("category", ["", "all", "quant", "data science", "unknown"])
+def test_search_matches_linear_filter(category):
+    jobs = make_catalog(400)
+    index = JobSearchIndex(jobs)
+    for query in QUERIES:
+        expected = linear_filter(jobs, query, category)
+        total, page = index.search(query, category)
+        assert total == len(expected), query
+        assert page == expected, query
+
+
+def test_random_substrings_match_linear_filter():
+    jobs = make_catalog(300, seed=11)
+    index = JobSearchIndex(jobs)
+    rng = random.Random(3)
+    for _ in range(300):
+        job = rng.choice(jobs)
+        text = job[rng.choice(["company", "role", "location", "category"])].lower()
+        start = rng.randrange(len(text))
+        query = text[start:start + rng.randint(1, 12)].strip()
+        assert index.match_indices(query) == [
+            position for position, job in enumerate(jobs) if job in linear_filter([job], query)
+        ], query
+
+
+def test_paging_and_facets():
+    jobs = make_catalog(120)
+    index = JobSearchIndex(jobs)
+    expected = linear_filter(jobs, "engineer")
+
+    total, page = index.search("engineer", offset=10, limit=5)
+
+    assert total == len(expected)
+    assert page == expected[10:15]
+    assert index.search("engineer", offset=total, limit=5) == (total, [])
+    assert index.categories == sorted({job["category"] for job in jobs})
+    assert sum(index.category_counts.values()) == len(jobs)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app.test_client()
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+def _auth_headers(client, email="search@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def test_endpoint_pages_through_index(client):
+    jobs = make_catalog(60)
+    headers = _auth_headers(client)
+    with patch.object(keywords_api, "_load_new_grad_jobs", return_value=jobs):
+        rv = client.get("/api/keywords/jobs/new-grad?search=Engineer&limit=3&offset=2", headers=headers)
+        again = client.get("/api/keywords/jobs/new-grad?search=engineer&limit=3&offset=2", headers=headers)
+
+    data = json.loads(rv.data)
+    expected = linear_filter(jobs, "engineer")
+    assert rv.status_code == 200
+    assert data["jobs"] == expected[2:5]
+    assert data["total"] == len(expected)
+    assert data["offset"] == 2
+    assert data["category_counts"] == {
+        category: sum(job["category"] == category for job in jobs) for category in data["categories"]
+    }
+    assert json.loads(again.data)["jobs"] == data["jobs"]
+    assert keywords_api._search_index_cache["index"].jobs is jobs
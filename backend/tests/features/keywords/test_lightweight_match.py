@@ -0,0 +1,94 @@
+"""
+Parity tests for the bitset scoring in _compute_lightweight_match.
+legacy_lightweight_match is the nested-loop implementation it replaced.
+"""
+import random
+
+import pytest
+
+from backend.app.features.keywords.api import (
+    _compute_lightweight_match,
+    _resume_keyword_profile,
+    _split_text_chunks,
+    _tokenize_keywords,
+)
+
+
+def legacy_lightweight_match(resume_text, job_description):
+    resume_keywords = _tokenize_keywords(resume_text)
+    jd_keywords = _tokenize_keywords(job_description)
+    shared_keywords = sorted(resume_keywords.intersection(jd_keywords))
+    missing_keywords = sorted(jd_keywords.difference(resume_keywords))
+    lexical_overlap = len(shared_keywords) / len(jd_keywords) if jd_keywords else 0.0
+
+    resume_chunks = _split_text_chunks(resume_text, max_chunks=12) or [resume_text]
+    job_chunks = _split_text_chunks(job_description, max_chunks=12) or [job_description]
+
+    chunk_scores = []
+    top_matches = []
+    for job_chunk in job_chunks:
+        job_chunk_tokens = _tokenize_keywords(job_chunk)
+        best_score = 0.0
+        best_resume_chunk = resume_chunks[0] if resume_chunks else ""
+        for resume_chunk in resume_chunks:
+            resume_chunk_tokens = _tokenize_keywords(resume_chunk)
+            if not job_chunk_tokens:
+                score = 0.0
+            else:
+                score = len(job_chunk_tokens.intersection(resume_chunk_tokens)) / len(job_chunk_tokens)
+            if score > best_score:
+                best_score = score
+                best_resume_chunk = resume_chunk
+        chunk_scores.append(best_score)
+        top_matches.append({"job_excerpt": job_chunk, "resume_excerpt": best_resume_chunk, "score": round(best_score, 4)})
+
+    coverage_score = sum(1 for score in chunk_scores if score >= 0.35) / len(chunk_scores) if chunk_scores else 0.0
+    semantic_score = sum(chunk_scores) / len(chunk_scores) if chunk_scores else lexical_overlap
+    final_score = max(0.0, min(1.0, semantic_score * 0.7 + lexical_overlap * 0.3))
+    top_matches = sorted(top_matches, key=lambda item: item["score"], reverse=True)[:3]
+    return {
+        "score": round(final_score, 4),
+        "semantic_score": round(semantic_score, 4),
+        "lexical_overlap": round(lexical_overlap, 4),
+        "coverage_score": round(coverage_score, 4),
+        "matched_keywords": shared_keywords[:30],
+        "missing_keywords": missing_keywords[:30],
+        "top_matches": top_matches,
+        "method": "lightweight-keyword-match",
+        "model": None,
+    }
+
+
+WORDS = [
+    "python", "sql", "react", "node.js", "c++", "c#", "kubernetes", "docker", "pipeline", "latency",
+    "built", "designed", "team", "customers", "the", "and", "with", "data", "models", "api",
+    "AWS", "Go", "ml-ops", "etl", "tests", "ci/cd", "dashboards", "streaming", "kafka", "redis",
+]
+
+
+def random_text(rng, lines):
+    out = []
+    for _ in range(lines):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(2, 16))]
+        bullet = rng.choice(["", "• ", "- ", "\t"])
+        end = rng.choice([".", "", "!", " -", "?"])
+        out.append(bullet + " ".join(words) + end)
+    return rng.choice(["\n", " ", "\n\n"]).join(out)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_legacy_output(seed):
+    rng = random.Random(seed)
+    resume = random_text(rng, rng.randint(0, 30))
+    job = random_text(rng, rng.randint(0, 30))
+    assert _compute_lightweight_match(resume, job) == legacy_lightweight_match(resume, job)
+
+
+def test_degenerate_inputs_match_legacy():
+    for resume, job in [("", ""), ("short", "tiny"), ("x" * 40, "the and with for from " * 3), ("Python SQL " * 5, "")]:
+        assert _compute_lightweight_match(resume, job) == legacy_lightweight_match(resume, job)
+
+
+def test_resume_profile_is_cached():
+    resume = "Built Python data pipelines with SQL and Kafka for streaming analytics.\n" * 3
+    assert _resume_keyword_profile(resume) is _resume_keyword_profile(resume)
@@ -0,0 +1,166 @@
+"""
+Tests for POST /api/keywords/match/batch.
+Catalog loading and the sentence-transformer are replaced with fakes.
+"""
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from backend.app import create_app
+from backend.app.features.keywords import api as keywords_api
+
+RESUME_TEXT = (
+    "Built a Python data pipeline that loads SQL tables every hour for analysts.\n"
+    "Maintained React frontend components and wrote Jest tests for the dashboard.\n"
+)
+DESCRIPTIONS = [
+    "We need a frontend engineer with React experience who writes Jest tests for dashboards.",
+    "Hardware role: design FPGA boards and debug oscilloscope traces in the lab every week.",
+    "Data engineer to build Python pipelines that load SQL tables for analysts every hour.",
+]
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _auth_headers(client, email="batch@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def _store_resume(app, email="batch@test.com", text=RESUME_TEXT):
+    parsed = {"sections": [{"name": "full_content", "content": text}]}
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        user_id = conn.execute("SELECT id FROM users WHERE email = ?", (email,)).fetchone()["id"]
+        conn.execute(
+            "INSERT INTO resumes (user_id, file_path, parsed_json) VALUES (?, 'r.pdf', ?)",
+            (user_id, json.dumps(parsed)),
+        )
+        conn.commit()
+        return user_id
+
+
+def test_batch_ranks_descriptions_and_stores_every_analysis(app, client):
+    headers = _auth_headers(client)
+    user_id = _store_resume(app)
+
+    rv = client.post("/api/keywords/match/batch", json={"job_descriptions": DESCRIPTIONS}, headers=headers)
+    data = json.loads(rv.data)
+
+    assert rv.status_code == 200
+    scores = [result["score"] for result in data["results"]]
+    assert scores == sorted(scores, reverse=True)
+    assert data["results"][-1]["index"] == 1
+    for result in data["results"]:
+        expected = keywords_api._compute_lightweight_match(RESUME_TEXT, DESCRIPTIONS[result["index"]])
+        assert {key: result[key] for key in expected} == expected
+
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        rows = conn.execute("SELECT job_text, match_score FROM keyword_analyses ORDER BY id").fetchall()
+        best = conn.execute("SELECT best_resume_score FROM user_progress WHERE user_id = ?", (user_id,)).fetchone()
+    assert [row["job_text"] for row in rows] == DESCRIPTIONS
+    assert best["best_resume_score"] == int(max(scores) * 100)
+
+
+def test_batch_accepts_catalog_job_ids(app, client):
+    headers = _auth_headers(client)
+    _store_resume(app)
+    catalog = [
+        {"id": "a1", "simplify_url": None, "description_seed": DESCRIPTIONS[0]},
+        {"id": "b2", "simplify_url": None, "description_seed": DESCRIPTIONS[2]},
+    ]
+    with patch.object(keywords_api, "_load_new_grad_jobs", return_value=catalog):
+        rv = client.post("/api/keywords/match/batch", json={"job_ids": ["a1", "b2"]}, headers=headers)
+        missing = client.post("/api/keywords/match/batch", json={"job_ids": ["a1", "zz"]}, headers=headers)
+
+    data = json.loads(rv.data)
+    assert [result["job_id"] for result in data["results"]] == ["b2", "a1"]
+    assert missing.status_code == 404
+    assert json.loads(missing.data)["unknown_job_ids"] == ["zz"]
+
+
+def test_batch_hybrid_shares_resume_embeddings(app, client):
+    np = pytest.importorskip("numpy")
+
+    class FakeModel:
+        def __init__(self):
+            self.encoded = []
+
+        def encode(self, texts, normalize_embeddings=True):
+            self.encoded.extend(texts)
+            rows = np.array([[len(text) % 7 + 1.0, 1.0, text.count("e") + 1.0] for text in texts], dtype=np.float32)
+            return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+    headers = _auth_headers(client)
+    _store_resume(app)
+    app.config["KEYWORD_MATCH_METHOD"] = "hybrid"
+    model = FakeModel()
+    with patch.object(keywords_api, "_load_sentence_transformer", return_value=model):
+        rv = client.post("/api/keywords/match/batch", json={"job_descriptions": DESCRIPTIONS}, headers=headers)
+
+    data = json.loads(rv.data)
+    assert rv.status_code == 200
+    assert {result["method"] for result in data["results"]} == {"sentence-transformers-hybrid"}
+    resume_chunks = keywords_api._split_text_chunks(RESUME_TEXT, max_chunks=keywords_api.HYBRID_MATCH_MAX_CHUNKS)
+    assert sum(text in resume_chunks for text in model.encoded) == len(resume_chunks)
+
+
+def test_batch_validates_input(client):
+    headers = _auth_headers(client)
+    assert client.post("/api/keywords/match/batch", json={}, headers=headers).status_code == 400
+    assert client.post(
+        "/api/keywords/match/batch", json={"job_descriptions": ["x"] * 51}, headers=headers
+    ).status_code == 400
+    assert client.post(
+        "/api/keywords/match/batch", json={"job_descriptions": DESCRIPTIONS}, headers=headers
+    ).status_code == 404
+
+
+def test_batch_resume_without_text_is_a_client_error(app, client):
+    # 422 would read as an expired session to the frontend client and log the user out
+    headers = _auth_headers(client)
+    _store_resume(app, text="")
+    rv = client.post("/api/keywords/match/batch", json={"job_descriptions": DESCRIPTIONS}, headers=headers)
+    assert rv.status_code == 400
@@ -0,0 +1,185 @@
+"""
+Tests for GET /api/keywords/jobs/recommendations.
+The catalog loader and sentence-transformer are replaced with fakes.
+"""
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.app import create_app
+from backend.app.features.keywords import api as keywords_api
+from backend.app.features.keywords.service import JobCatalogIndex
+
+VOCAB = ["python", "data", "pipeline", "react", "frontend", "hardware", "fpga", "sql"]
+RESUME_TEXT = (
+    "Built a Python data pipeline that loads SQL tables every hour for analysts.\n"
+    "Maintained Python services and data quality checks across the pipeline.\n"
+)
+
+
+def _job(index, role, category, location):
+    return {
+        "id": f"job-{index}",
+        "category": category,
+        "company": f"Company {index}",
+        "role": role,
+        "location": location,
+        "description_seed": f"Company {index} - {role} - {location} - {category}",
+    }
+
+
+CATALOG = [
+    _job(1, "Frontend Engineer React", "Software Engineering", "New York, NY"),
+    _job(2, "Data Engineer Python SQL pipeline", "Data Science", "Remote"),
+    _job(3, "FPGA Hardware Engineer", "Hardware Engineering", "Austin, TX"),
+    _job(4, "Python Data Analyst", "Data Science", "New York, NY"),
+]
+
+
+class BagOfWordsModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.encoded.extend(texts)
+        rows = []
+        for text in texts:
+            lowered = text.lower()
+            row = np.array([lowered.count(word) for word in VOCAB] + [0.1], dtype=np.float32)
+            rows.append(row / np.linalg.norm(row))
+        return np.stack(rows)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def model():
+    model = BagOfWordsModel()
+    with patch.object(keywords_api, "_load_sentence_transformer", return_value=model), \
+            patch.object(keywords_api, "job_catalog_index", JobCatalogIndex()), \
+            patch.object(keywords_api, "_load_new_grad_jobs", side_effect=lambda: list(CATALOG)):
+        yield model
+
+
+def _auth_headers(client, email="recs@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def _store_resume(app, email="recs@test.com", text=RESUME_TEXT):
+    parsed = {"sections": [{"name": "full_content", "content": text}]}
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        user_id = conn.execute("SELECT id FROM users WHERE email = ?", (email,)).fetchone()["id"]
+        conn.execute(
+            "INSERT INTO resumes (user_id, file_path, parsed_json) VALUES (?, 'r.pdf', ?)",
+            (user_id, json.dumps(parsed)),
+        )
+        conn.commit()
+
+
+def test_recommendations_rank_whole_catalog(app, client, model):
+    headers = _auth_headers(client)
+    _store_resume(app)
+
+    rv = client.get("/api/keywords/jobs/recommendations?limit=2", headers=headers)
+    data = json.loads(rv.data)
+
+    assert rv.status_code == 200
+    assert data["method"] == "sentence-transformers-catalog"
+    assert [job["id"] for job in data["jobs"]] == ["job-2", "job-4"]
+    assert data["total_candidates"] == 4
+    assert data["jobs"][0]["match_score"] >= data["jobs"][1]["match_score"]
+
+
+def test_recommendations_filters_and_reuses_catalog_matrix(app, client, model):
+    headers = _auth_headers(client)
+    _store_resume(app)
+
+    client.get("/api/keywords/jobs/recommendations", headers=headers)
+    encoded_once = len(model.encoded)
+    rv = client.get(
+        "/api/keywords/jobs/recommendations?category=Software%20Engineering&location=new%20york",
+        headers=headers,
+    )
+    data = json.loads(rv.data)
+
+    assert [job["id"] for job in data["jobs"]] == ["job-1"]
+    assert len(model.encoded) == encoded_once
+
+
+def test_catalog_index_encodes_only_new_jobs():
+    model = BagOfWordsModel()
+    index = JobCatalogIndex()
+    index.sync(CATALOG[:3], model, "fake")
+    jobs, matrix = index.sync(CATALOG, model, "fake")
+
+    assert model.encoded == [job["description_seed"] for job in CATALOG]
+    assert matrix.shape == (4, len(VOCAB) + 1)
+    assert index.stats()["rebuilds"] == 2
+
+
+def test_recommendations_fall_back_to_keywords(app, client):
+    headers = _auth_headers(client)
+    _store_resume(app)
+    with patch.object(keywords_api, "_load_sentence_transformer", side_effect=ImportError("no model")), \
+            patch.object(keywords_api, "_load_new_grad_jobs", side_effect=lambda: list(CATALOG)):
+        rv = client.get("/api/keywords/jobs/recommendations?limit=1", headers=headers)
+
+    data = json.loads(rv.data)
+    assert data["method"] == "keyword-overlap"
+    assert data["jobs"][0]["id"] == "job-2"
+
+
+def test_recommendations_require_a_resume(client, model):
+    headers = _auth_headers(client)
+    assert client.get("/api/keywords/jobs/recommendations", headers=headers).status_code == 404
+
+
+def test_recommendations_for_a_resume_without_text_are_a_client_error(app, client, model):
+    # 422 would read as an expired session to the frontend client and log the user out
+    headers = _auth_headers(client)
+    _store_resume(app, text="")
+    assert client.get("/api/keywords/jobs/recommendations", headers=headers).status_code == 400
@@ -31,10 +31,11 @@ def _run_schema(conn, schema_path: str):
 
 
 @pytest.fixture
-def app():
+def app(monkeypatch):
     """Create app with a temporary database and run schema."""
     fd, path = tempfile.mkstemp(suffix=".db")
     os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
     app = create_app()
     app.config["TESTING"] = True
     app.config["DATABASE"] = path
@@ -0,0 +1,121 @@
+"""
+Service-level tests for submit_answers grading modes.
+Uses an in-memory SQLite DB and a fake AIHelper with controllable latency.
+"""
+import os
+import sqlite3
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from backend.app.features.mock_interview.service import create_session, submit_answers
+
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+)
+
+
+class SlowFakeAI:
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def generateInterviewFeedback(self, question, answer, role="", company=""):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(answer, 0.0))
+            return {"summary": f"llm:{answer}", "overall_score": 80.0}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _heuristic_feedback(self, question, answer, role, company):
+        return {"summary": f"heuristic:{answer}", "overall_score": 40.0}
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    with open(SCHEMA_PATH) as f:
+        conn.executescript(f.read())
+    conn.execute(
+        "INSERT INTO users (id, email, password_hash, name) VALUES (1, 'a@b.co', 'x', 'A')"
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _answers(n):
+    return {f"q{i}": {"answer": f"a{i}", "prompt": f"Prompt {i}"} for i in range(1, n + 1)}
+
+
+def test_concurrent_grading_keeps_qid_order_and_bounds_workers(conn):
+    fake = SlowFakeAI({"a1": 0.15, "a2": 0.05, "a3": 0.1, "a4": 0.0, "a5": 0.05})
+    session_id = create_session(conn, 1, "SWE", "Acme")
+    with patch("backend.app.features.mock_interview.service.AIHelper", return_value=fake):
+        result = submit_answers(
+            conn, session_id, 1, _answers(5), "SWE", "Acme",
+            grading_mode="concurrent", max_workers=2, timeout_seconds=5,
+        )
+
+    assert list(result["feedback"]) == ["q1", "q2", "q3", "q4", "q5"]
+    assert list(result["latency_ms"]) == ["q1", "q2", "q3", "q4", "q5"]
+    assert fake.max_active <= 2
+    assert result["grading"]["timed_out"] == []
+    rows = conn.execute(
+        "SELECT qid FROM answers WHERE interview_id = ? ORDER BY id", (session_id,)
+    ).fetchall()
+    assert [r["qid"] for r in rows] == ["q1", "q2", "q3", "q4", "q5"]
+
+
+def test_concurrent_grading_falls_back_on_timeout(conn):
+    fake = SlowFakeAI({"a2": 1.0})
+    session_id = create_session(conn, 1, "SWE", "Acme")
+    with patch("backend.app.features.mock_interview.service.AIHelper", return_value=fake):
+        started = time.perf_counter()
+        result = submit_answers(
+            conn, session_id, 1, _answers(3), "SWE", "Acme",
+            grading_mode="concurrent", max_workers=3, timeout_seconds=0.2,
+        )
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.9
+    assert result["grading"]["timed_out"] == ["q2"]
+    assert result["feedback"]["q2"]["summary"] == "heuristic:a2"
+    assert result["feedback"]["q1"]["summary"] == "llm:a1"
+    assert result["average_score"] == pytest.approx((80 + 40 + 80) / 3, abs=0.01)
+
+
+def test_unknown_grading_mode_is_rejected(conn):
+    session_id = create_session(conn, 1, "SWE", "Acme")
+    with pytest.raises(ValueError):
+        submit_answers(conn, session_id, 1, _answers(1), "", "", grading_mode="nope")
+
+
+def test_batch_grading_makes_one_call(conn):
+    class BatchFakeAI(SlowFakeAI):
+        batch_calls = 0
+
+        def generateInterviewFeedbackBatch(self, items, role="", company=""):
+            self.batch_calls += 1
+            return [{"summary": f"batch:{i['answer']}", "overall_score": 70.0} for i in items]
+
+    fake = BatchFakeAI({})
+    session_id = create_session(conn, 1, "SWE", "Acme")
+    with patch("backend.app.features.mock_interview.service.AIHelper", return_value=fake):
+        result = submit_answers(
+            conn, session_id, 1, _answers(4), "SWE", "Acme", grading_mode="batch",
+        )
+
+    assert fake.batch_calls == 1
+    assert list(result["feedback"]) == ["q1", "q2", "q3", "q4"]
+    assert result["feedback"]["q3"]["summary"] == "batch:a3"
+    assert result["grading"]["mode"] == "batch"
@@ -0,0 +1,138 @@
+"""
+Tests for progress awards running as one unit of work, and for progress reads
+never writing.
+"""
+import json
+import os
+import tempfile
+
+import pytest
+from backend.app import create_app
+from backend.app.db import get_db, unit_of_work
+from backend.app.features.progress.service import award_resume_score, get_progress_payload
+from backend.app.features.resume_jobs.service import reuse_resume
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _auth_headers(client, email="progress@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def _user_id():
+    return get_db().execute("SELECT id FROM users").fetchone()["id"]
+
+
+def _traced(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    return statements
+
+
+def test_reading_progress_never_writes(app, client):
+    headers = _auth_headers(client)
+
+    rv = client.get("/api/v1/progress/me", headers=headers)
+
+    assert rv.status_code == 200
+    assert json.loads(rv.data)["points"] == 0
+    with app.app_context():
+        conn = get_db()
+        statements = _traced(conn)
+        try:
+            assert get_progress_payload(_user_id())["level"] == 1
+        finally:
+            conn.set_trace_callback(None)
+        assert conn.execute("SELECT COUNT(*) FROM user_progress").fetchone()[0] == 0
+    assert all(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
+
+def test_award_is_one_commit(app, client):
+    _auth_headers(client)
+    with app.app_context():
+        conn = get_db()
+        user_id = _user_id()
+        statements = _traced(conn)
+        try:
+            award_resume_score(user_id, 55)
+            award_resume_score(user_id, 40)  # no improvement, nothing to write
+        finally:
+            conn.set_trace_callback(None)
+
+        assert statements.count("COMMIT") == 1
+        payload = get_progress_payload(user_id)
+    assert (payload["points"], payload["best_resume_score"]) == (110, 55)
+    assert set(payload["badges"]) == {"first_steps", "resume_starter", "consistency_100"}
+
+
+def test_upload_and_award_share_one_transaction(app, client):
+    _auth_headers(client)
+    source = {"file_path": "cv.pdf", "parsed_json": "{}", "score": 72, "summary": "ok", "details_json": "{}"}
+    with app.app_context():
+        conn = get_db()
+        user_id = _user_id()
+        statements = _traced(conn)
+        try:
+            result = reuse_resume(user_id, "hash", source, "copy.pdf", "copy.pdf")
+        finally:
+            conn.set_trace_callback(None)
+
+        assert statements.count("COMMIT") == 1
+        assert conn.execute(
+            "SELECT latest_feedback_id IS NOT NULL FROM resumes WHERE id = ?", (result["resume_db_id"],)
+        ).fetchone()[0]
+        assert get_progress_payload(user_id)["best_resume_score"] == 72
+
+
+def test_unit_of_work_rolls_back_the_whole_flow(app, client):
+    _auth_headers(client)
+    with app.app_context():
+        conn = get_db()
+        user_id = _user_id()
+        with pytest.raises(RuntimeError):
+            with unit_of_work():
+                award_resume_score(user_id, 90)
+                raise RuntimeError("boom")
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM user_progress").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM user_badges").fetchone()[0] == 0
+
+        award_resume_score(user_id, 90)
+        assert get_progress_payload(user_id)["best_resume_score"] == 90
@@ -0,0 +1,126 @@
+"""
+Tests for the resumes.latest_feedback_id pointer: kept current on insert and
+backfilled by migration 0007 for existing data.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+
+import pytest
+from backend.app import create_app, migrations
+from backend.app.features.resume_jobs.service import insert_feedback_report
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _auth_headers(client, email="latest@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def test_newest_report_is_listed(app, client):
+    headers = _auth_headers(client)
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        user_id = conn.execute("SELECT id FROM users").fetchone()["id"]
+        resume_id = conn.execute(
+            "INSERT INTO resumes (user_id, file_path, parsed_json) VALUES (?, 'r.pdf', '{}')", (user_id,)
+        ).lastrowid
+        insert_feedback_report(conn, resume_id, 40, "first", "{}")
+        latest = insert_feedback_report(conn, resume_id, 70, "second", "{}")
+        conn.commit()
+        assert conn.execute(
+            "SELECT latest_feedback_id FROM resumes WHERE id = ?", (resume_id,)
+        ).fetchone()[0] == latest
+
+    resumes = json.loads(client.get("/api/resume", headers=headers).data)["resumes"]
+    assert [(r["id"], r["resumeScore"], r["resumeSummary"]) for r in resumes] == [(resume_id, 70, "second")]
+
+
+def test_update_moves_the_pointer(app, client):
+    headers = _auth_headers(client)
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        user_id = conn.execute("SELECT id FROM users").fetchone()["id"]
+        resume_id = conn.execute(
+            "INSERT INTO resumes (user_id, file_path, parsed_json) VALUES (?, 'r.pdf', '{}')", (user_id,)
+        ).lastrowid
+        insert_feedback_report(conn, resume_id, 1, "stale", json.dumps({"metrics": {}, "suggestions": []}))
+        conn.commit()
+
+    rv = client.put(
+        f"/api/resume/{resume_id}",
+        json={"resumeText": "Experience\n- Built a Python pipeline that cut costs by 20%"},
+        headers=headers,
+    )
+
+    assert rv.status_code == 200
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        newest = conn.execute(
+            "SELECT id, summary FROM feedback_reports WHERE resume_id = ? ORDER BY id DESC LIMIT 1", (resume_id,)
+        ).fetchone()
+        assert conn.execute("SELECT latest_feedback_id FROM resumes").fetchone()[0] == newest["id"]
+    assert json.loads(rv.data)["resumeSummary"] == newest["summary"]
+
+
+def test_migration_backfills_latest_by_created_at_then_id():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE resumes (id INTEGER PRIMARY KEY, user_id INTEGER, file_path TEXT);
+        CREATE TABLE feedback_reports (id INTEGER PRIMARY KEY, resume_id INTEGER, created_at TIMESTAMP);
+        INSERT INTO resumes (id) VALUES (1), (2), (3);
+        INSERT INTO feedback_reports (id, resume_id, created_at) VALUES
+          (10, 1, '2026-01-02 00:00:00'),
+          (11, 1, '2026-01-01 00:00:00'),
+          (12, 2, '2026-01-01 00:00:00'),
+          (13, 2, '2026-01-01 00:00:00');
+        """
+    )
+    backfill = {migration.name: migration for migration in migrations.load_migrations()}["resume_latest_feedback"]
+    backfill.upgrade(conn)
+
+    assert conn.execute("SELECT id, latest_feedback_id FROM resumes ORDER BY id").fetchall() == [
+        (1, 10), (2, 13), (3, None),
+    ]
@@ -0,0 +1,295 @@
+"""
+Integration tests for async resume uploads and the job status endpoint.
+Uses a temporary SQLite DB and upload folder; no external AI calls are made.
+"""
+import io
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
+
+import fitz
+import pytest
+from backend.app import create_app
+
+
+RESUME_TEXT = (
+    "Jane Doe\njane@example.com\n555 123 4567\n"
+    "Experience\n- Built a data pipeline that reduced costs by 20%\n"
+    "Skills\nPython, SQL\nEducation\nState University 2023\n"
+)
+
+
+@lru_cache(maxsize=None)
+def _pdf_bytes(text: str) -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    upload_dir = tempfile.mkdtemp()
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    app.config["UPLOAD_FOLDER"] = upload_dir
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "database", "schema.sql"
+    )
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _auth_headers(client, email):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def _upload(client, headers, query="", filename="resume.pdf"):
+    return client.post(
+        f"/api/resume/upload{query}",
+        data={"file": (io.BytesIO(_pdf_bytes(RESUME_TEXT)), filename, "application/pdf")},
+        content_type="multipart/form-data",
+        headers=headers,
+    )
+
+
+def _wait_for_job(client, headers, job_id, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        rv = client.get(f"/api/resume/jobs/{job_id}", headers=headers)
+        data = json.loads(rv.data)
+        if data["status"] in {"completed", "failed"}:
+            return data
+        time.sleep(0.05)
+    raise AssertionError("resume job did not finish")
+
+
+def test_async_upload_returns_job_and_completes(client):
+    headers = _auth_headers(client, "async@test.com")
+    rv = _upload(client, headers, "?async=true")
+    assert rv.status_code == 202
+    job_id = json.loads(rv.data)["job_id"]
+
+    job = _wait_for_job(client, headers, job_id)
+    assert job["status"] == "completed", job
+    assert [s["stage"] for s in job["stages"]] == ["parsing", "extracting", "scoring", "storing"]
+    assert all(s["duration_ms"] is not None for s in job["stages"])
+    assert job["result"]["resume_db_id"] == job["resume_db_id"]
+    assert job["result"]["filename"] == "resume.pdf"
+
+    listed = json.loads(client.get("/api/resume", headers=headers).data)["resumes"]
+    assert [r["id"] for r in listed] == [job["resume_db_id"]]
+
+
+def test_sync_upload_still_returns_result(client):
+    headers = _auth_headers(client, "sync@test.com")
+    rv = _upload(client, headers)
+    assert rv.status_code == 200
+    data = json.loads(rv.data)
+    assert data["resume_db_id"]
+    assert "resume_score" in data
+
+
+def test_job_is_private_to_its_owner(client):
+    owner = _auth_headers(client, "owner@test.com")
+    other = _auth_headers(client, "other@test.com")
+    job_id = json.loads(_upload(client, owner, "?async=1").data)["job_id"]
+    _wait_for_job(client, owner, job_id)
+    assert client.get(f"/api/resume/jobs/{job_id}", headers=other).status_code == 404
+    assert client.get("/api/resume/jobs/does-not-exist", headers=owner).status_code == 404
+
+
+def test_interrupted_jobs_are_failed(app, client):
+    from backend.app.db import get_db
+    from backend.app.features.resume_jobs.service import ResumeJobDAO, fail_interrupted_resume_jobs
+
+    headers = _auth_headers(client, "restart@test.com")
+    upload = os.path.join(app.config["UPLOAD_FOLDER"], "lost.pdf")
+    with open(upload, "wb") as f:
+        f.write(_pdf_bytes("lost"))
+    with app.app_context():
+        conn = get_db()
+        user_id = conn.execute("SELECT id FROM users").fetchone()["id"]
+        dao = ResumeJobDAO(conn)
+        stale_id = dao.create(user_id, upload, "lost.pdf")
+        fresh_id = dao.create(user_id, upload, "lost.pdf")
+        dao.update_progress(stale_id, "running", "scoring", [])
+        conn.execute(
+            "UPDATE resume_jobs SET updated_at = datetime('now', '-1 hour') WHERE id = ?", (stale_id,)
+        )
+        conn.commit()
+
+    job = json.loads(client.get(f"/api/resume/jobs/{stale_id}", headers=headers).data)
+    assert job["status"] == "failed"
+    assert "restart" in job["error"]
+    assert json.loads(client.get(f"/api/resume/jobs/{fresh_id}", headers=headers).data)["status"] == "queued"
+
+    with app.app_context():
+        conn = get_db()
+        conn.execute("UPDATE resume_jobs SET updated_at = datetime('now', '-1 hour')")
+        conn.commit()
+        assert fail_interrupted_resume_jobs(conn, app.config["RESUME_JOB_STALE_SECONDS"]) == 1
+        assert ResumeJobDAO(conn).get(fresh_id)["status"] == "failed"
+    assert not os.path.exists(upload)
+
+
+def test_duplicate_upload_reuses_results_and_keeps_its_own_file(app, client):
+    alice = _auth_headers(client, "alice@test.com")
+
+    first = json.loads(_upload(client, alice, filename="alice_private.pdf").data)
+    again = json.loads(_upload(client, alice, filename="copy.pdf").data)
+
+    assert "deduplicated" not in first
+    assert again["deduplicated"] is True
+    assert again["resume_score"] == first["resume_score"]
+    listed = json.loads(client.get("/api/resume", headers=alice).data)["resumes"]
+    assert [r["filename"] for r in listed] == ["copy.pdf", "alice_private.pdf"]
+    assert len(os.listdir(app.config["UPLOAD_FOLDER"])) == 2
+
+    # Deleting the first upload leaves the copy's own file in place.
+    client.delete(f"/api/resume/{first['resume_db_id']}", headers=alice)
+    assert client.get(f"/api/resume/{again['resume_db_id']}/view", headers=alice).status_code == 200
+    client.delete(f"/api/resume/{again['resume_db_id']}", headers=alice)
+    assert os.listdir(app.config["UPLOAD_FOLDER"]) == []
+
+
+def test_shared_legacy_file_is_kept_until_its_last_row_is_deleted(app, client):
+    alice = _auth_headers(client, "alice@test.com")
+    bob = _auth_headers(client, "bob@test.com")
+    first = json.loads(_upload(client, alice, filename="alice_private.pdf").data)
+    other = json.loads(_upload(client, bob).data)
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        shared = conn.execute("SELECT file_path FROM resumes WHERE id = ?", (first["resume_db_id"],)).fetchone()[0]
+        os.remove(conn.execute("SELECT file_path FROM resumes WHERE id = ?", (other["resume_db_id"],)).fetchone()[0])
+        # Deduplicated rows from before per-upload files point at one file and have no original_name
+        conn.execute(
+            "UPDATE resumes SET file_path = ?, original_name = NULL WHERE id = ?", (shared, other["resume_db_id"])
+        )
+        conn.commit()
+
+    client.delete(f"/api/resume/{first['resume_db_id']}", headers=alice)
+    assert client.get(f"/api/resume/{other['resume_db_id']}/view", headers=bob).status_code == 200
+    client.delete(f"/api/resume/{other['resume_db_id']}", headers=bob)
+    assert os.listdir(app.config["UPLOAD_FOLDER"]) == []
+
+
+def test_duplicate_upload_never_reuses_another_users_resume(app, client):
+    alice = _auth_headers(client, "alice@test.com")
+    bob = _auth_headers(client, "bob@test.com")
+    first = json.loads(_upload(client, alice, filename="alice_private.pdf").data)
+    client.put(f"/api/resume/{first['resume_db_id']}", json={"resumeText": "ALICE SECRET EDIT"}, headers=alice)
+    client.patch(
+        f"/api/resume/{first['resume_db_id']}/fields",
+        json={"extracted_data": {"phone": "ALICE-PHONE"}},
+        headers=alice,
+    )
+
+    other = json.loads(_upload(client, bob).data)
+    assert "deduplicated" not in other
+    bobs = client.get("/api/resume", headers=bob).data.decode()
+    assert "ALICE" not in bobs and "ALICE" not in json.dumps(other)
+    assert "alice_private.pdf" not in bobs
+
+    # Alice's edited row no longer matches the original file either.
+    again = json.loads(_upload(client, alice).data)
+    assert "deduplicated" not in again
+    assert "ALICE" not in json.dumps(again["parsed_data"])
+
+
+def test_backfill_resume_hashes_command(app, client):
+    headers = _auth_headers(client, "backfill@test.com")
+    resume_id = json.loads(_upload(client, headers).data)["resume_db_id"]
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        conn.execute("UPDATE resumes SET content_hash = NULL")
+        conn.commit()
+
+    result = app.test_cli_runner().invoke(args=["backfill-resume-hashes"])
+    assert "Hashed 1 resumes" in result.output
+
+    with app.app_context():
+        from backend.app.db import get_db
+        row = get_db().execute(
+            "SELECT content_hash FROM resumes WHERE id = ?", (resume_id,)
+        ).fetchone()
+        assert len(row["content_hash"]) == 64
+
+
+def _mark_feedback_stale(app):
+    with app.app_context():
+        from backend.app.db import get_db
+        conn = get_db()
+        conn.execute("UPDATE feedback_reports SET details_json = '{\"score\": 50}'")
+        conn.commit()
+
+
+def _feedback_count(app):
+    with app.app_context():
+        from backend.app.db import get_db
+        return get_db().execute("SELECT COUNT(*) FROM feedback_reports").fetchone()[0]
+
+
+def test_stale_evaluation_is_written_back_once(app, client):
+    headers = _auth_headers(client, "stale@test.com")
+    resume_id = json.loads(_upload(client, headers).data)["resume_db_id"]
+    _mark_feedback_stale(app)
+
+    listed = json.loads(client.get("/api/resume", headers=headers).data)["resumes"]
+    assert "metrics" in listed[0]["resumeDetails"]
+    assert _feedback_count(app) == 2
+
+    client.get("/api/resume", headers=headers)
+    single = json.loads(client.get(f"/api/resume/{resume_id}", headers=headers).data)
+    assert single["resumeScore"] == listed[0]["resumeScore"]
+    assert _feedback_count(app) == 2
+
+
+def test_rescore_resumes_command_is_resumable(app, client):
+    headers = _auth_headers(client, "rescore@test.com")
+    first = json.loads(_upload(client, headers).data)["resume_db_id"]
+    _upload(client, headers)
+    _mark_feedback_stale(app)
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["rescore-resumes", "--batch-size", "1", "--start-after", str(first)])
+    assert "Rescored 1 resumes" in result.output
+    result = runner.invoke(args=["rescore-resumes"])
+    assert "Rescored 1 resumes" in result.output
+    result = runner.invoke(args=["rescore-resumes"])
+    assert "Rescored 0 resumes" in result.output
+    assert _feedback_count(app) == 4
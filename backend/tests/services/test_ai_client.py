@@ -0,0 +1,130 @@
+"""
+Tests for the process-wide Gemini model registry.
+Uses a fake google.generativeai module so no network calls are made.
+"""
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from backend.app.services import ai_client
+from backend.app.services.ai_client import ModelRegistry
+from backend.app.services.ai_helper import AIHelper
+
+
+class FakeGenAI:
+    def __init__(self, names):
+        self.names = names
+        self.list_calls = 0
+
+    def configure(self, api_key):
+        self.api_key = api_key
+
+    def list_models(self):
+        self.list_calls += 1
+        return [
+            SimpleNamespace(name=name, supported_generation_methods=["generateContent"])
+            for name in self.names
+        ]
+
+    def GenerativeModel(self, name):
+        return SimpleNamespace(model_name=name)
+
+
+@pytest.fixture
+def fake_genai(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    fake = FakeGenAI(["models/gemini-pro", "models/gemini-1.5-flash"])
+    monkeypatch.setattr(ai_client, "genai", fake)
+    return fake
+
+
+def test_discovery_runs_once_per_ttl(fake_genai):
+    registry = ModelRegistry(ttl_seconds=60)
+    for _ in range(5):
+        model, name = registry.get_model()
+
+    assert name == "models/gemini-1.5-flash"
+    assert model.model_name == name
+    assert fake_genai.list_calls == 1
+    stats = registry.stats()
+    assert stats["discovery_runs"] == 1
+    assert stats["cache_hits"] == 4
+
+
+def test_discovery_reruns_after_ttl(fake_genai):
+    registry = ModelRegistry(ttl_seconds=0)
+    registry.get_model()
+    registry.get_model()
+    assert registry.stats()["discovery_runs"] == 2
+
+
+def test_ai_helper_uses_shared_registry(fake_genai):
+    registry = ModelRegistry(ttl_seconds=60)
+    with patch("backend.app.services.ai_helper.model_registry", registry):
+        helpers = [AIHelper() for _ in range(3)]
+
+    assert all(h.model is helpers[0].model for h in helpers)
+    assert fake_genai.list_calls == 1
+
+
+def test_missing_api_key_is_cached(monkeypatch):
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    registry = ModelRegistry(ttl_seconds=60)
+    assert registry.get_model() == (None, None)
+    assert registry.get_model() == (None, None)
+    assert registry.stats()["discovery_runs"] == 1
+
+
+def test_failed_discovery_is_retried_after_the_short_window(fake_genai, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(ai_client.time, "time", lambda: clock[0])
+    registry = ModelRegistry(ttl_seconds=3600, retry_seconds=60)
+
+    def unavailable():
+        fake_genai.list_calls += 1
+        raise ConnectionError("gemini unavailable")
+
+    healthy = fake_genai.list_models
+    fake_genai.list_models = unavailable
+    assert registry.get_model() == (None, None)
+    clock[0] += 30
+    assert registry.get_model() == (None, None)
+    assert fake_genai.list_calls == 1
+
+    fake_genai.list_models = healthy
+    clock[0] += 31
+    assert registry.get_model()[1] == "models/gemini-1.5-flash"
+    assert registry.stats()["last_discovery_failed"] is False
+
+    clock[0] += 600  # a successful discovery is kept for the full TTL
+    registry.get_model()
+    assert fake_genai.list_calls == 2
+
+
+def test_rediscovery_runs_outside_the_lock(fake_genai):
+    registry = ModelRegistry(ttl_seconds=0)
+    assert registry.get_model()[1] == "models/gemini-1.5-flash"
+
+    entered, release = threading.Event(), threading.Event()
+    healthy = fake_genai.list_models
+
+    def slow_list_models():
+        entered.set()
+        release.wait(5)
+        return healthy()
+
+    fake_genai.list_models = slow_list_models
+    worker = threading.Thread(target=registry.get_model)
+    worker.start()
+    assert entered.wait(5)
+
+    # While one thread is in list_models, others get the last model and stats without waiting.
+    assert registry.get_model()[1] == "models/gemini-1.5-flash"
+    stats = registry.stats()
+    assert stats["stale_served"] == 1
+    assert stats["discovery_runs"] == 2
+
+    release.set()
+    worker.join(5)
+    assert fake_genai.list_calls == 2
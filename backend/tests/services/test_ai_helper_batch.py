@@ -0,0 +1,81 @@
+"""
+Tests for AIHelper.generateInterviewFeedbackBatch with a stubbed Gemini model.
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+from backend.app.services import ai_helper as ai_helper_module
+from backend.app.services.ai_helper import AIHelper
+from backend.app.services.llm_cache import LLMResponseCache
+
+
+ITEMS = [
+    {"id": "q1", "question": "Describe a technical win.", "answer": "I built a cache that reduced latency by 40%."},
+    {"id": "q2", "question": "How do you handle conflict?", "answer": "I talk to the person directly."},
+    {"id": "q3", "question": "Why this company?", "answer": "I like the product."},
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(monkeypatch):
+    monkeypatch.setattr(ai_helper_module, "llm_cache", LLMResponseCache(path=None))
+
+
+class StubModel:
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(text=self.text)
+
+
+def _helper(model):
+    helper = AIHelper.__new__(AIHelper)
+    helper.model = model
+    helper.model_name = "models/stub"
+    helper.bypass_cache = False
+    return helper
+
+
+def test_batch_grades_with_one_call_and_falls_back_per_item():
+    payload = [
+        {
+            "id": "q1",
+            "summary": "Strong and specific.",
+            "strengths": ["Quantified impact"],
+            "suggestions": ["Mention tradeoffs"],
+            "metrics": {
+                "accuracy": {"score": 5},
+                "clearness": {"score": 4},
+                "confidence": {"score": 4},
+            },
+        },
+        # q2 is dropped entirely, q3 has no usable metrics
+        {"id": "q3", "summary": "??"},
+    ]
+    model = StubModel("```json\n" + json.dumps(payload) + "\n```")
+    results = _helper(model).generateInterviewFeedbackBatch(ITEMS, "SWE", "Acme")
+
+    assert model.calls == 1
+    assert len(results) == 3
+    assert results[0]["summary"] == "Strong and specific."
+    assert results[0]["overall_score"] == 90.0
+    assert results[0]["question"] == ITEMS[0]["question"]
+    assert results[1]["evaluator"]["provider"] == "heuristic"
+    assert results[2]["evaluator"]["provider"] == "heuristic"
+
+
+def test_batch_falls_back_when_response_is_not_json():
+    model = StubModel("not json at all")
+    results = _helper(model).generateInterviewFeedbackBatch(ITEMS)
+    assert [r["evaluator"]["method"] for r in results] == ["rule_based"] * 3
+
+
+def test_batch_without_model_uses_heuristics():
+    results = _helper(None).generateInterviewFeedbackBatch(ITEMS)
+    assert len(results) == 3
+    assert all(r["evaluator"]["provider"] == "heuristic" for r in results)
+    assert _helper(None).generateInterviewFeedbackBatch([]) == []
@@ -0,0 +1,113 @@
+"""
+Tests for the process-wide sentence-embedding backend.
+The runtime loaders are replaced with fakes so no model is downloaded.
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.app.services import embeddings
+from backend.app.services.embeddings import EmbeddingBackend, auto_threads
+
+
+class FakeModel:
+    def encode(self, texts, normalize_embeddings=True):
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeLoader:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, model_name, threads):
+        self.calls.append((model_name, threads))
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return FakeModel()
+
+
+def _loaders(loader):
+    return patch.dict(embeddings.LOADERS, {name: loader for name in embeddings.BACKENDS})
+
+
+def test_warm_loads_once_for_concurrent_callers():
+    loader = FakeLoader()
+    loader.release.clear()
+    backend = EmbeddingBackend(backend="onnx-int8", threads=2)
+    with _loaders(loader):
+        backend.warm()
+        backend.warm()
+        waiter = threading.Thread(target=backend.get)
+        waiter.start()
+        assert backend.stats()["loaded"] is False  # stats never wait on the load
+        loader.release.set()
+        backend.wait(5)
+        waiter.join(5)
+        backend.get()
+
+    assert loader.calls == [(embeddings.DEFAULT_MODEL, 2)]
+    stats = backend.stats()
+    assert stats["loaded"] is True
+    assert stats["loads"] == 1
+    assert stats["threads"] == 2
+
+
+def test_failed_load_is_remembered():
+    loader = FakeLoader(error=ImportError("No module named 'onnxruntime'"))
+    backend = EmbeddingBackend(backend="onnx")
+    with _loaders(loader):
+        for _ in range(3):
+            with pytest.raises(ImportError):
+                backend.get()
+
+    assert len(loader.calls) == 1
+    assert "onnxruntime" in backend.stats()["error"]
+
+
+def test_reconfiguring_resets_the_model():
+    loader = FakeLoader()
+    backend = EmbeddingBackend(threads=1)
+    with _loaders(loader):
+        backend.get()
+        backend.configure(backend="torch", threads=1)
+        backend.get()
+        backend.configure(backend="torch-int8")
+        backend.get()
+
+    assert len(loader.calls) == 2
+
+
+def test_configure_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        EmbeddingBackend().configure(backend="tensorrt")
+
+
+def test_model_key_marks_non_default_runtimes():
+    backend = EmbeddingBackend()
+    assert backend.model_key == embeddings.DEFAULT_MODEL
+    backend.configure(backend="onnx-int8")
+    assert backend.model_key == f"{embeddings.DEFAULT_MODEL}@onnx-int8"
+
+
+def test_encode_returns_float32_and_counts_texts():
+    backend = EmbeddingBackend(threads=1)
+    with _loaders(FakeLoader()):
+        vectors = backend.get().encode(["ab", "abcd"])
+
+    assert vectors.dtype == np.float32
+    assert vectors[:, 0].tolist() == [2.0, 4.0]
+    assert backend.stats()["texts"] == 2
+
+
+def test_auto_threads_splits_cpus_across_workers(monkeypatch):
+    assert auto_threads(cpu_count=8, workers=4) == 2
+    assert auto_threads(cpu_count=2, workers=4) == 1
+    monkeypatch.setenv("WEB_CONCURRENCY", "2")
+    assert auto_threads(cpu_count=8) == 4
@@ -0,0 +1,224 @@
+"""
+Parity tests for the rule-table interview heuristic.
+LegacyHeuristic keeps the previous per-marker implementation as the reference.
+"""
+import random
+
+from backend.app.services.ai_helper import AIHelper
+
+
+class LegacyHeuristic(AIHelper):
+    def __init__(self):
+        self.model = None
+        self.model_name = None
+        self.bypass_cache = False
+
+    def _heuristic_feedback(self, question, answer, role, company):
+        words = answer.split()
+        word_count = len(words)
+        answer_lower = answer.lower()
+        question_lower = question.lower()
+
+        question_terms = {
+            token.strip(".,!?")
+            for token in question_lower.split()
+            if len(token.strip(".,!?")) > 3
+        }
+        answer_terms = {
+            token.strip(".,!?")
+            for token in answer_lower.split()
+            if len(token.strip(".,!?")) > 3
+        }
+        overlap = len(question_terms & answer_terms)
+
+        behavioral_markers = sum(
+            1 for token in ["example", "when", "project", "team", "deadline", "challenge", "situation"]
+            if token in question_lower
+        )
+        technical_markers = sum(
+            1 for token in ["system", "debug", "algorithm", "database", "api", "performance", "bug"]
+            if token in question_lower
+        )
+
+        star_terms = sum(
+            1 for token in ["situation", "task", "action", "result"] if token in answer_lower
+        )
+        impact_signals = sum(
+            1 for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered"]
+            if token in answer_lower
+        )
+        evidence_signals = sum(
+            1 for token in ["for example", "for instance", "specifically", "because", "so that", "which led to"]
+            if token in answer_lower
+        )
+        ownership_signals = sum(
+            1 for token in ["i led", "i built", "i created", "i implemented", "i owned", "i drove", "i resolved"]
+            if token in answer_lower
+        )
+        filler_signals = sum(
+            1 for token in ["maybe", "i guess", "kind of", "sort of", "probably", "i think"]
+            if token in answer_lower
+        )
+        sentence_count = max(1, answer.count(".") + answer.count("!") + answer.count("?"))
+        avg_sentence_length = word_count / sentence_count
+        long_run_on_penalty = 1 if avg_sentence_length > 32 else 0
+        very_short_penalty = 1 if word_count < 25 else 0
+        very_long_penalty = 1 if word_count > 260 else 0
+
+        strengths = []
+        suggestions = []
+
+        accuracy_score = 1
+        if overlap >= 2:
+            accuracy_score += 1
+        if overlap >= 4:
+            accuracy_score += 1
+        if evidence_signals > 0:
+            accuracy_score += 1
+        if technical_markers > 0 and any(token in answer_lower for token in ["tradeoff", "root cause", "latency", "query", "cache", "test"]):
+            accuracy_score += 1
+        if behavioral_markers > 0 and (star_terms >= 2 or impact_signals > 0):
+            accuracy_score += 1
+        if very_short_penalty:
+            accuracy_score -= 1
+        accuracy_score = min(5, accuracy_score)
+        accuracy_score = max(1, accuracy_score)
+
+        clearness_score = 1
+        if 35 <= word_count <= 180:
+            clearness_score += 1
+        if star_terms >= 2 or any(token in answer_lower for token in ["first", "then", "finally"]):
+            clearness_score += 1
+        if avg_sentence_length <= 24:
+            clearness_score += 1
+        if evidence_signals > 0 and very_long_penalty == 0:
+            clearness_score += 1
+        clearness_score -= long_run_on_penalty
+        clearness_score -= very_short_penalty
+        clearness_score -= very_long_penalty
+        clearness_score = min(5, clearness_score)
+        clearness_score = max(1, clearness_score)
+
+        confidence_score = 1
+        if "i " in answer_lower or "my " in answer_lower:
+            confidence_score += 1
+        if ownership_signals > 0:
+            confidence_score += 1
+        if filler_signals == 0 and word_count >= 25:
+            confidence_score += 1
+        if impact_signals > 0 or any(token in answer_lower for token in ["confident", "comfortable", "i would", "i can"]):
+            confidence_score += 1
+        if filler_signals >= 2:
+            confidence_score -= 1
+        if very_short_penalty:
+            confidence_score -= 1
+        confidence_score = max(1, min(5, confidence_score))
+
+        if accuracy_score >= 4:
+            strengths.append("The answer stays relevant to the question and includes believable supporting detail.")
+        if clearness_score >= 4:
+            strengths.append("The response is easy to follow and has a clear structure.")
+        if confidence_score >= 4:
+            strengths.append("The delivery sounds direct and professional without too much hedging.")
+        if impact_signals > 0:
+            strengths.append("The answer includes outcome-oriented language that strengthens credibility.")
+
+        if accuracy_score <= 3:
+            suggestions.append("Tie the answer more directly to the question and add one concrete example.")
+        if clearness_score <= 3:
+            suggestions.append("Use a tighter STAR-style structure so the answer is easier to follow.")
+        if confidence_score <= 3:
+            suggestions.append("Use more direct language and reduce hesitant phrases unless uncertainty is necessary.")
+        if impact_signals == 0:
+            suggestions.append("Add a measurable result or outcome to make the answer more convincing.")
+
+        weighted = accuracy_score * 0.5 + clearness_score * 0.3 + confidence_score * 0.2
+        overall_score = round((weighted / 5.0) * 100, 2)
+
+        if overall_score >= 80:
+            summary = "This answer is strong overall: it addresses the question clearly and sounds credible."
+        elif overall_score >= 60:
+            summary = "This answer is reasonably solid, but it would benefit from more specificity or sharper structure."
+        elif overall_score >= 40:
+            summary = "This answer shows the right direction, but it needs clearer structure and stronger supporting detail."
+        else:
+            summary = "This answer needs more development to feel complete, clear, and convincing."
+
+        return {
+            "summary": summary,
+            "strengths": strengths[:3] or ["The answer is relevant to the interview topic."],
+            "suggestions": suggestions[:3] or ["Add a little more detail and a concrete outcome."],
+            "metrics": {
+                "accuracy": {
+                    "score": accuracy_score,
+                    "label": self._score_label(accuracy_score),
+                    "reason": "Based on how directly the answer addressed the prompt and whether it included consistent supporting detail.",
+                },
+                "clearness": {
+                    "score": clearness_score,
+                    "label": self._score_label(clearness_score),
+                    "reason": "Based on structure, conciseness, and how easy the response was to follow.",
+                },
+                "confidence": {
+                    "score": confidence_score,
+                    "label": self._score_label(confidence_score),
+                    "reason": "Based on direct ownership language, reduced hedging, and professional tone.",
+                },
+            },
+            "overall_score": round((weighted / 5.0) * 100, 2),
+            "evaluator": {
+                "provider": "heuristic",
+                "method": "rule_based",
+            },
+        }
+
+
+def _helper():
+    helper = AIHelper.__new__(AIHelper)
+    helper.model = None
+    helper.model_name = None
+    helper.bypass_cache = False
+    return helper
+
+
+QUESTIONS = [
+    "Tell me about a time you handled a tight deadline on a team project.",
+    "How would you debug a slow database query in a production system?",
+    "Describe a challenge where the API performance regressed. What was the situation?",
+    "Why do you want this role?",
+    "",
+]
+PHRASES = [
+    "I led", "I built", "i resolved", "my team", "First,", "then", "finally", "because", "so that",
+    "which led to", "for example", "specifically", "maybe", "I guess", "kind of", "sort of", "probably",
+    "I think", "improved", "reduced latency by 30%", "delivered", "the root cause", "query", "cache",
+    "tests", "tradeoff", "situation", "task", "action", "result", "I would", "I can", "confident",
+    "comfortable", "deadline", "project", "database", "system", "api", "performance", "İstanbul",
+    "debugging", "a", "the", "and", "we", "shipped", ".", "!", "?", ",",
+]
+
+
+def _random_answer(rng):
+    return " ".join(rng.choice(PHRASES) for _ in range(rng.randint(0, 120)))
+
+
+def test_heuristic_feedback_matches_legacy_implementation():
+    rng = random.Random(11)
+    legacy = LegacyHeuristic()
+    helper = _helper()
+    for _ in range(400):
+        question = rng.choice(QUESTIONS)
+        answer = _random_answer(rng)
+        assert helper._heuristic_feedback(question, answer, "SWE", "Acme") == \
+            legacy._heuristic_feedback(question, answer, "SWE", "Acme"), answer
+
+
+def test_heuristic_feedback_many_matches_single_calls_in_order():
+    rng = random.Random(5)
+    helper = _helper()
+    pairs = [(rng.choice(QUESTIONS), _random_answer(rng)) for _ in range(50)]
+
+    batched = helper.heuristic_feedback_many(pairs, "SWE", "Acme")
+
+    assert batched == [helper._heuristic_feedback(q, a, "SWE", "Acme") for q, a in pairs]
+    assert helper.heuristic_feedback_many([]) == []
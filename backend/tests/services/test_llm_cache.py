@@ -0,0 +1,91 @@
+"""
+Tests for the SQLite-backed LLM response cache and its AIHelper call sites.
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+from backend.app.services import ai_helper as ai_helper_module
+from backend.app.services.ai_helper import AIHelper
+from backend.app.services.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = LLMResponseCache(path=str(tmp_path / "llm_cache.db"))
+    monkeypatch.setattr(ai_helper_module, "llm_cache", cache)
+    return cache
+
+
+class CountingModel:
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(text=self.text)
+
+
+def _helper(model, bypass_cache=False):
+    helper = AIHelper.__new__(AIHelper)
+    helper.model = model
+    helper.model_name = "models/stub"
+    helper.bypass_cache = bypass_cache
+    return helper
+
+
+def test_key_ignores_whitespace_but_not_model_or_version():
+    key = LLMResponseCache.make_key("m", "t", 1, {"text": "hello   world\n"})
+    assert key == LLMResponseCache.make_key("m", "t", 1, {"text": " hello world"})
+    assert key != LLMResponseCache.make_key("m2", "t", 1, {"text": "hello world"})
+    assert key != LLMResponseCache.make_key("m", "t", 2, {"text": "hello world"})
+
+
+def test_hit_miss_and_age_eviction(cache):
+    cache.put("k1", "m", "t", "value")
+    assert cache.get("k1") == "value"
+    assert cache.get("missing") is None
+    cache.max_age_seconds = -1
+    assert cache.get("k1") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_size_eviction_drops_least_recently_used(cache):
+    cache.max_entries = 2
+    cache.put("a", "m", "t", "1")
+    cache.put("b", "m", "t", "2")
+    cache.get("a")
+    cache.put("c", "m", "t", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_extract_fields_reuses_cached_response(cache):
+    model = CountingModel(json.dumps({"name": "Ada", "skills": ["python"]}))
+    first = _helper(model).extractResumeFields("Ada Lovelace\nPython")
+    second = _helper(model).extractResumeFields("Ada  Lovelace\nPython ")
+    assert first == second
+    assert model.calls == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_bypass_flag_reprompts(cache):
+    model = CountingModel(json.dumps([{"prompt": "Why us?", "tags": ["strategy"]}] * 3))
+    _helper(model).generateInterviewQuestions("SWE", "Acme", 3)
+    _helper(model, bypass_cache=True).generateInterviewQuestions("SWE", "Acme", 3)
+    _helper(model).generateInterviewQuestions("swe", "ACME", 3)
+    assert model.calls == 2
+    assert cache.stats()["bypassed"] == 1
+
+
+def test_invalid_responses_are_not_cached(cache):
+    model = CountingModel("not json")
+    _helper(model).generateInterviewFeedback("Q?", "An answer.")
+    _helper(model).generateInterviewFeedback("Q?", "An answer.")
+    assert model.calls == 2
+    assert cache.stats()["writes"] == 0
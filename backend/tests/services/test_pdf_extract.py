@@ -0,0 +1,65 @@
+"""
+Tests for budgeted, page-parallel PDF extraction in AIHelper.
+"""
+import fitz
+import pytest
+from backend.app.services.ai_helper import AIHelper
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for page_no in range(12):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_no} experience skills education")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _legacy_text(path):
+    doc = fitz.open(path)
+    text = ""
+    for page in doc:
+        text += page.get_text()
+    return text
+
+
+def _helper():
+    return AIHelper.__new__(AIHelper)
+
+
+def test_serial_extraction_matches_legacy_and_reports_timings(pdf_path):
+    text, stats = _helper()._extract_pdf(pdf_path, max_pages=100, max_chars=10**6, parallel_threshold=10**6)
+    assert text == _legacy_text(pdf_path)
+    assert stats["page_count"] == 12
+    assert stats["pages_read"] == 12
+    assert len(stats["page_timings_ms"]) == 12
+    assert stats["parallel"] is False
+    assert stats["truncated"] is False
+
+
+def test_page_and_char_budgets_truncate(pdf_path):
+    text, stats = _helper()._extract_pdf(pdf_path, max_pages=3, max_chars=10**6, parallel_threshold=10**6)
+    assert stats["pages_read"] == 3
+    assert stats["truncated"] is True
+    assert "Page 3" not in text
+
+    text, stats = _helper()._extract_pdf(pdf_path, max_pages=100, max_chars=50, parallel_threshold=10**6)
+    assert len(text) == 50
+    assert stats["truncated"] is True
+
+
+def test_parallel_extraction_matches_serial(pdf_path):
+    text, stats = _helper()._extract_pdf(
+        pdf_path, max_pages=100, max_chars=10**6, parallel_threshold=4, workers=2
+    )
+    assert stats["parallel"] is True
+    assert text == _legacy_text(pdf_path)
+
+
+def test_parse_resume_reports_extraction_stats(pdf_path):
+    parsed = _helper().parseResume(pdf_path)
+    assert parsed["extraction"]["pages_read"] == 12
+    assert "Page 0" in parsed["sections"][0]["content"]
@@ -0,0 +1,114 @@
+"""
+Parity tests for the compiled rubric engine used by AIHelper.scoreResume.
+The reference functions below are the per-term scans scoreResume used before.
+"""
+import random
+
+import pytest
+from backend.app.services.ai_helper import AIHelper
+from backend.app.services.rubric import RESUME_RUBRIC, Rubric, count_digits
+
+ACTION_VERBS = [
+    "built", "led", "created", "implemented", "designed", "developed", "launched",
+    "optimized", "analyzed", "managed", "delivered", "improved", "automated",
+]
+
+
+def reference_scan(text):
+    lowered = text.lower()
+    return {
+        "has_email": "@" in text,
+        "has_skills_section": "skill" in lowered or "skills" in lowered,
+        "has_experience_section": "experience" in lowered or "work experience" in lowered,
+        "has_education_section": "education" in lowered,
+        "has_project_section": "project" in lowered or "projects" in lowered,
+        "has_summary_section": "summary" in lowered or "profile" in lowered,
+        "has_links": "linkedin.com" in lowered or "github.com" in lowered or "portfolio" in lowered,
+        "has_metrics": any(
+            token in lowered
+            for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "delivered", "$"]
+        ),
+        "has_action_verbs": any(token in lowered for token in ACTION_VERBS),
+        "has_dates": any(month in lowered for month in [
+            "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"
+        ]) or "202" in text or "201" in text,
+        "has_outcome": "result" in lowered or "outcome" in lowered,
+        "filler_phrases": sum(
+            1 for phrase in ["responsible for", "worked on", "helped with", "various tasks", "team player"]
+            if phrase in lowered
+        ),
+        "action_verb_hits": sum(lowered.count(token) for token in ACTION_VERBS),
+        "metric_hits": sum(
+            lowered.count(token)
+            for token in ["%", "percent", "improved", "reduced", "increased", "saved", "grew", "$", "kpi"]
+        ),
+    }
+
+
+FRAGMENTS = [
+    "Led", "skilled", "scheduled", "Projects", "work experience", "worked  on", "worked on",
+    "responsible\nfor", "responsible for", "35%", "$2M", "KPI", "2019-2024", "İstanbul", "Jan",
+    "github.com/me", "a@b.co", "improved", "delivered", "outcome:", "results", "team player",
+    "•", "-", "\t", "\n", "  ", "²", "١٢٣", "percentage", "grew", "reduced", "various tasks",
+]
+
+
+def _random_text(rng):
+    return "".join(
+        rng.choice(FRAGMENTS) + rng.choice([" ", "", "\n", ", "]) for _ in range(rng.randint(0, 80))
+    )
+
+
+def test_resume_rubric_matches_reference_scans():
+    rng = random.Random(7)
+    for _ in range(400):
+        text = _random_text(rng)
+        assert RESUME_RUBRIC.scan(text.lower()) == reference_scan(text), text
+
+
+def test_rubric_counts_match_str_count_and_prunes_redundant_terms():
+    rubric = Rubric(
+        any_of={"has_a": ("aa", "a"), "has_phrase": ("b b",)},
+        total_of={"a_hits": ("aa", "a"), "led_hits": ("led",)},
+        present_of={"distinct": ("a", "b b", "%")},
+    )
+    assert rubric.any_of["has_a"] == ("a",)
+    rng = random.Random(3)
+    for _ in range(300):
+        text = "".join(rng.choice("ab %led\n") for _ in range(rng.randint(0, 40)))
+        assert rubric.scan(text) == {
+            "has_a": "a" in text,
+            "has_phrase": "b b" in text,
+            "a_hits": text.count("aa") + text.count("a"),
+            "led_hits": text.count("led"),
+            "distinct": sum(1 for term in ("a", "b b", "%") if term in text),
+        }, text
+
+
+@pytest.mark.parametrize("text", ["", "call 555-123-4567", "٣٤٥ and ² and 12", "• 2021 – ①"])
+def test_count_digits_matches_isdigit(text):
+    assert count_digits(text) == sum(ch.isdigit() for ch in text)
+
+
+def test_score_resume_output_is_stable():
+    text = "\n".join([
+        "Jane Doe | jane@example.com | 555 123 4567 | linkedin.com/in/jane",
+        "Summary: backend engineer",
+        "Experience",
+        "- Built a billing service that reduced costs by 20%",
+        "- Led a team of 4 and improved deploy time",
+        "- Automated reporting, saving $40k per year",
+        "Skills: Python, SQL",
+        "Education: BSc 2019",
+        "Projects: responsible for data pipeline",
+    ])
+    helper = AIHelper.__new__(AIHelper)
+    result = helper.scoreResume({"sections": [{"name": "full_content", "content": text}]})
+
+    assert result["score"] == 87
+    assert result["details"]["action_verb_hits"] == 4
+    assert result["details"]["metric_hits"] == 4
+    assert result["details"]["filler_phrase_hits"] == 1
+    assert all(result["details"]["checks"][name] for name in (
+        "has_email", "has_phone", "has_links", "has_metrics", "has_dates", "has_bullets",
+    ))
@@ -0,0 +1,155 @@
+"""
+Tests for the pooled SQLite connections handed out by db.get_db.
+"""
+import json
+import os
+import tempfile
+
+import pytest
+
+from backend.app import create_app, db as db_module
+from backend.app.db import ConnectionPool, get_db
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = ConnectionPool(max_idle=4)
+    monkeypatch.setattr(db_module, "pool", pool)
+    yield pool
+    pool.clear()
+
+
+@pytest.fixture
+def app(pool, monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
+    with app.app_context():
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    pool.clear()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(path + suffix)
+        except Exception:
+            pass
+
+
+def _auth_headers(client, email="pool@test.com"):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def test_connection_is_reused_across_app_contexts(app, pool):
+    before = pool.stats()
+    with app.app_context():
+        first = get_db()
+    with app.app_context():
+        second = get_db()
+        assert pool.stats()["in_use"] == 1
+
+    assert second is first
+    stats = pool.stats()
+    assert stats["created"] == before["created"]
+    assert stats["reused"] == before["reused"] + 2
+    assert stats["in_use"] == 0 and stats["idle"] == before["idle"]
+
+
+def test_pragma_profile_is_applied(app):
+    with app.app_context():
+        conn = get_db()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == app.config["DB_BUSY_TIMEOUT_MS"]
+
+
+def test_foreign_keys_are_opt_in(app):
+    app.config["DB_FOREIGN_KEYS"] = True
+    with app.app_context():
+        assert get_db().execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_uncommitted_work_is_rolled_back_on_checkin(app):
+    with app.app_context():
+        get_db().execute("INSERT INTO users (email, password_hash, name) VALUES ('x@test.com', 'h', 'X')")
+    with app.app_context():
+        assert get_db().execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0
+
+
+def test_connection_closed_by_caller_is_discarded(app, pool):
+    with app.app_context():
+        get_db().close()
+    with app.app_context():
+        assert get_db().execute("SELECT 1").fetchone()[0] == 1
+
+    assert pool.stats()["discarded"] == 1
+
+
+def test_idle_connections_are_capped(app, pool):
+    pool.configure(max_idle=1)
+    outer = app.app_context()
+    outer.push()
+    get_db()
+    with app.app_context():
+        get_db()
+    outer.pop()
+
+    assert pool.stats()["idle"] == 1
+    assert pool.stats()["max_in_use"] >= 2
+
+
+def test_pool_can_be_disabled(app, pool):
+    app.config["DB_POOL_ENABLED"] = False
+    with app.app_context():
+        conn = get_db()
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+    before = pool.stats()
+    with app.app_context():
+        assert get_db() is not conn
+    assert pool.stats()["created"] == before["created"]
+
+
+def test_account_with_interviews_deletes_under_foreign_keys(app):
+    app.config["DB_FOREIGN_KEYS"] = True
+    client = app.test_client()
+    headers = _auth_headers(client)
+    with app.app_context():
+        conn = get_db()
+        user_id = conn.execute("SELECT id FROM users WHERE email = 'pool@test.com'").fetchone()["id"]
+        interview_id = conn.execute(
+            "INSERT INTO interviews (user_id, role, company) VALUES (?, 'SWE', 'Acme')", (user_id,)
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO answers (interview_id, qid, prompt, answer) VALUES (?, 'q1', 'Why?', 'Because')",
+            (interview_id,),
+        )
+        conn.execute(
+            "INSERT INTO job_applications (user_id, company_name, applied_date) VALUES (?, 'Acme', '2026-01-02')",
+            (user_id,),
+        )
+        conn.commit()
+
+    rv = client.delete("/api/v1/auth/account", headers=headers)
+
+    assert rv.status_code == 200
+    with app.app_context():
+        conn = get_db()
+        assert conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0] == 0
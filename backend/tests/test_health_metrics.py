@@ -0,0 +1,38 @@
+"""
+Tests for the /health/metrics switch.
+"""
+import os
+import tempfile
+
+import pytest
+
+from backend.app import create_app
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.unlink(path)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    yield app
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(path + suffix)
+        except Exception:
+            pass
+
+
+def test_metrics_are_hidden_by_default(app):
+    client = app.test_client()
+    assert client.get("/health").status_code == 200
+    assert client.get("/health/metrics").status_code == 404
+
+
+def test_metrics_when_enabled(app):
+    app.config["HEALTH_METRICS_ENABLED"] = True
+    rv = app.test_client().get("/health/metrics")
+    assert rv.status_code == 200
+    assert {"db_pool", "ai_client", "llm_cache"} <= set(rv.get_json())
@@ -0,0 +1,148 @@
+"""
+Tests for the numbered schema migrations and the start-up version check.
+"""
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from backend.app import create_app, migrations
+from backend.app.db import get_db, init_db
+
+# The tables as they were before any migration existed
+LEGACY_SCHEMA = """
+CREATE TABLE users (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  email TEXT UNIQUE NOT NULL,
+  password_hash TEXT NOT NULL,
+  name TEXT
+);
+CREATE TABLE resumes (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  user_id INTEGER NOT NULL,
+  file_path TEXT NOT NULL,
+  parsed_json TEXT,
+  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE interviews (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  role TEXT NOT NULL,
+  company TEXT NOT NULL,
+  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE feedback_reports (id INTEGER PRIMARY KEY, resume_id INTEGER NOT NULL, score INTEGER,
+  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP);
+CREATE TABLE keyword_analyses (id INTEGER PRIMARY KEY, resume_id INTEGER NOT NULL, match_score REAL,
+  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP);
+CREATE TABLE answers (id INTEGER PRIMARY KEY, interview_id INTEGER NOT NULL, qid TEXT NOT NULL);
+CREATE TABLE user_badges (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, badge_key TEXT NOT NULL,
+  earned_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP);
+CREATE TABLE interview_sessions (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL);
+CREATE TABLE interview_answers (id INTEGER PRIMARY KEY, session_id INTEGER NOT NULL);
+INSERT INTO users (email, password_hash, name) VALUES ('old@test.com', 'x', 'Old User');
+"""
+
+
+@pytest.fixture
+def db_path(monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    yield path
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(path + suffix)
+        except Exception:
+            pass
+
+
+def _legacy_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.close()
+
+
+def _columns(conn, table):
+    return migrations.column_names(conn, table)
+
+
+def test_create_app_upgrades_a_legacy_database(db_path):
+    _legacy_db(db_path)
+    app = create_app()
+
+    with app.app_context():
+        conn = get_db()
+        assert migrations.current_version(conn) == migrations.latest_version()
+        assert {"user_id", "submitted_at", "questions_json"} <= _columns(conn, "interviews")
+        assert "content_hash" in _columns(conn, "resumes")
+        assert "last_diff_json" in _columns(conn, "job_catalog")
+        assert conn.execute("SELECT email FROM users").fetchone()[0] == "old@test.com"
+        assert migrations.upgrade(conn) == []
+
+
+def test_fresh_database_is_stamped_not_migrated(db_path):
+    os.unlink(db_path)
+    app = create_app()
+
+    with app.app_context():
+        conn = get_db()
+        versions = [row[0] for row in conn.execute("SELECT version FROM schema_version ORDER BY version")]
+        assert versions == [migration.version for migration in migrations.load_migrations()]
+        assert conn.execute("SELECT COUNT(*) FROM resources").fetchone()[0] > 0
+
+
+def test_current_database_costs_one_statement(db_path):
+    app = create_app()
+    with app.app_context():
+        conn = get_db()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            assert migrations.is_current(conn)
+        finally:
+            conn.set_trace_callback(None)
+
+    assert statements == ["SELECT MAX(version) FROM schema_version"]
+
+
+def test_failed_migration_is_rolled_back(db_path, monkeypatch):
+    _legacy_db(db_path)
+
+    def broken(conn):
+        conn.execute("ALTER TABLE resumes ADD COLUMN half_done TEXT")
+        raise RuntimeError("boom")
+
+    real = migrations.load_migrations()
+    monkeypatch.setattr(migrations, "_migrations", real[:2] + [real[2]._replace(upgrade=broken)] + real[3:])
+    conn = sqlite3.connect(db_path)
+    with pytest.raises(RuntimeError):
+        migrations.upgrade(conn)
+
+    assert migrations.current_version(conn) == 2
+    assert "half_done" not in _columns(conn, "resumes")
+    conn.close()
+
+
+def test_db_upgrade_command(db_path):
+    app = create_app()
+    with app.app_context():
+        init_db()
+        get_db().execute("DELETE FROM schema_version WHERE version > 3")
+        get_db().commit()
+
+    result = app.test_cli_runner().invoke(args=["db-upgrade"])
+
+    assert result.exit_code == 0, result.output
+    assert "Applied 0004_resume_chunk_embeddings." in result.output
+    assert f"at version {migrations.latest_version()}" in result.output
+
+
+def test_versions_must_be_contiguous(monkeypatch):
+    monkeypatch.setattr(migrations, "_migrations", None)
+    monkeypatch.setattr(migrations.os, "listdir", lambda path: ["0001_a.py", "0003_c.py"])
+    monkeypatch.setattr(
+        migrations.importlib, "import_module", lambda name: type("M", (), {"upgrade": staticmethod(lambda c: None)})
+    )
+    with pytest.raises(RuntimeError):
+        migrations.load_migrations()
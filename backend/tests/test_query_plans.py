@@ -0,0 +1,183 @@
+"""
+Query-plan regression tests: every statement the DAOs and routes issue for a
+seeded user must be answered through an index, never a full table SCAN.
+
+Statements are captured with a trace callback on each pooled connection while
+the main read and delete paths run, then replayed under EXPLAIN QUERY PLAN.
+"""
+import json
+import os
+import re
+import sqlite3
+import tempfile
+
+import pytest
+
+from backend.app import create_app, db as db_module
+from backend.app.db import ConnectionPool, get_db
+from backend.app.features.keywords.service import ChunkEmbeddingDAO
+from backend.app.features.resume_jobs.service import ResumeJobDAO, find_reusable_resume
+
+# Tables small and static enough that scanning them is the right plan
+SCAN_ALLOWED = {"resources", "sqlite_master", "schema_version"}
+_FULL_SCAN_RE = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    captured = []
+    connect = db_module._connect
+
+    def traced(path, profile=None):
+        conn = connect(path, profile)
+        conn.set_trace_callback(captured.append)
+        return conn
+
+    pool = ConnectionPool()
+    monkeypatch.setattr(db_module, "pool", pool)
+    monkeypatch.setattr(db_module, "_connect", traced)
+    yield captured
+    pool.clear()
+
+
+@pytest.fixture
+def app(statements, monkeypatch):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    monkeypatch.setenv("DATABASE_PATH", path)
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["DATABASE"] = path
+    schema_path = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
+    with app.app_context():
+        conn = get_db()
+        with open(schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+    yield app
+    db_module.pool.clear()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(path + suffix)
+        except Exception:
+            pass
+
+
+def _auth_headers(client, email):
+    client.post(
+        "/api/v1/auth/register",
+        data=json.dumps({"email": email, "password": "testpass123", "name": "Test User"}),
+        content_type="application/json",
+    )
+    rv = client.post(
+        "/api/v1/auth/login",
+        data=json.dumps({"email": email, "password": "testpass123"}),
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {json.loads(rv.data)['accessToken']}"}
+
+
+def _seed(conn, user_id, resumes=20):
+    resume_ids = []
+    for n in range(resumes):
+        resume_id = conn.execute(
+            "INSERT INTO resumes (user_id, file_path, parsed_json, content_hash) VALUES (?, ?, ?, ?)",
+            (user_id, f"/tmp/missing-{user_id}-{n}.pdf", json.dumps({"sections": []}), f"hash-{user_id}-{n}"),
+        ).lastrowid
+        resume_ids.append(resume_id)
+        for score in (40, 60):
+            conn.execute(
+                "INSERT INTO feedback_reports (resume_id, score, summary, details_json) VALUES (?, ?, 'ok', '{}')",
+                (resume_id, score),
+            )
+        conn.execute(
+            "INSERT INTO keyword_analyses (resume_id, job_text, match_score, missing_keywords_json) "
+            "VALUES (?, 'job', 50, '[]')",
+            (resume_id,),
+        )
+    for n in range(5):
+        interview_id = conn.execute(
+            "INSERT INTO interviews (user_id, role, company, questions_json) VALUES (?, 'SWE', 'Acme', '[]')",
+            (user_id,),
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO answers (interview_id, qid, prompt, answer) VALUES (?, 'q1', 'Why?', 'Because')",
+            (interview_id,),
+        )
+        session_id = conn.execute(
+            "INSERT INTO interview_sessions (user_id) VALUES (?)", (user_id,)
+        ).lastrowid
+        question_id = conn.execute("INSERT INTO interview_questions (text) VALUES ('Why?')").lastrowid
+        conn.execute(
+            "INSERT INTO interview_answers (session_id, question_id, answer_text, score) VALUES (?, ?, 'a', 3)",
+            (session_id, question_id),
+        )
+        conn.execute(
+            "INSERT INTO job_applications (user_id, company_name, applied_date) VALUES (?, 'Acme', ?)",
+            (user_id, f"2026-01-{n + 1:02d}"),
+        )
+    conn.execute("INSERT INTO user_badges (user_id, badge_key) VALUES (?, 'first_resume')", (user_id,))
+    conn.commit()
+    return resume_ids, interview_id
+
+
+def _full_scans(conn, statement):
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+    return [
+        row[3] for row in plan
+        if (match := _FULL_SCAN_RE.match(row[3])) and match.group(1) not in SCAN_ALLOWED
+    ]
+
+
+def test_hot_paths_use_indexes(app, statements):
+    client = app.test_client()
+    headers = _auth_headers(client, "plans@test.com")
+    other_headers = _auth_headers(client, "other@test.com")
+    with app.app_context():
+        conn = get_db()
+        users = dict(conn.execute("SELECT email, id FROM users").fetchall())
+        for email in ("plans@test.com", "other@test.com"):
+            resume_ids, interview_id = _seed(conn, users[email])
+        user_id = users["other@test.com"]
+        job_id = ResumeJobDAO(conn).create(user_id, "/tmp/missing.pdf", "cv.pdf")
+        conn.commit()
+
+    statements.clear()
+    for path in (
+        "/api/resume",
+        f"/api/resume/{resume_ids[3]}",
+        f"/api/resume/jobs/{job_id}",
+        "/api/v1/applications/",
+        "/api/v1/mock-interview/sessions",
+        f"/api/v1/mock-interview/sessions/{interview_id}",
+        "/api/v1/dashboard/summary",
+        "/api/v1/progress/me",
+        "/api/v1/auth/profile",
+        "/api/v1/auth/account/export",
+    ):
+        assert client.get(path, headers=other_headers).status_code < 500, path
+    with app.app_context():
+        conn = get_db()
+        find_reusable_resume(conn, user_id, "hash-1-1")
+        ChunkEmbeddingDAO(conn).delete_for_user(user_id)
+        conn.rollback()
+    assert client.delete(f"/api/resume/{resume_ids[0]}", headers=other_headers).status_code == 200
+    assert client.delete("/api/v1/auth/account", headers=other_headers).status_code == 200
+    assert client.get("/api/resume", headers=headers).status_code == 200
+
+    checked = set()
+    failures = {}
+    with sqlite3.connect(app.config["DATABASE"]) as conn:
+        for statement in statements:
+            statement = statement.strip()
+            if not re.match(r"(SELECT|UPDATE|DELETE|WITH)\b", statement, re.IGNORECASE):
+                continue
+            if statement in checked:
+                continue
+            checked.add(statement)
+            scans = _full_scans(conn, statement)
+            if scans:
+                failures[" ".join(statement.split())] = scans
+
+    assert len(checked) > 20
+    assert failures == {}
@@ -130,6 +130,11 @@ export const api = {
       method: 'POST',
       body: JSON.stringify(data),
     }),
+  matchKeywordsBatch: (data) =>
+    request('/api/keywords/match/batch', {
+      method: 'POST',
+      body: JSON.stringify(data),
+    }),
 
   getNewGradJobs: ({ limit = 40, category = 'all', search = '' } = {}) =>
     request(
@@ -137,6 +142,11 @@ export const api = {
     ),
   getJobDetails: (simplifyUrl) =>
     request(`/api/keywords/jobs/details?simplify_url=${encodeURIComponent(simplifyUrl)}`),
+  getJobDetailsBatch: (simplifyUrls) =>
+    request('/api/keywords/jobs/details/batch', {
+      method: 'POST',
+      body: JSON.stringify({ simplify_urls: simplifyUrls }),
+    }),
 
   getInterviewSession: (sessionId) =>
     request(`/api/v1/mock-interview/sessions/${sessionId}`),